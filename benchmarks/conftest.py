@@ -0,0 +1,69 @@
+import json
+import pathlib
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.geometry import Scale
+from compas_dem.models import BlockModel
+
+DATA = pathlib.Path(__file__).parent.parent / "data"
+
+
+def crossvault_meshes() -> list[Mesh]:
+    # the crossvault model was saved with element classes that no longer exist,
+    # but the block geometry is stored in the regular mesh format
+    with open(DATA / "crossvault.json") as f:
+        data = json.load(f)
+    return [Mesh.__from_data__(element["data"]["shape"]["data"]) for element in data["data"]["elements"]]
+
+
+def pavilionvault_meshes() -> tuple[list[Mesh], list[Mesh]]:
+    # scaled as in scripts/dem_vault_pavilion.py
+    blocks = compas.json_load(DATA / "pavillionvault" / "blocks.json")
+    supports = compas.json_load(DATA / "pavillionvault" / "supports.json")
+    scale = Scale.from_factors([20, 20, 20])
+    blocks = [part.transformed(scale) for mesh in blocks for part in mesh]
+    supports = [part.transformed(scale) for mesh in supports for part in mesh]
+    return blocks, supports
+
+
+def armadillo_mesh() -> Mesh:
+    # the armadillo was saved with COMPAS 0.19
+    with open(DATA / "armadillo.json") as f:
+        data = json.load(f)["data"]
+    vertices = {int(key): [attr["x"], attr["y"], attr["z"]] for key, attr in data["vertex"].items()}
+    faces = list(data["face"].values())
+    keys = sorted(vertices)
+    index = {key: i for i, key in enumerate(keys)}
+    return Mesh.from_vertices_and_faces([vertices[key] for key in keys], [[index[key] for key in face] for face in faces])
+
+
+def model_from_meshes(blocks: list[Mesh], supports: list[Mesh] = ()) -> BlockModel:
+    model = BlockModel()
+    for mesh in blocks:
+        model.add_block_from_mesh(mesh)
+    for mesh in supports:
+        model.add_support_from_mesh(mesh)
+    return model
+
+
+@pytest.fixture(name="model_from_meshes", scope="session")
+def model_from_meshes_fixture():
+    return model_from_meshes
+
+
+@pytest.fixture(scope="session")
+def crossvault():
+    return crossvault_meshes()
+
+
+@pytest.fixture(scope="session")
+def pavilionvault():
+    return pavilionvault_meshes()
+
+
+@pytest.fixture(scope="session")
+def armadillo():
+    return armadillo_mesh()
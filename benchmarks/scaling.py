@@ -0,0 +1,164 @@
+"""Measure how the stages of the block model pipeline scale with the number of blocks.
+
+Every stage is run on synthetic templates of increasing size,
+once to measure the time and once under ``tracemalloc`` to measure the peak memory.
+The empirical complexity of a stage is the slope of the log-log fit of time or memory versus the number of blocks.
+
+Usage
+-----
+python benchmarks/scaling.py --kinds stack wall arch vault --sizes 100 1000 10000 --json scaling.json
+
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Callable
+from typing import Optional
+
+import numpy as np
+
+from compas_dem.material import Stone
+from compas_dem.models import BlockModel
+from compas_dem.problem import Problem
+from compas_dem.templates import SYNTHETIC_KINDS
+from compas_dem.templates import synthetic_template
+
+
+def with_material(model: BlockModel) -> BlockModel:
+    stone = Stone(fc=30e6, density=2400)
+    model.add_material(stone)
+    model.assign_material(stone, elements=list(model.elements()))
+    return model
+
+
+def model_without_contacts(template) -> BlockModel:
+    model = BlockModel()
+    for mesh in template.blocks():
+        model.add_block_from_mesh(mesh)
+    return model
+
+
+def problem_with_gravity(model: BlockModel) -> Problem:
+    problem = Problem(model)
+    problem.add_gravity()
+    return problem
+
+
+def cra_assembly(model: BlockModel):
+    from compas_dem.analysis.cra import _blockmodel_to_assembly
+
+    return _blockmodel_to_assembly(model)
+
+
+# every stage is defined by a name, a function computing the arguments of the stage from the state,
+# the function that is measured, and the name under which the result is stored in the state
+STAGES: list[tuple[str, Callable[[dict], tuple], Callable, Optional[str]]] = [
+    ("Template.blocks_numpy", lambda state: (state["template"],), lambda template: template.blocks_numpy(), None),
+    ("Template.interfaces_numpy", lambda state: (state["template"],), lambda template: template.interfaces_numpy(), None),
+    ("Template.blocks", lambda state: (state["template"],), lambda template: template.blocks(), None),
+    ("BlockModel.from_template", lambda state: (state["template"],), BlockModel.from_template, "model"),
+    ("BlockModel.compute_contacts", lambda state: (model_without_contacts(state["template"]),), lambda model: model.compute_contacts(), None),
+    ("Problem.__init__", lambda state: (with_material(state["model"]),), problem_with_gravity, "problem"),
+    ("Problem.centroidal_loads", lambda state: (state["problem"],), lambda problem: problem.centroidal_loads, None),
+    ("BlockModel.to_jsonstring", lambda state: (state["model"],), lambda model: model.to_jsonstring(), "json"),
+    ("BlockModel.from_jsonstring", lambda state: (state["json"],), BlockModel.from_jsonstring, None),
+    ("cra._blockmodel_to_assembly", lambda state: (state["model"],), cra_assembly, None),
+]
+
+
+def measure(function: Callable, args: tuple, memory: bool) -> tuple[object, float, Optional[float]]:
+    start = time.perf_counter()
+    result = function(*args)
+    duration = time.perf_counter() - start
+
+    if not memory:
+        return result, duration, None
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return result, duration, peak / 2**20
+
+
+def exponent(sizes: list[int], values: list[Optional[float]]) -> Optional[float]:
+    points = [(n, value) for n, value in zip(sizes, values) if value is not None and value > 0]
+    if len(points) < 2:
+        return None
+    x, y = np.log(np.array(points)).T
+    return float(np.polyfit(x, y, 1)[0])
+
+
+def run_kind(kind: str, sizes: list[int], memory: bool = True, max_search: int = 2000, verbose: bool = True) -> dict:
+    report: dict = {"blocks": [], "interfaces": [], "contacts": [], "stages": {}}
+
+    for size in sizes:
+        template, blocks, interfaces = synthetic_template(kind, size)
+        state = {"template": template}
+        report["blocks"].append(blocks)
+        report["interfaces"].append(interfaces)
+
+        for name, setup, function, key in STAGES:
+            stage = report["stages"].setdefault(name, {"time": [], "memory": []})
+
+            if name == "BlockModel.compute_contacts" and blocks > max_search:
+                result, duration, peak = None, None, None
+            else:
+                try:
+                    args = setup(state)
+                    result, duration, peak = measure(function, args, memory)
+                except ImportError:
+                    result, duration, peak = None, None, None
+
+            stage["time"].append(duration)
+            stage["memory"].append(peak)
+            if key:
+                state[key] = result
+
+            if verbose and duration is not None:
+                memory_info = f"{peak:10.2f} MB" if peak is not None else ""
+                print(f"{kind:>6} {blocks:>8} {name:<30} {duration:10.4f} s {memory_info}")
+
+        report["contacts"].append(state["model"].graph.number_of_edges())
+        if report["contacts"][-1] != interfaces:
+            print(f"Warning: {kind} with {blocks} blocks has {report['contacts'][-1]} contacts instead of {interfaces}.")
+
+    for stage in report["stages"].values():
+        stage["time_exponent"] = exponent(report["blocks"], stage["time"])
+        stage["memory_exponent"] = exponent(report["blocks"], stage["memory"])
+
+    return report
+
+
+def print_summary(reports: dict) -> None:
+    print()
+    print(f"{'kind':>6} {'stage':<30} {'time ~ n^k':>10} {'memory ~ n^k':>12}")
+    for kind, report in reports.items():
+        for name, stage in report["stages"].items():
+            k_time = "-" if stage["time_exponent"] is None else f"{stage['time_exponent']:.2f}"
+            k_memory = "-" if stage["memory_exponent"] is None else f"{stage['memory_exponent']:.2f}"
+            print(f"{kind:>6} {name:<30} {k_time:>10} {k_memory:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--kinds", nargs="+", default=list(SYNTHETIC_KINDS), choices=SYNTHETIC_KINDS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1000, 10000])
+    parser.add_argument("--max-search", type=int, default=2000, help="Skip compute_contacts for models with more blocks.")
+    parser.add_argument("--no-memory", action="store_true", help="Only measure time.")
+    parser.add_argument("--json", help="Write the results to this file.")
+    args = parser.parse_args()
+
+    reports = {kind: run_kind(kind, args.sizes, memory=not args.no_memory, max_search=args.max_search) for kind in args.kinds}
+    print_summary(reports)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"sizes": args.sizes, "kinds": reports}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
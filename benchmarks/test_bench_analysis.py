@@ -0,0 +1,52 @@
+import pytest
+
+from compas_dem.instrumentation import Tracer
+from compas_dem.material import Stone
+from compas_dem.models import BlockModel
+from compas_dem.problem import Problem
+from compas_dem.problem import Solver
+from compas_dem.templates import ArchTemplate
+from compas_dem.templates import BarrelVaultTemplate
+
+
+def problem_from_template(template) -> Problem:
+    model = BlockModel.from_template(template)
+    stone = Stone(fc=30e6, density=2400)
+    model.add_material(stone)
+    model.assign_material(stone, elements=list(model.elements()))
+    problem = Problem(model)
+    problem.add_gravity()
+    problem.add_supports_from_model()
+    problem.add_contact_model("MohrCoulomb", mu=0.6)
+    return problem
+
+
+@pytest.mark.parametrize(
+    "template",
+    [BarrelVaultTemplate(), BarrelVaultTemplate(vou_span=20, vou_length=20)],
+    ids=["barrel-9x6", "barrel-20x20"],
+)
+def test_cra_assembly(benchmark, template):
+    pytest.importorskip("compas_assembly")
+    pytest.importorskip("compas_cra")
+    from compas_dem.analysis.cra import _blockmodel_to_assembly
+
+    model = BlockModel.from_template(template)
+    benchmark(_blockmodel_to_assembly, model)
+
+
+def test_lmgc90_post_processing(benchmark):
+    pytest.importorskip("compas_lmgc90")
+
+    def setup():
+        return (problem_from_template(ArchTemplate(rise=3, span=10, thickness=0.5, depth=0.5, n=20)),), {}
+
+    def solve(problem):
+        tracer = Tracer()
+        problem.solve(Solver.LMGC90(duration=0.1, n_steps=10), tracer=tracer)
+        return tracer
+
+    # the post-processing cannot be separated from the solve,
+    # so the whole solve is timed and the post-processing is reported from the trace
+    tracer = benchmark.pedantic(solve, setup=setup, rounds=3)
+    benchmark.extra_info.update({name: duration for name, duration in tracer.durations().items()})
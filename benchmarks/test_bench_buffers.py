@@ -0,0 +1,22 @@
+import pytest
+
+from compas.colors import Color
+
+pytest.importorskip("pythreejs")
+
+from compas_dem.notebook.buffers import meshes_to_edgesbuffer  # noqa: E402
+from compas_dem.notebook.buffers import meshes_to_facesbuffer  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def meshes(crossvault, model_from_meshes):
+    model = model_from_meshes(crossvault)
+    return [block.modelgeometry for block in model.elements()]
+
+
+def test_facesbuffer(benchmark, meshes):
+    benchmark(meshes_to_facesbuffer, meshes, Color.grey())
+
+
+def test_edgesbuffer(benchmark, meshes):
+    benchmark(meshes_to_edgesbuffer, meshes, Color.black())
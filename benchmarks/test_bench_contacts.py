@@ -0,0 +1,46 @@
+import pytest
+
+from compas_dem.models import BlockModel
+from compas_dem.templates import BarrelVaultTemplate
+from compas_dem.templates import WallTemplate
+
+
+@pytest.fixture
+def run_compute_contacts(benchmark, model_from_meshes):
+    def run(blocks, supports=(), rounds=3, **kwargs):
+        def setup():
+            return (model_from_meshes(blocks, supports),), {}
+
+        def compute(model):
+            model.compute_contacts(**kwargs)
+            return model
+
+        model = benchmark.pedantic(compute, setup=setup, rounds=rounds)
+        benchmark.extra_info["blocks"] = model.graph.number_of_nodes()
+        benchmark.extra_info["edges"] = model.graph.number_of_edges()
+
+    return run
+
+
+def test_compute_contacts_crossvault(run_compute_contacts, crossvault):
+    run_compute_contacts(crossvault, tolerance=1e-3)
+
+
+def test_compute_contacts_pavilionvault(run_compute_contacts, pavilionvault):
+    blocks, supports = pavilionvault
+    run_compute_contacts(blocks, supports, rounds=1, tolerance=0.01)
+
+
+@pytest.mark.parametrize(
+    "template",
+    [BarrelVaultTemplate(), BarrelVaultTemplate(vou_span=20, vou_length=20), WallTemplate(courses=20, bricks=20)],
+    ids=["barrel-9x6", "barrel-20x20", "wall-20x20"],
+)
+def test_compute_contacts_template(run_compute_contacts, template):
+    run_compute_contacts(template.blocks(), tolerance=1e-6, minimum_area=1e-6)
+
+
+def test_from_triangulation_dual(benchmark, armadillo):
+    model = benchmark.pedantic(BlockModel.from_triangulation_dual, args=(armadillo,), rounds=3)
+    benchmark.extra_info["blocks"] = model.graph.number_of_nodes()
+    benchmark.extra_info["edges"] = model.graph.number_of_edges()
@@ -0,0 +1,26 @@
+import pytest
+
+from compas_dem.models import BlockModel
+from compas_dem.templates import BarrelVaultTemplate
+
+
+@pytest.fixture(scope="module")
+def models(crossvault, model_from_meshes):
+    crossvault = model_from_meshes(crossvault)
+    crossvault.compute_contacts(tolerance=1e-3)
+    return {
+        "crossvault": crossvault,
+        "barrel-20x20": BlockModel.from_template(BarrelVaultTemplate(vou_span=20, vou_length=20)),
+    }
+
+
+@pytest.mark.parametrize("name", ["crossvault", "barrel-20x20"])
+def test_to_jsonstring(benchmark, models, name):
+    string = benchmark(models[name].to_jsonstring)
+    benchmark.extra_info["size"] = len(string)
+
+
+@pytest.mark.parametrize("name", ["crossvault", "barrel-20x20"])
+def test_from_jsonstring(benchmark, models, name):
+    string = models[name].to_jsonstring()
+    benchmark(BlockModel.from_jsonstring, string)
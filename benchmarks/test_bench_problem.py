@@ -0,0 +1,37 @@
+import pytest
+
+from compas_dem.material import Stone
+from compas_dem.models import BlockModel
+from compas_dem.problem import Problem
+from compas_dem.templates import DomeTemplate
+
+
+def with_material(model: BlockModel) -> BlockModel:
+    stone = Stone(fc=30e6, density=2400)
+    model.add_material(stone)
+    model.assign_material(stone, elements=list(model.elements()))
+    return model
+
+
+@pytest.fixture(scope="module")
+def crossvault_model(crossvault, model_from_meshes):
+    return with_material(model_from_meshes(crossvault))
+
+
+@pytest.fixture(scope="module")
+def dome_model():
+    return with_material(BlockModel.from_template(DomeTemplate()))
+
+
+def test_problem_masses_crossvault(benchmark, crossvault_model):
+    benchmark(Problem, crossvault_model)
+
+
+def test_problem_masses_dome(benchmark, dome_model):
+    benchmark(Problem, dome_model)
+
+
+def test_centroidal_loads_dome(benchmark, dome_model):
+    problem = Problem(dome_model)
+    problem.add_gravity()
+    benchmark(lambda: problem.centroidal_loads)
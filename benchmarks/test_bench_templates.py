@@ -0,0 +1,52 @@
+import pytest
+
+from compas_dem.models import BlockModel
+from compas_dem.templates import ArchTemplate
+from compas_dem.templates import BarrelVaultTemplate
+from compas_dem.templates import DomeTemplate
+from compas_dem.templates import WallTemplate
+from compas_dem.templates import arch_sweep
+
+TEMPLATES = {
+    "arch-20": lambda: ArchTemplate(rise=3, span=10, thickness=0.5, depth=0.5, n=20),
+    "arch-2000": lambda: ArchTemplate(rise=3, span=10, thickness=0.5, depth=0.5, n=2000),
+    "barrel-9x6": lambda: BarrelVaultTemplate(),
+    "barrel-100x100": lambda: BarrelVaultTemplate(vou_span=100, vou_length=100),
+    "dome-40x20": lambda: DomeTemplate(),
+    "dome-200x100": lambda: DomeTemplate(meridians=200, hoops=100),
+    "wall-10x10": lambda: WallTemplate(),
+    "wall-english-100x100": lambda: WallTemplate(courses=100, bricks=100, bond="english"),
+}
+
+SMALL = ["arch-20", "barrel-9x6", "dome-40x20", "wall-10x10"]
+
+
+@pytest.mark.parametrize("name", TEMPLATES)
+def test_blocks_numpy(benchmark, name):
+    template = TEMPLATES[name]()
+    benchmark(template.blocks_numpy)
+
+
+@pytest.mark.parametrize("name", TEMPLATES)
+def test_interfaces_numpy(benchmark, name):
+    template = TEMPLATES[name]()
+    benchmark(template.interfaces_numpy)
+
+
+@pytest.mark.parametrize("name", SMALL)
+def test_blocks(benchmark, name):
+    template = TEMPLATES[name]()
+    benchmark(template.blocks)
+
+
+@pytest.mark.parametrize("name", SMALL)
+def test_from_template(benchmark, name):
+    template = TEMPLATES[name]()
+    model = benchmark(BlockModel.from_template, template)
+    benchmark.extra_info["blocks"] = model.graph.number_of_nodes()
+    benchmark.extra_info["edges"] = model.graph.number_of_edges()
+
+
+def test_arch_sweep(benchmark):
+    sweeps = benchmark(arch_sweep, rise=[2, 2.5, 3, 3.5], span=[8, 10, 12], thickness=[0.3, 0.4, 0.5], depth=0.5, n=[10, 20, 40])
+    benchmark.extra_info["arches"] = sum(len(sweep) for sweep in sweeps.values())
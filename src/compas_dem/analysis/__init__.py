@@ -14,10 +14,18 @@ try:
     except ImportError:
         pass
 
+    from compas_dem.analysis.executor import LMGC90Executor  # noqa: F401
+    from compas_dem.analysis.executor import SolveFuture  # noqa: F401
+
+    __all__.append("LMGC90Executor")
+    __all__.append("SolveFuture")
+
     try:
         from compas_dem.analysis.lmgc90 import lmgc90_solve  # noqa: F401
+        from compas_dem.analysis.lmgc90 import LMGC90Session  # noqa: F401
 
         __all__.append("lmgc90_solve")
+        __all__.append("LMGC90Session")
     except ImportError:
         pass
 
@@ -7,6 +7,8 @@ from compas_cra.equilibrium import cra_penalty_solve as _cra_penalty_solve
 from compas_cra.equilibrium import rbe_solve as _rbe_solve
 
 import compas.geometry as cg
+from compas_dem.instrumentation import Tracer
+from compas_dem.instrumentation import current_tracer
 from compas_dem.interactions import FrictionContact
 from compas_dem.models import BlockModel
 from compas_dem.problem import Problem
@@ -118,6 +120,7 @@ def cra_solve(
     eps: float = 0.001,
     verbose: bool = True,
     timer: bool = False,
+    tracer: Optional[Tracer] = None,
 ) -> None:
     """Solve a Problem using CRA and write results back to the BlockModel in-place.
 
@@ -142,18 +145,34 @@ def cra_solve(
         Print solver output.
     timer : bool, optional
         Print timing information.
+    tracer : :class:`compas_dem.instrumentation.Tracer`, optional
+        A tracer collecting the spans and counters of the solve.
+        If none is provided, the active tracer is used, if any.
     """
+    tracer = tracer or current_tracer()
+
+    assembly, mu, density = _prepare_cra(problem, mu=mu, tracer=tracer)
+    _run_cra(assembly, method=method, mu=mu, d_bnd=d_bnd, eps=eps, verbose=verbose, timer=timer, tracer=tracer)
+    with tracer.span("cra.post_processing"):
+        _post_processing_cra(assembly, problem, density=density)
+
+
+def _prepare_cra(problem: Problem, mu: Optional[float] = None, tracer: Optional[Tracer] = None) -> tuple[Assembly, float, float]:
+    """Convert a Problem to an assembly for CRA, see :func:`cra_solve`.
+
+    Returns
+    -------
+    tuple[:class:`compas_assembly.datastructures.Assembly`, float, float]
+        The assembly, the friction coefficient, and the density used to rescale the forces.
+    """
+    tracer = tracer or current_tracer()
+
     model = problem.model
 
     # Support flags from boundary conditions
-    for block in model.elements():
-        idx = block.graphnode
-        disp = problem.centroidal_displacements.get(idx)
-        if disp is not None:
-            t = disp["translation"] or [0.0, 0.0, 0.0]
-            r = disp["rotation"] or [0.0, 0.0, 0.0]
-            if all(v == 0.0 for v in t) and all(v == 0.0 for v in r):
-                block.is_support = True
+    for idx in problem.boundary_conditions.fixed_blocks().tolist():
+        if idx in problem._blocks:
+            problem._blocks[idx].is_support = True
 
     # Friction coefficient
     if mu is None:
@@ -170,21 +189,41 @@ def cra_solve(
         if density is not None:
             break
 
-    assembly = _blockmodel_to_assembly(model)
-
-    if method == "rbe":
-        _rbe_solve(assembly, mu=mu, density=1.0, verbose=verbose, timer=timer)
-    elif method == "cra":
-        _cra_penalty_solve(
-            assembly,
-            mu=mu,
-            density=1.0,
-            d_bnd=d_bnd,
-            eps=eps,
-            verbose=verbose,
-            timer=timer,
-        )
-    else:
-        raise ValueError(f"Unknown CRA method '{method}'. Use 'rbe' or 'penalty'.")
-
-    _post_processing_cra(assembly, problem, density=density)
+    with tracer.span("cra.assembly"):
+        assembly = _blockmodel_to_assembly(model)
+    contacts = [contact for edge in model.graph.edges() for contact in model.graph.edge_attribute(edge, "contacts") or []]  # type: ignore
+    tracer.count("blocks", assembly.graph.number_of_nodes())
+    tracer.count("contacts", len(contacts))
+    tracer.count("interaction_points", sum(len(contact.points) for contact in contacts))
+
+    return assembly, mu, density
+
+
+def _run_cra(
+    assembly: Assembly,
+    method: str = "penalty",
+    mu: float = 0.6,
+    d_bnd: float = 0.01,
+    eps: float = 0.001,
+    verbose: bool = True,
+    timer: bool = False,
+    tracer: Optional[Tracer] = None,
+) -> None:
+    """Solve the equilibrium of an assembly in-place, see :func:`cra_solve`."""
+    tracer = tracer or current_tracer()
+
+    with tracer.span("cra.solve", method=method):
+        if method == "rbe":
+            _rbe_solve(assembly, mu=mu, density=1.0, verbose=verbose, timer=timer)
+        elif method == "cra":
+            _cra_penalty_solve(
+                assembly,
+                mu=mu,
+                density=1.0,
+                d_bnd=d_bnd,
+                eps=eps,
+                verbose=verbose,
+                timer=timer,
+            )
+        else:
+            raise ValueError(f"Unknown CRA method '{method}'. Use 'rbe' or 'penalty'.")
@@ -0,0 +1,454 @@
+import asyncio
+import multiprocessing
+import queue
+import threading
+import time
+import traceback
+import zlib
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+from typing import AsyncIterator
+from typing import Callable
+from typing import Optional
+
+import compas
+from compas_dem.instrumentation import Tracer
+from compas_dem.problem.backends import SOLVER_BACKENDS
+from compas_dem.problem.backends import SolverBackend
+from compas_dem.problem.backends import register_solver_backend
+from compas_dem.problem.problem import Problem
+from compas_dem.problem.solvers import Solver
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+
+class LMGC90Executor:
+    """Run independent LMGC90 simulations in parallel, each in its own worker process.
+
+    LMGC90 keeps one simulation per process.
+    The executor therefore starts a fresh process for every problem, with at most `max_workers` running at the same time.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        The largest number of simultaneous worker processes. Default is the number of CPUs.
+    timeout : float, optional
+        The largest duration of a job in seconds, after which its worker process is killed.
+    memory_limit : int, optional
+        The largest address space of a worker process in bytes.
+        A job that exceeds it fails with a ``"memory"`` status.
+        The limit is ignored on platforms without :mod:`resource`.
+    solve : callable, optional
+        The function that is called in the worker processes with a problem and the parameters of its job.
+        It should be importable by name. Default is :func:`compas_dem.analysis.lmgc90.lmgc90_solve`.
+
+    Notes
+    -----
+    The problems are sent to the workers as compressed JSON.
+    The results sent back are the node and edge attributes of the model graph that were set by the solve,
+    such as the ``"transformation"`` of the blocks and the contact forces, and the edges that were added.
+    They are copied onto the models of the original problems.
+
+    The workers are started with the ``"spawn"`` method,
+    so scripts that use the executor should run it under ``if __name__ == "__main__":``.
+    Problems with body force fields that are plain functions cannot be sent to the workers, and fail with an ``"error"`` status.
+
+    Examples
+    --------
+    >>> executor = LMGC90Executor(max_workers=8, timeout=600, memory_limit=4 * 2**30)  # doctest: +SKIP
+    >>> jobs = executor.run(problems, duration=1.0, n_steps=500)  # doctest: +SKIP
+    >>> [job["status"] for job in jobs]  # doctest: +SKIP
+    ['done', 'done', 'timeout', ...]
+
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        memory_limit: Optional[int] = None,
+        solve: Optional[Callable] = None,
+    ) -> None:
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.solve = solve
+        self.poll = 0.1
+
+    def run(self, problems: list[Problem], parameters: Optional[list[dict]] = None, **kwargs) -> list[dict]:
+        """Solve the problems and copy the results onto their models.
+
+        Parameters
+        ----------
+        problems : list[:class:`compas_dem.problem.Problem`]
+            The problems.
+        parameters : list[dict], optional
+            The parameters of the solve per problem, combined with the shared parameters in `kwargs`.
+        **kwargs : dict, optional
+            The parameters of the solve shared by all problems, for example ``duration`` and ``n_steps``.
+
+        Returns
+        -------
+        list[dict]
+            A record per problem, with
+
+            * ``status``: ``"done"``, ``"timeout"``, ``"memory"`` or ``"error"``,
+            * ``duration``: the wall time of the job in seconds,
+            * ``error``: the traceback or reason of a failed job, or None.
+
+        """
+        if parameters is not None and len(parameters) != len(problems):
+            raise ValueError("The number of parameter sets does not match the number of problems.")
+
+        context = multiprocessing.get_context("spawn")
+        jobs = [{"status": None, "duration": None, "error": None} for _ in problems]
+        pending = list(range(len(problems)))
+        running: dict[int, tuple] = {}
+
+        try:
+            while pending or running:
+                while pending and len(running) < self.max_workers:
+                    index = pending.pop(0)
+                    job = dict(kwargs, **(parameters[index] if parameters else {}))
+                    try:
+                        payload = problem_payload(problems[index])
+                    except Exception:
+                        jobs[index].update(status="error", duration=0.0, error=traceback.format_exc())
+                        continue
+                    receiver, sender = context.Pipe(duplex=False)
+                    process = context.Process(
+                        target=_worker,
+                        args=(sender, payload, job, self.memory_limit, self.solve),
+                        daemon=True,
+                    )
+                    process.start()
+                    sender.close()
+                    running[index] = (process, receiver, time.perf_counter())
+
+                ready = wait([receiver for _, receiver, _ in running.values()], timeout=self.poll)
+
+                for index, (process, receiver, start) in list(running.items()):
+                    job = jobs[index]
+                    if receiver in ready:
+                        try:
+                            job["status"], data = receiver.recv()
+                        except EOFError:
+                            process.join()
+                            job["status"], data = "error", f"The worker process exited with code {process.exitcode}."
+                            if self.memory_limit:
+                                data += " It may have exceeded the memory limit."
+                        if job["status"] == "done":
+                            apply_results(problems[index], data)
+                        else:
+                            job["error"] = data
+                    elif self.timeout is not None and time.perf_counter() - start > self.timeout:
+                        process.kill()
+                        job["status"], job["error"] = "timeout", f"The job took longer than {self.timeout} s."
+                    else:
+                        continue
+
+                    job["duration"] = time.perf_counter() - start
+                    receiver.close()
+                    process.join()
+                    del running[index]
+        finally:
+            for process, receiver, _ in running.values():
+                process.kill()
+                process.join()
+                receiver.close()
+
+        return jobs
+
+
+class SolveFuture(Future):
+    """The result of a solve running in a worker process, with a stream of progress records.
+
+    Parameters
+    ----------
+    problem : :class:`compas_dem.problem.Problem`
+        The problem. The results of the solve are copied onto its model when the solve is done.
+    solver : :class:`compas_dem.problem.Solver`
+        The solver configuration.
+
+    Attributes
+    ----------
+    progress : list[dict]
+        The progress records received so far, see Notes.
+
+    Notes
+    -----
+    The solve is started by :meth:`start`, usually through :meth:`compas_dem.problem.Problem.solve_async`.
+    The result of the future is the problem, after the results have been copied onto its model.
+    If the solve fails, the exception of the future is a :class:`RuntimeError` with the traceback of the worker.
+
+    Every record of the tracer of the solve in the worker process is sent back as a progress record,
+    with the ``type``, ``name`` and ``elapsed`` time in seconds since the start of the worker, and the attributes of the record.
+    For example, the ``"lmgc90.step"`` events have the ``step``, ``n_steps``, ``urf`` and ``interactions``.
+
+    In an event loop, use ``await asyncio.wrap_future(future)`` to wait for the result,
+    and ``async for record in future.updates()`` to follow the progress.
+    :meth:`cancel` kills the worker process.
+
+    """
+
+    def __init__(self, problem: Problem, solver: Solver) -> None:
+        super().__init__()
+        self.problem = problem
+        self.solver = solver
+        self.progress: list[dict] = []
+        self._progress_callbacks: list[Callable[[dict], None]] = []
+        self._lock = threading.Lock()
+        self._process = None
+        self._thread = None
+
+    def start(self) -> "SolveFuture":
+        """Start the worker process and the thread that receives its messages.
+
+        Returns
+        -------
+        :class:`SolveFuture`
+
+        """
+        context = multiprocessing.get_context("spawn")
+        messages = context.Queue()
+        payload = problem_payload(self.problem)
+        # the backend is sent along, such that backends registered in this process are known to the worker
+        backend = SOLVER_BACKENDS.get(self.solver.name)
+        self._process = context.Process(
+            target=_solve_worker,
+            args=(messages, payload, self.solver.name, self.solver.parameters, backend),
+            daemon=True,
+        )
+        self._process.start()
+        self._thread = threading.Thread(target=self._receive, args=(messages,), daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self) -> bool:
+        """Kill the worker process, and cancel the future.
+
+        Returns
+        -------
+        bool
+            False if the solve was already done.
+
+        """
+        if self.done():
+            return False
+        if self._process is not None and self._process.is_alive():
+            self._process.kill()
+        return super().cancel()
+
+    def add_progress_callback(self, callback: Callable[[dict], None]) -> None:
+        """Call a function with every progress record.
+
+        Parameters
+        ----------
+        callback : callable
+            A function with the record as argument.
+            It is called with the records received so far, and then from the thread that receives the messages of the worker.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            self._progress_callbacks.append(callback)
+            records = list(self.progress)
+        for record in records:
+            callback(record)
+
+    async def updates(self) -> AsyncIterator[dict]:
+        """Iterate over the progress records in an event loop, until the solve is done.
+
+        Yields
+        ------
+        dict
+
+        """
+        loop = asyncio.get_running_loop()
+        records: asyncio.Queue = asyncio.Queue()
+        self.add_progress_callback(lambda record: loop.call_soon_threadsafe(records.put_nowait, record))
+        self.add_done_callback(lambda future: loop.call_soon_threadsafe(records.put_nowait, None))
+        while True:
+            record = await records.get()
+            if record is None:
+                break
+            yield record
+
+    def _receive(self, messages) -> None:
+        process = self._process
+        while not self.cancelled():
+            try:
+                kind, data = messages.get(timeout=0.1)
+            except queue.Empty:
+                if process.is_alive():
+                    continue
+                # the worker exited without sending a result, for example because it was killed
+                kind, data = "error", f"The worker process exited with code {process.exitcode}."
+
+            if kind == "progress":
+                with self._lock:
+                    self.progress.append(data)
+                    callbacks = list(self._progress_callbacks)
+                for callback in callbacks:
+                    callback(data)
+                continue
+
+            if not self.done():
+                if kind == "done":
+                    apply_results(self.problem, data)
+                    self.set_result(self.problem)
+                else:
+                    self.set_exception(RuntimeError(data))
+            break
+
+        process.join()
+
+
+def problem_payload(problem: Problem) -> bytes:
+    """Serialise a problem to compressed JSON.
+
+    Parameters
+    ----------
+    problem : :class:`compas_dem.problem.Problem`
+
+    Returns
+    -------
+    bytes
+
+    """
+    return zlib.compress(compas.json_dumps(problem).encode())
+
+
+def model_results(problem: Problem, before: dict) -> dict:
+    """Collect the graph attributes of a model that were set after a snapshot.
+
+    Parameters
+    ----------
+    problem : :class:`compas_dem.problem.Problem`
+    before : dict
+        The snapshot of the graph attributes, from :func:`graph_snapshot`.
+
+    Returns
+    -------
+    dict
+        The changed ``nodes`` and ``edges``, as lists of keys and attribute dicts.
+
+    """
+    graph = problem.model.graph
+    nodes = []
+    for node, attr in graph.node.items():
+        old = before["nodes"].get(node, {})
+        changed = {name: value for name, value in attr.items() if name not in old or old[name] is not value}
+        if changed:
+            nodes.append([node, changed])
+    edges = []
+    for u in graph.edge:
+        for v, attr in graph.edge[u].items():
+            old = before["edges"].get((u, v), {})
+            changed = {name: value for name, value in attr.items() if name not in old or old[name] is not value}
+            if changed:
+                edges.append([u, v, changed])
+    return {"nodes": nodes, "edges": edges}
+
+
+def graph_snapshot(problem: Problem) -> dict:
+    """Take a shallow snapshot of the graph attributes of the model of a problem.
+
+    Parameters
+    ----------
+    problem : :class:`compas_dem.problem.Problem`
+
+    Returns
+    -------
+    dict
+
+    """
+    graph = problem.model.graph
+    return {
+        "nodes": {node: dict(attr) for node, attr in graph.node.items()},
+        "edges": {(u, v): dict(attr) for u in graph.edge for v, attr in graph.edge[u].items()},
+    }
+
+
+def apply_results(problem: Problem, payload: bytes) -> None:
+    """Copy the results of a worker onto the model of a problem.
+
+    Parameters
+    ----------
+    problem : :class:`compas_dem.problem.Problem`
+    payload : bytes
+        The compressed results of :func:`model_results`.
+
+    Returns
+    -------
+    None
+
+    """
+    results = compas.json_loads(zlib.decompress(payload).decode())
+    graph = problem.model.graph
+    for node, attr in results["nodes"]:
+        graph.node_attributes(node, list(attr), list(attr.values()))
+    for u, v, attr in results["edges"]:
+        if not graph.has_edge((u, v)):
+            graph.add_edge(u, v)
+        graph.edge_attributes((u, v), list(attr), list(attr.values()))
+
+    for node in problem.boundary_conditions.fixed_blocks().tolist():
+        if node in problem._blocks:
+            problem._blocks[node].is_support = True
+
+
+def _worker(sender, payload: bytes, parameters: dict, memory_limit: Optional[int], solve: Optional[Callable]) -> None:
+    try:
+        if memory_limit and resource is not None:
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+        if solve is None:
+            from compas_dem.analysis.lmgc90 import lmgc90_solve as solve
+
+        problem = compas.json_loads(zlib.decompress(payload).decode())
+        before = graph_snapshot(problem)
+        solve(problem, **parameters)
+        results = zlib.compress(compas.json_dumps(model_results(problem, before)).encode())
+        sender.send(("done", results))
+    except MemoryError:
+        sender.send(("memory", traceback.format_exc()))
+    except Exception:
+        sender.send(("error", traceback.format_exc()))
+    finally:
+        sender.close()
+
+
+def _solve_worker(messages, payload: bytes, name: str, parameters: dict, backend: Optional[SolverBackend]) -> None:
+    start = time.perf_counter()
+
+    def forward(record: dict) -> None:
+        progress = {"type": record["type"], "name": record["name"], "elapsed": time.perf_counter() - start}
+        for key, value in record["attributes"].items():
+            progress[key] = value if isinstance(value, (bool, int, float, str, type(None))) else str(value)
+        if "value" in record:
+            progress["value"] = record["value"]
+        if "duration" in record:
+            progress["duration"] = record["duration"]
+        messages.put(("progress", progress))
+
+    try:
+        if backend is not None:
+            register_solver_backend(backend, replace=True)
+        problem = compas.json_loads(zlib.decompress(payload).decode())
+        before = graph_snapshot(problem)
+        solver = Solver()
+        solver.name = name
+        solver.parameters = parameters
+        problem.solve(solver, tracer=Tracer(name="problem.solve_async", callbacks=[forward]))
+        messages.put(("done", zlib.compress(compas.json_dumps(model_results(problem, before)).encode())))
+    except Exception:
+        messages.put(("error", traceback.format_exc()))
+    finally:
+        messages.close()
+        messages.join_thread()
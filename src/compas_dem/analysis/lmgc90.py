@@ -1,8 +1,10 @@
-from collections import defaultdict
+from typing import Optional
 
 import numpy as np
 
 import compas.geometry as cg
+from compas_dem.instrumentation import Tracer
+from compas_dem.instrumentation import current_tracer
 from compas_dem.interactions import EdgeContact
 from compas_dem.interactions import FrictionContact
 from compas_dem.problem.problem import Problem
@@ -11,49 +13,442 @@ try:
     from compas_lmgc90.solver import Solver
 except ImportError:
     raise ImportError("compas_lmgc90 is not installed. Install it to use the LMGC90 solver.")
+FORCE_COMPONENTS = ["Fx", "Fy", "Fz", "Mx", "My", "Mz"]
+
+
+def lmgc90_load_table(problem: Problem, duration: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build the time series of the forces and moments applied to all blocks.
+
+    Parameters
+    ----------
+    problem : :class:`compas_dem.problem.Problem`
+        The problem with the loads.
+    duration : float
+        The duration of the simulation.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        0. The graph nodes of the blocks, as an array of shape ``(n,)``.
+        1. The times of the series, ``[0, 0.98 * duration, duration]``.
+        2. The values of the force and moment components at these times, as an array of shape ``(n, 6, 3)``,
+           with the components in the order of :data:`FORCE_COMPONENTS`.
+
+    Notes
+    -----
+    Ramp loads increase from zero to the full value at ``0.98 * duration``.
+    Instantaneous loads are applied fully from the start, and released at the end.
+
+    """
+    nodes, forces, moments, ramp = problem.centroidal_wrenches()
+    t_series = np.array([0.0, duration * 0.98, duration])
+    profiles = np.where(ramp[:, None], [0.0, 1.0, 1.0], [1.0, 1.0, 0.0])
+    table = np.hstack([forces, moments])[:, :, None] * profiles[:, None, :]
+    return nodes, t_series, table
+
+
 # ---------------------------------------------------------------------------
 # UFR – Unbalanced Force Ratio
 # ---------------------------------------------------------------------------
 
 
-def compute_urf(solver: Solver, problem: Problem) -> float:
+def compute_urf(solver: Solver, problem: Problem, applied_forces: Optional[np.ndarray] = None) -> float:
     """Return the Unbalanced Force Ratio for the current simulation step.
 
     UFR = Σ_i |F_i_net| / ( Σ_i |F_i_applied| + Σ_ij |F_ij_contact| )
 
     Reads from ``solver.last_result`` (set by :meth:`Solver.run`).
     Returns 0.0 when no forces are present, and approaches 0 at equilibrium.
+
+    The applied forces per block, in the order of the model elements, can be provided
+    to avoid resolving the loads of the problem at every evaluation, see :func:`lmgc90_applied_forces`.
     """
     result = solver.last_result
-    lmgc_to_graphnode = {i: el.graphnode for i, el in enumerate(problem.model.elements())}
-
-    # Applied forces from the problem plus LMGC90's always-on gravity
-    g_vec = np.array([0.0, 0.0, -9.81])
-    applied_forces = {}
-    for idx, block in problem._blocks.items():
-        external = np.asarray(list(problem.centroidal_loads[idx]["force"]), dtype=float)
-        mass = getattr(block, "mass", None)
-        gravity = mass * g_vec if mass is not None else np.zeros(3)
-        applied_forces[idx] = external + gravity
+    if applied_forces is None:
+        applied_forces = lmgc90_applied_forces(problem)
 
     # Net contact force per body — interaction_bodies uses 1-based LMGC90 indices
-    contact_net: dict = defaultdict(lambda: np.zeros(3))
-    for i in range(len(result.interaction_bodies)):
-        cd_id, an_id = result.interaction_bodies[i]
-        f = np.asarray(result.interaction_force_global[i], dtype=float)
-        contact_net[lmgc_to_graphnode[cd_id - 1]] += f
-        contact_net[lmgc_to_graphnode[an_id - 1]] -= f
-
-    numerator = sum(np.linalg.norm(applied_forces.get(idx, np.zeros(3)) + cf) for idx, cf in contact_net.items())
-    for idx, af in applied_forces.items():
-        if idx not in contact_net:
-            numerator += np.linalg.norm(af)
-
-    total_applied = sum(np.linalg.norm(af) for af in applied_forces.values())
-    total_contact = sum(result.interaction_force_magnitude[i] for i in range(len(result.interaction_bodies)))
+    bodies = np.asarray(result.interaction_bodies, dtype=int).reshape(-1, 2) - 1
+    forces = np.asarray(result.interaction_force_global, dtype=float).reshape(-1, 3)
+    contact_net = np.zeros_like(applied_forces)
+    np.add.at(contact_net, bodies[:, 0], forces)
+    np.add.at(contact_net, bodies[:, 1], -forces)
+
+    numerator = np.linalg.norm(applied_forces + contact_net, axis=1).sum()
+    total_applied = np.linalg.norm(applied_forces, axis=1).sum()
+    total_contact = sum(result.interaction_force_magnitude[i] for i in range(len(bodies)))
     denominator = total_applied + total_contact
 
-    return 0.0 if denominator == 0.0 else numerator / denominator
+    return 0.0 if denominator == 0.0 else float(numerator / denominator)
+
+
+def lmgc90_applied_forces(problem: Problem) -> np.ndarray:
+    """Compute the forces applied to the blocks, including LMGC90's always-on gravity.
+
+    Parameters
+    ----------
+    problem : :class:`compas_dem.problem.Problem`
+
+    Returns
+    -------
+    numpy.ndarray
+        The forces, as an array of shape ``(n, 3)``, in the order of the model elements.
+
+    """
+    nodes, forces, _, _ = problem.centroidal_wrenches()
+    row = {node: i for i, node in enumerate(nodes.tolist())}
+    elements = list(problem.model.elements())
+    masses = np.array([getattr(element, "mass", None) or 0.0 for element in elements])
+    return forces[[row[element.graphnode] for element in elements]] + masses[:, None] * [0.0, 0.0, -9.81]
+
+
+def _time_parameters(duration: Optional[float], n_steps: Optional[int], dt: Optional[float]) -> tuple[float, int, float]:
+    given = sum(x is not None for x in [duration, n_steps, dt])
+    if given == 3:
+        raise ValueError("Provide exactly two of duration, n_steps, dt — the third is computed automatically.")
+    elif given == 1:
+        raise ValueError("Provide exactly two of duration, n_steps, dt.")
+    elif given == 0:
+        print("No time parameters provided; defaulting to duration=0.5s, n_steps=50.")
+        duration, n_steps = 0.5, 50
+        dt = duration / n_steps
+    else:
+        if duration is None:
+            duration = dt * n_steps
+        elif n_steps is None:
+            n_steps = round(duration / dt)
+        else:
+            dt = duration / n_steps
+    return duration, n_steps, dt
+
+
+class LMGC90Session:
+    """Run load cases of a problem with LMGC90, sharing the setup that does not depend on the loads.
+
+    Parameters
+    ----------
+    problem : :class:`~compas_dem.problem.Problem`
+        The problem containing model, forces, BCs, and contact properties.
+    contact_law : str, optional
+        LMGC90 contact law identifier. Default ``"IQS_CLB"``.
+    theta : float, optional
+        Time-integration parameter. Default ``0.5``.
+    tracer : :class:`compas_dem.instrumentation.Tracer`, optional
+        A tracer collecting the spans, counters and progress events of the runs.
+        If none is provided, the active tracer is used, if any.
+
+    Attributes
+    ----------
+    solver : :class:`compas_lmgc90.solver.Solver` | None
+        The preprocessed solver of the current load case.
+    steps : int
+        The number of steps computed for the current load case.
+
+    Notes
+    -----
+    The density, friction coefficient and support flags are collected once, when the session is created.
+    :meth:`setup` preprocesses a solver for the current loads and prescribed displacements of the problem,
+    and :meth:`run` steps it, such that a simulation can be continued without preprocessing it again,
+    for example until the unbalanced force ratio is small enough.
+
+    LMGC90 keeps one simulation per process, and its preprocessing can neither be repeated nor reset to the initial state.
+    Every new load case therefore needs a new call to :meth:`setup`, which releases the previous solver.
+
+    Examples
+    --------
+    >>> with LMGC90Session(problem) as session:  # doctest: +SKIP
+    ...     for factor in [0.1, 0.2, 0.3]:
+    ...         problem.boundary_conditions.body_force_fields[:] = [lambda points: [factor * 9.81, 0, 0]]
+    ...         session.setup(duration=1.0, n_steps=100)
+    ...         session.run(urf_threshold=1e-3)
+    ...         session.run(n_steps=100, urf_threshold=1e-4)
+
+    """
+
+    def __init__(self, problem: Problem, contact_law: str = "IQS_CLB", theta: float = 0.5, tracer: Optional[Tracer] = None) -> None:
+        self.problem = problem
+        self.contact_law = contact_law
+        self.theta = theta
+        self.tracer = tracer or current_tracer()
+
+        self.solver: Optional[Solver] = None
+        self.duration: Optional[float] = None
+        self.n_steps: Optional[int] = None
+        self.dt: Optional[float] = None
+        self.steps = 0
+        self._applied_forces: Optional[np.ndarray] = None
+
+        # ------------------------------------------------------------------
+        # Density: first non-support block with material, or fallback
+        # ------------------------------------------------------------------
+        self.density = 2000.0
+        for block in problem.model.blocks():
+            if block.material and block.material.density:
+                self.density = block.material.density
+                break
+
+        # ------------------------------------------------------------------
+        # Contact friction: last contact properties added to the problem
+        # ------------------------------------------------------------------
+        if problem.contact_properties.contact_model:
+            self.mu = problem.contact_properties.contact_model.mu
+        else:
+            Warning("No contact properties with a contact model found in the problem; defaulting to mu=0.6.")
+            self.mu = 0.6
+
+        # Fully-fixed blocks (all-zero translation + rotation) must go through
+        # the supports mechanism for vizualization and later flagging.
+        for idx in problem.boundary_conditions.fixed_blocks().tolist():
+            if idx in problem._blocks:
+                problem._blocks[idx].is_support = True
+
+    def __enter__(self) -> "LMGC90Session":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the solver of the current load case.
+
+        Returns
+        -------
+        None
+
+        """
+        if self.solver is not None:
+            self.solver.finalize()
+            self.solver = None
+
+    def setup(self, duration: Optional[float] = None, n_steps: Optional[int] = None, dt: Optional[float] = None) -> Solver:
+        """Build and preprocess a solver for the current loads and prescribed displacements of the problem.
+
+        Parameters
+        ----------
+        duration : float, optional
+            Total simulation time [s].
+        n_steps : int, optional
+            Number of time steps.
+        dt : float, optional
+            Time step size [s].
+
+        Returns
+        -------
+        :class:`compas_lmgc90.solver.Solver`
+
+        Notes
+        -----
+        Provide two of `duration`, `n_steps` and `dt`, or none for a duration of 0.5s in 50 steps.
+        The solver of the previous load case is released.
+
+        """
+        self.close()
+        duration, n_steps, dt = _time_parameters(duration, n_steps, dt)
+        self.duration, self.n_steps, self.dt = duration, n_steps, dt
+
+        problem = self.problem
+        tracer = self.tracer
+
+        with tracer.span("lmgc90.setup", blocks=len(problem._blocks)):
+            solver = Solver(problem.model, density=self.density, dt=dt, theta=self.theta)
+            # solver.set_supports_from_model()
+
+            # ------------------------------------------------------------------
+            # Displacement BCs → apply_velocity (prescribed non-zero only)
+            # ------------------------------------------------------------------
+            nodes, mask, values = problem.boundary_conditions.dof_table()
+            components = ["Vx", "Vy", "Vz", "Rx", "Ry", "Rz"]
+            for row, column in zip(*np.nonzero(mask)):
+                idx = int(nodes[row])
+                if idx in problem._blocks:
+                    solver.apply_velocity(block_index=idx, component=components[column], value=float(values[row, column]) / duration)
+
+            # ------------------------------------------------------------------
+            # Applied forces: one time series per block and per force or moment component,
+            # registered from a single load table, see lmgc90_load_table
+            # ------------------------------------------------------------------
+            nodes, t_series, table = lmgc90_load_table(problem, duration)
+            series = np.empty(table.shape[:2] + (2, len(t_series)))
+            series[:, :, 0] = t_series
+            series[:, :, 1] = table
+            rows, columns = np.nonzero(np.abs(table).max(axis=2) > 1e-12)
+            for row, column in zip(rows.tolist(), columns.tolist()):
+                solver.apply_force(block_index=int(nodes[row]), component=FORCE_COMPONENTS[column], value=series[row, column])
+            tracer.count("lmgc90.forces", len(rows))
+
+            # ------------------------------------------------------------------
+            # Contact law
+            # ------------------------------------------------------------------
+            solver.contact_law(self.contact_law, self.mu)
+
+        with tracer.span("lmgc90.preprocess"):
+            solver.preprocess()
+        tracer.count("blocks", len(problem._blocks))
+
+        self.solver = solver
+        self.steps = 0
+        self._applied_forces = lmgc90_applied_forces(problem)
+        solver.force_time = []
+        solver.urf_history = []
+        solver.displacement_history = []
+        return solver
+
+    def run(
+        self,
+        n_steps: Optional[int] = None,
+        urf_threshold: Optional[float] = None,
+        track_block: Optional[int] = None,
+        postprocess: bool = True,
+    ) -> None:
+        """Step the solver of the current load case, and write the results to the model.
+
+        Parameters
+        ----------
+        n_steps : int, optional
+            Number of time steps. Default is the number of steps of :meth:`setup`.
+        urf_threshold : float, optional
+            Unbalanced Force Ratio convergence threshold, see :func:`lmgc90_solve`.
+        track_block : int, optional
+            Index of a block of which the displacement is recorded at every step.
+        postprocess : bool, optional
+            If False, the results are not written to the model, see :meth:`postprocess`.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        RuntimeError
+            If no solver was set up.
+
+        Notes
+        -----
+        Subsequent calls continue the simulation from the state at the end of the previous call.
+        The histories of forces, UFR and displacements are appended to the attributes of the solver.
+
+        """
+        solver = self.solver
+        if solver is None:
+            raise RuntimeError("No solver was set up. Call setup() first.")
+        problem = self.problem
+        tracer = self.tracer
+        n_steps = n_steps or self.n_steps
+        dt = self.dt
+
+        force_time = solver.force_time
+        urf_history = solver.urf_history
+        displacement_history = solver.displacement_history
+        initial_pos = np.array(solver.trimeshes[track_block].centroid()) if track_block is not None else None
+        print("Starting LMGC90 solver analysis...")
+        with tracer.span("lmgc90.run", n_steps=n_steps, dt=dt) as span:
+            for step in range(n_steps):
+                if self.steps == 0:
+                    result = solver.lmgc90.compute_one_step()
+
+                    for i, block in enumerate(problem.model.elements()):
+                        pos = np.array(result.bodies[i])
+                        rot = np.array(result.body_frames[i]).reshape(3, 3)
+                        block.init_frame = cg.Frame(pos, rot[0, :], rot[1, :])
+
+                    solver._update_meshes(result)
+                    solver.last_result = result
+
+                else:
+                    solver.run(nb_steps=1)
+                self.steps += 1
+
+                if track_block is not None:
+                    current_pos = np.array(solver.trimeshes[track_block].centroid())
+                    displacement_history.append(current_pos - initial_pos)
+
+                if urf_threshold is not None:
+                    if step % 10 == 0:
+                        urf = compute_urf(solver, problem, self._applied_forces)
+                        urf_history.append(urf)
+                        print(f"Completed step {step}/{n_steps}...  UFR = {urf:.2e}")
+                        if urf >= 1.0:
+                            print(f"Diverged at step {step} (UFR = {urf:.2e} >= 1.0). Stopping.")
+                            break
+
+                        _jump_window = 200  # Ignores URF jumps in the first n steps
+                        # Allows the solver to stabilize initially
+
+                        _Max_URF_JUMP_FACTOR = 3.5  # If UFR jumps by more than this factor compared to the recent average, consider it a failure
+
+                        if len(urf_history) > _jump_window:
+                            baseline = np.mean(urf_history[-_jump_window - 1 : -1])
+                            if urf > baseline * _Max_URF_JUMP_FACTOR:
+                                print(f"Failure detected at step {step} (UFR jumped from ~{baseline:.2e} to {urf:.2e}). Stopping.")
+                                break
+                        if urf < urf_threshold:
+                            print(f"Converged at step {step} (UFR = {urf:.2e} < {urf_threshold:.2e}). Stopping early.")
+                            break
+
+                elif step % 10 == 0:
+                    print(f"Completed step {step}/{n_steps}...")
+
+                if step % 10 == 0:
+                    result = solver.last_result
+                    force_time.append([result.interaction_force_magnitude[i] for i in range(len(result.interaction_bodies))])
+                    tracer.event(
+                        "lmgc90.step",
+                        step=step,
+                        n_steps=n_steps,
+                        interactions=len(result.interaction_bodies),
+                        urf=urf_history[-1] if urf_history else None,
+                    )
+
+                span["steps"] = step + 1
+
+                # This is the solver loop, New tracking functions can be added here,
+                # Such as tracking specific contact forces, displacements, or other quantities of interest at each step.
+
+        print("LMGC90 solver run complete.")
+        if postprocess:
+            self.postprocess()
+
+    def postprocess(self) -> None:
+        """Write the results of the current state of the solver to the model.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        RuntimeError
+            If no solver was set up.
+
+        """
+        solver = self.solver
+        if solver is None:
+            raise RuntimeError("No solver was set up. Call setup() first.")
+        tracer = self.tracer
+
+        tracer.count("interaction_points", len(solver.last_result.interaction_bodies))
+        with tracer.span("lmgc90.post_processing"):
+            _post_processing_lmgc90(solver, self.problem)
+
+        solver.name = "LMGC90"
+
+    def solve(
+        self,
+        duration: Optional[float] = None,
+        n_steps: Optional[int] = None,
+        dt: Optional[float] = None,
+        urf_threshold: Optional[float] = None,
+        track_block: Optional[int] = None,
+    ) -> None:
+        """Set up and run a load case, see :meth:`setup` and :meth:`run`.
+
+        Returns
+        -------
+        None
+
+        """
+        self.setup(duration=duration, n_steps=n_steps, dt=dt)
+        self.run(urf_threshold=urf_threshold, track_block=track_block)
 
 
 def lmgc90_solve(
@@ -65,6 +460,7 @@ def lmgc90_solve(
     theta: float = 0.5,
     urf_threshold: float = None,
     track_block: int = None,
+    tracer: Optional[Tracer] = None,
 ) -> Solver:
     """Translate a Problem into a configured LMGC90 Solver. Run the simulation and
     Postprocess results back into the Problem's BlockModel in-place after the run (refer
@@ -91,6 +487,11 @@ def lmgc90_solve(
         Requires ``solver.get_contacts()`` to expose ``"body_ids"`` and
         ``"force_vectors"`` keys; a warning is printed and tracking is skipped
         if those keys are absent.
+    track_block : int, optional
+        Index of a block of which the displacement is recorded at every step.
+    tracer : :class:`compas_dem.instrumentation.Tracer`, optional
+        A tracer collecting the spans, counters and progress events of the solve.
+        If none is provided, the active tracer is used, if any.
 
     Returns
     -------
@@ -105,182 +506,14 @@ def lmgc90_solve(
     >>> solver = lmgc90_solve(problem, dt=0.01, n_steps=100)
     >>> solver = lmgc90_solve(problem, duration=1.0, dt=0.01)
     >>> solver = lmgc90_solve(problem, duration=1.0, n_steps=500, urf_threshold=1e-3)
-    """
-    given = sum(x is not None for x in [duration, n_steps, dt])
-    if given == 3:
-        raise ValueError("Provide exactly two of duration, n_steps, dt — the third is computed automatically.")
-    elif given == 1:
-        raise ValueError("Provide exactly two of duration, n_steps, dt.")
-    elif given == 0:
-        print("No time parameters provided; defaulting to duration=0.5s, n_steps=50.")
-        duration, n_steps = 0.5, 50
-        dt = duration / n_steps
-    else:
-        if duration is None:
-            duration = dt * n_steps
-        elif n_steps is None:
-            n_steps = round(duration / dt)
-        else:
-            dt = duration / n_steps
-
-    model = problem.model
-
-    # ------------------------------------------------------------------
-    # Density: first non-support block with material, or fallback
-    # ------------------------------------------------------------------
-    density = 2000.0
-    for block in model.blocks():
-        if block.material and block.material.density:
-            density = block.material.density
-            break
-
-    # ------------------------------------------------------------------
-    # Contact friction: last contact properties added to the problem
-    # ------------------------------------------------------------------
-    if problem.contact_properties.contact_model:
-        mu = problem.contact_properties.contact_model.mu
-    else:
-        Warning("No contact properties with a contact model found in the problem; defaulting to mu=0.6.")
-        mu = 0.6
-    # ------------------------------------------------------------------
-    # Build solver
-    # ------------------------------------------------------------------
-    # Fully-fixed blocks (all-zero translation + rotation) must go through
-    # the supports mechanism for vizualization and later flagging.
-    for block in model.elements():
-        idx = block.graphnode
-        disp = problem.centroidal_displacements.get(idx)
-        if disp is not None:
-            t = disp["translation"] or [0.0, 0.0, 0.0]
-            r = disp["rotation"] or [0.0, 0.0, 0.0]
-            if all(v == 0.0 for v in t) and all(v == 0.0 for v in r):
-                block.is_support = True
-
-    solver = Solver(model, density=density, dt=dt, theta=theta)
-    # solver.set_supports_from_model()
-
-    # ------------------------------------------------------------------
-    # Displacement BCs → apply_velocity (prescribed non-zero only)
-    # ------------------------------------------------------------------
-    for block in model.elements():
-        idx = block.graphnode
-        disp = problem.centroidal_displacements.get(idx)
-        if disp is None:
-            continue
-
-        translation = disp["translation"] or [None, None, None]
-        rotation = disp["rotation"] or [None, None, None]
-
-        for component, value in zip(["Vx", "Vy", "Vz"], translation):
-            if value is not None:
-                solver.apply_velocity(block_index=idx, component=component, value=value / duration)
-        for component, value in zip(["Rx", "Ry", "Rz"], rotation):
-            if value is not None:
-                solver.apply_velocity(block_index=idx, component=component, value=value / duration)
-
-    # ------------------------------------------------------------------
-    # Applied forces: decompose centroidal (force, moment) into per-axis
-    # time series — The three values inputted are at t=0, t=duration*0.9, and t=duration, allowing for ramped or instantaneous loading.
-    # ------------------------------------------------------------------
-    t_series = np.array([0.0, duration * 0.98, duration])
-    # t_series = np.array([0.0, duration * 0.2, 0.8*duration, duration * 0.98])
-
-    for idx, entry in problem.centroidal_loads.items():
-        f = entry["force"]
-        m = entry["moment"]
-        ramp = entry.get("loading_type", "ramp") == "ramp"
-
-        def _vals(v):
-            return [0, v, v] if ramp else [v, v, 0]
-
-        if abs(f.x) > 1e-12:
-            solver.apply_force(block_index=idx, component="Fx", value=np.array([t_series, _vals(f.x)]))
-        if abs(f.y) > 1e-12:
-            solver.apply_force(block_index=idx, component="Fy", value=np.array([t_series, _vals(f.y)]))
-        if abs(f.z) > 1e-12:
-            solver.apply_force(block_index=idx, component="Fz", value=np.array([t_series, _vals(f.z)]))
-        if abs(m.x) > 1e-12:
-            solver.apply_force(block_index=idx, component="Mx", value=np.array([t_series, _vals(m.x)]))
-        if abs(m.y) > 1e-12:
-            solver.apply_force(block_index=idx, component="My", value=np.array([t_series, _vals(m.y)]))
-        if abs(m.z) > 1e-12:
-            solver.apply_force(block_index=idx, component="Mz", value=np.array([t_series, _vals(m.z)]))
-
-    # ------------------------------------------------------------------
-    # Contact law
-    # ------------------------------------------------------------------
-    solver.contact_law(contact_law, mu)
-
-    solver.preprocess()
-
-    # raise NotImplementedError("The LMGC90 solver run loop and postprocessing are still being developed. This function is not yet complete.")
-    force_time = []
-    urf_history = []
-    displacement_history = []
-    initial_pos = np.array(solver.trimeshes[track_block].centroid()) if track_block is not None else None
-    print("Starting LMGC90 solver analysis...")
-    for step in range(n_steps):
-        if step == 0:
-            result = solver.lmgc90.compute_one_step()
-
-            for i, block in enumerate(problem.model.elements()):
-                pos = np.array(result.bodies[i])
-                rot = np.array(result.body_frames[i]).reshape(3, 3)
-                block.init_frame = cg.Frame(pos, rot[0, :], rot[1, :])
-
-            solver._update_meshes(result)
-            solver.last_result = result
-
-        else:
-            solver.run(nb_steps=1)
 
-        if track_block is not None:
-            current_pos = np.array(solver.trimeshes[track_block].centroid())
-            displacement_history.append(current_pos - initial_pos)
-
-        if urf_threshold is not None:
-            if step % 10 == 0:
-                urf = compute_urf(solver, problem)
-                urf_history.append(urf)
-                print(f"Completed step {step}/{n_steps}...  UFR = {urf:.2e}")
-                if urf >= 1.0:
-                    print(f"Diverged at step {step} (UFR = {urf:.2e} >= 1.0). Stopping.")
-                    break
-
-                _jump_window = 200  # Ignores URF jumps in the first n steps
-                # Allows the solver to stabilize initially
-
-                _Max_URF_JUMP_FACTOR = 3.5  # If UFR jumps by more than this factor compared to the recent average, consider it a failure
-
-                if len(urf_history) > _jump_window:
-                    baseline = np.mean(urf_history[-_jump_window - 1 : -1])
-                    if urf > baseline * _Max_URF_JUMP_FACTOR:
-                        print(f"Failure detected at step {step} (UFR jumped from ~{baseline:.2e} to {urf:.2e}). Stopping.")
-                        break
-                if urf < urf_threshold:
-                    print(f"Converged at step {step} (UFR = {urf:.2e} < {urf_threshold:.2e}). Stopping early.")
-                    break
-
-        elif step % 10 == 0:
-            print(f"Completed step {step}/{n_steps}...")
-
-        if step % 10 == 0:
-            result = solver.last_result
-            force_time.append([result.interaction_force_magnitude[i] for i in range(len(result.interaction_bodies))])
-
-        # This is the solver loop, New tracking functions can be added here,
-        # Such as tracking specific contact forces, displacements, or other quantities of interest at each step.
-
-    solver.force_time = force_time
-    solver.urf_history = urf_history
-    solver.displacement_history = displacement_history
-
-    print("LMGC90 solver run complete.")
-    _post_processing_lmgc90(solver, problem)
-
-    solver.name = "LMGC90"
-
-    solver.finalize()
+    See Also
+    --------
+    :class:`LMGC90Session`
+        To run several load cases of the same problem, or to continue a simulation.
+    """
+    with LMGC90Session(problem, contact_law=contact_law, theta=theta, tracer=tracer) as session:
+        session.solve(duration=duration, n_steps=n_steps, dt=dt, urf_threshold=urf_threshold, track_block=track_block)
 
     return
 
@@ -0,0 +1,9 @@
+from .tracer import Tracer
+from .tracer import NullTracer
+from .tracer import current_tracer
+from .tracer import logging_callback
+from .memory import MemoryProfiler
+from .memory import current_rss
+from .memory import peak_rss
+
+__all__ = ["Tracer", "NullTracer", "current_tracer", "logging_callback", "MemoryProfiler", "current_rss", "peak_rss"]
@@ -0,0 +1,236 @@
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from typing import Optional
+
+from .tracer import Tracer
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+
+class MemoryProfiler:
+    """Record the memory use of the spans of a tracer.
+
+    Parameters
+    ----------
+    tracer : :class:`Tracer`
+        The tracer of which the spans are the stages of the report.
+    types : dict[str, type], optional
+        The types of which the live instances are counted at the start and end of every stage.
+        Default is ``Mesh``, ``FrictionContact`` and ``Frame``.
+    top : int, optional
+        The number of allocation sites with the largest growth reported per stage.
+        Use ``0`` to skip the tracemalloc snapshots.
+    filepath : str, optional
+        A JSON file to which the report is written after every stage,
+        such that the stages completed before the process is killed, for example for running out of memory, are kept.
+
+    Attributes
+    ----------
+    stages : list[dict]
+        The memory record of every completed span, see Notes.
+
+    Notes
+    -----
+    Every stage record has the ``name``, ``parent`` and ``duration`` of the span, and
+
+    * ``rss``: the resident set size of the process at the end of the stage, in bytes,
+    * ``peak_rss``: the highest resident set size of the process so far, in bytes,
+    * ``traced``: the ``start``, ``end`` and ``peak`` size of the memory blocks allocated by Python and numpy during the stage, in bytes,
+    * ``objects``: the ``start`` and ``end`` number of live instances of the counted types,
+    * ``allocations``: the allocation sites with the largest growth during the stage, from the difference of two tracemalloc snapshots.
+
+    The RSS values include memory allocated by compiled extensions, such as the LMGC90 core, which tracemalloc does not see.
+    They are ``None`` on platforms where they are not available.
+
+    Profiling is slow, because counting objects walks the heap and tracemalloc hooks every allocation.
+    The reported durations include this overhead.
+
+    Examples
+    --------
+    >>> tracer = Tracer()
+    >>> with tracer, MemoryProfiler(tracer) as profiler:
+    ...     with tracer.span("setup"):
+    ...         data = list(range(100000))
+    >>> [stage["name"] for stage in profiler.stages]
+    ['setup']
+
+    """
+
+    def __init__(self, tracer: Tracer, types: Optional[dict[str, type]] = None, top: int = 10, filepath: Optional[str] = None):
+        if types is None:
+            from compas.datastructures import Mesh
+            from compas.geometry import Frame
+            from compas_dem.interactions import FrictionContact
+
+            types = {"Mesh": Mesh, "FrictionContact": FrictionContact, "Frame": Frame}
+
+        self.tracer = tracer
+        self.types = types
+        self.top = top
+        self.filepath = filepath
+        self.stages: list[dict] = []
+        self._stack: list[dict] = []
+        self._started = False
+
+    def __enter__(self) -> "MemoryProfiler":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        self.tracer.add_callback(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.tracer.callbacks.remove(self)
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def __call__(self, record: dict) -> None:
+        if record["type"] == "begin":
+            self._begin()
+        elif record["type"] == "end":
+            self._end(record)
+
+    def _begin(self) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+        tracemalloc.reset_peak()
+        self._stack.append(
+            {
+                "start": current,
+                "peak": current,
+                "objects": self.count_objects(),
+                "snapshot": tracemalloc.take_snapshot() if self.top else None,
+            }
+        )
+
+    def _end(self, record: dict) -> None:
+        state = self._stack.pop()
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(state["peak"], peak)
+        if self._stack:
+            self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+        tracemalloc.reset_peak()
+
+        objects = self.count_objects()
+        allocations = []
+        if state["snapshot"] is not None:
+            statistics = tracemalloc.take_snapshot().compare_to(state["snapshot"], "lineno")
+            for statistic in statistics[: self.top]:
+                frame = statistic.traceback[0]
+                allocations.append(
+                    {
+                        "location": f"{frame.filename}:{frame.lineno}",
+                        "size": statistic.size_diff,
+                        "count": statistic.count_diff,
+                    }
+                )
+
+        self.stages.append(
+            {
+                "name": record["name"],
+                "parent": record["parent"],
+                "duration": record["duration"],
+                "rss": current_rss(),
+                "peak_rss": peak_rss(),
+                "traced": {"start": state["start"], "end": current, "peak": peak},
+                "objects": {name: {"start": state["objects"][name], "end": objects[name]} for name in objects},
+                "allocations": allocations,
+            }
+        )
+        if self.filepath:
+            self.dump(self.filepath)
+
+    def count_objects(self) -> dict[str, int]:
+        """Count the live instances of the profiled types.
+
+        Returns
+        -------
+        dict[str, int]
+
+        Notes
+        -----
+        Unreachable objects are collected first, such that only the objects that are still in use are counted.
+
+        """
+        gc.collect()
+        counts = dict.fromkeys(self.types, 0)
+        items = list(self.types.items())
+        for obj in gc.get_objects():
+            for name, cls in items:
+                if isinstance(obj, cls):
+                    counts[name] += 1
+        return counts
+
+    def report(self) -> dict:
+        """Collect the stage records in a JSON serialisable report.
+
+        Returns
+        -------
+        dict
+            A dict with the ``stages``, the overall ``peak_rss`` of the process,
+            the highest ``peak_traced`` memory of all stages, in bytes,
+            and the ``counters`` of the tracer.
+
+        """
+        return {
+            "stages": self.stages,
+            "counters": dict(self.tracer.counters),
+            "peak_rss": peak_rss(),
+            "peak_traced": max((stage["traced"]["peak"] for stage in self.stages), default=0),
+        }
+
+    def dump(self, filepath: str) -> None:
+        """Write the report to a JSON file.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the file.
+
+        Returns
+        -------
+        None
+
+        """
+        with open(filepath, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+
+def current_rss() -> Optional[int]:
+    """Get the current resident set size of the process.
+
+    Returns
+    -------
+    int | None
+        The size in bytes, or None if it is not available on this platform.
+
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss() -> Optional[int]:
+    """Get the highest resident set size of the process so far.
+
+    Returns
+    -------
+    int | None
+        The size in bytes, or None if it is not available on this platform.
+
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # the size is reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
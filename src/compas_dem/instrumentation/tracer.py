@@ -0,0 +1,292 @@
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+
+Callback = Callable[[dict], None]
+
+
+class Tracer:
+    """Collect named spans, counters and events of a run, and forward them to callbacks.
+
+    Parameters
+    ----------
+    name : str, optional
+        The name of the run.
+    callbacks : list[callable], optional
+        Functions called with every record as soon as it is created.
+
+    Attributes
+    ----------
+    spans : list[dict]
+        The completed spans, with their ``name``, ``start`` and ``duration`` in seconds,
+        the ``parent`` span name, and the ``attributes`` passed to :meth:`span`.
+    counters : dict[str, float]
+        The current value of every counter.
+    events : list[dict]
+        The records of all spans, counters and events, in the order in which they were created.
+
+    Notes
+    -----
+    A record is a dict with a ``type``, which is one of ``"begin"``, ``"end"``, ``"count"`` or ``"event"``,
+    the ``name`` of the span, counter or event, and the ``time`` in seconds since the tracer was created.
+    ``"end"`` records also have a ``duration``, ``"count"`` records the new ``value`` of the counter,
+    and all records have the ``attributes`` they were created with.
+
+    A tracer is activated for a block of code with a ``with`` statement.
+    The instrumented functions of the package report to the active tracer, see :func:`current_tracer`.
+
+    Examples
+    --------
+    >>> tracer = Tracer(callbacks=[logging_callback()])
+    >>> with tracer:
+    ...     with tracer.span("setup", blocks=10):
+    ...         tracer.count("contacts", 24)
+    >>> tracer.counters["contacts"]
+    24
+
+    """
+
+    def __init__(self, name: Optional[str] = None, callbacks: Optional[list[Callback]] = None):
+        self.name = name or "compas_dem"
+        self.callbacks: list[Callback] = list(callbacks or [])
+        self.spans: list[dict] = []
+        self.counters: dict[str, float] = {}
+        self.events: list[dict] = []
+        self._origin = time.perf_counter()
+        self._stack: list[str] = []
+        self._tokens: list = []
+
+    def __enter__(self) -> "Tracer":
+        self._tokens.append(_TRACER.set(self))
+        return self
+
+    def __exit__(self, *args) -> None:
+        _TRACER.reset(self._tokens.pop())
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def _emit(self, record: dict) -> None:
+        self.events.append(record)
+        for callback in self.callbacks:
+            callback(record)
+
+    def add_callback(self, callback: Callback) -> None:
+        """Add a function to be called with every new record.
+
+        Parameters
+        ----------
+        callback : callable
+            A function accepting a record dict.
+
+        Returns
+        -------
+        None
+
+        """
+        self.callbacks.append(callback)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[dict]:
+        """Time a named block of code.
+
+        Parameters
+        ----------
+        name : str
+            The name of the span.
+        **attributes
+            Additional data stored with the span, for example the size of the input.
+
+        Yields
+        ------
+        dict
+            The attributes of the span, which can be updated from inside the block.
+
+        """
+        parent = self._stack[-1] if self._stack else None
+        start = self._now()
+        self._emit({"type": "begin", "name": name, "time": start, "parent": parent, "attributes": attributes})
+        self._stack.append(name)
+        try:
+            yield attributes
+        finally:
+            self._stack.pop()
+            end = self._now()
+            span = {"name": name, "start": start, "duration": end - start, "parent": parent, "attributes": attributes}
+            self.spans.append(span)
+            self._emit({"type": "end", "name": name, "time": end, "duration": end - start, "parent": parent, "attributes": attributes})
+
+    def count(self, name: str, value: float = 1, **attributes: Any) -> None:
+        """Increment a named counter.
+
+        Parameters
+        ----------
+        name : str
+            The name of the counter.
+        value : float, optional
+            The increment.
+        **attributes
+            Additional data stored with the record.
+
+        Returns
+        -------
+        None
+
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+        self._emit({"type": "count", "name": name, "time": self._now(), "value": self.counters[name], "attributes": attributes})
+
+    def event(self, name: str, **attributes: Any) -> None:
+        """Record a named event, for example the progress of a solver.
+
+        Parameters
+        ----------
+        name : str
+            The name of the event.
+        **attributes
+            Additional data stored with the event.
+
+        Returns
+        -------
+        None
+
+        """
+        self._emit({"type": "event", "name": name, "time": self._now(), "attributes": attributes})
+
+    def durations(self) -> dict[str, float]:
+        """Compute the total duration of the spans per name.
+
+        Returns
+        -------
+        dict[str, float]
+
+        """
+        durations: dict[str, float] = {}
+        for span in self.spans:
+            durations[span["name"]] = durations.get(span["name"], 0.0) + span["duration"]
+        return durations
+
+    def to_trace(self) -> dict:
+        """Convert the records to the Trace Event Format of Chrome and Perfetto.
+
+        Returns
+        -------
+        dict
+
+        """
+        events = [{"name": "process_name", "ph": "M", "pid": 0, "args": {"name": self.name}}]
+        for record in self.events:
+            ts = record["time"] * 1e6
+            if record["type"] == "end":
+                events.append(
+                    {
+                        "name": record["name"],
+                        "ph": "X",
+                        "ts": ts - record["duration"] * 1e6,
+                        "dur": record["duration"] * 1e6,
+                        "pid": 0,
+                        "tid": 0,
+                        "args": _jsonable(record["attributes"]),
+                    }
+                )
+            elif record["type"] == "count":
+                events.append({"name": record["name"], "ph": "C", "ts": ts, "pid": 0, "args": {record["name"]: record["value"]}})
+            elif record["type"] == "event":
+                events.append({"name": record["name"], "ph": "i", "s": "p", "ts": ts, "pid": 0, "tid": 0, "args": _jsonable(record["attributes"])})
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"counters": dict(self.counters)}}
+
+    def dump(self, filepath: str) -> None:
+        """Write the records to a JSON trace file.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the file.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The file can be opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+
+        """
+        with open(filepath, "w") as f:
+            json.dump(self.to_trace(), f)
+
+
+class NullTracer(Tracer):
+    """A tracer that ignores all records.
+
+    This is the active tracer when no other tracer is activated,
+    such that the instrumented code does not have to check for a tracer.
+
+    """
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[dict]:
+        yield attributes
+
+    def count(self, name: str, value: float = 1, **attributes: Any) -> None:
+        pass
+
+    def event(self, name: str, **attributes: Any) -> None:
+        pass
+
+
+_TRACER: ContextVar[Tracer] = ContextVar("compas_dem_tracer", default=NullTracer())
+
+
+def current_tracer() -> Tracer:
+    """Get the active tracer.
+
+    Returns
+    -------
+    :class:`Tracer`
+        The innermost tracer activated with a ``with`` statement,
+        or a :class:`NullTracer` if there is none.
+
+    """
+    return _TRACER.get()
+
+
+def logging_callback(logger: Optional[logging.Logger] = None, level: int = logging.INFO) -> Callback:
+    """Create a tracer callback that writes the records to a logger.
+
+    Parameters
+    ----------
+    logger : :class:`logging.Logger`, optional
+        The logger. Default is the ``compas_dem`` logger.
+    level : int, optional
+        The logging level.
+
+    Returns
+    -------
+    callable
+
+    """
+    logger = logger or logging.getLogger("compas_dem")
+
+    def callback(record: dict) -> None:
+        attributes = " ".join(f"{key}={value}" for key, value in record["attributes"].items())
+        if record["type"] == "begin":
+            logger.log(level, "%s started %s", record["name"], attributes)
+        elif record["type"] == "end":
+            logger.log(level, "%s finished in %.3fs %s", record["name"], record["duration"], attributes)
+        elif record["type"] == "count":
+            logger.log(level, "%s = %s", record["name"], record["value"])
+        else:
+            logger.log(level, "%s %s", record["name"], attributes)
+
+    return callback
+
+
+def _jsonable(attributes: dict) -> dict:
+    return {key: value if isinstance(value, (bool, int, float, str, type(None))) else str(value) for key, value in attributes.items()}
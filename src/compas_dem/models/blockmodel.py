@@ -1,39 +1,145 @@
 from typing import Generator
 from typing import Iterator
+from typing import Optional
 from typing import Type
 
+import numpy as np
+
 from compas.datastructures import Mesh
 from compas.geometry import Box
 from compas.geometry import Frame
-from compas.geometry import Line
-from compas.geometry import Plane
 from compas.geometry import Polyhedron
-from compas.geometry import bestfit_frame_numpy
-from compas.itertools import pairwise
 from compas_cgal.meshing import trimesh_dual
 from compas_cgal.meshing import trimesh_remesh
 from compas_cgal.projection import project_mesh_on_mesh
 from compas_dem.elements import Block
+from compas_dem.instrumentation import current_tracer
 from compas_dem.interactions import FrictionContact
 from compas_dem.templates import BarrelVaultTemplate
+from compas_dem.templates import DomeTemplate
+from compas_dem.templates import StackTemplate
 from compas_dem.templates import Template
-from compas_libigl.intersections import intersection_ray_mesh
+from compas_dem.templates import WallTemplate
+from compas_libigl.intersections import intersection_rays_mesh
 from compas_libigl.mapping import map_pattern_to_mesh
 from compas_model.interactions import Contact
 from compas_model.models import Model
 
 
-def project_mesh_to_target(mesh: Mesh, target: Mesh):
-    V, F = target.to_vertices_and_faces()
-    for vertex in mesh.vertices():
-        point = mesh.vertex_point(vertex)
-        normal = mesh.vertex_normal(vertex)
-        x = intersection_ray_mesh((point, normal), (V, F))
-        if not len(x):
-            x = intersection_ray_mesh((point, normal * -1), (V, F))
-        if len(x):
-            d = x[0][3]
-            mesh.vertex_attributes(vertex, "xyz", point + normal * d)
+def mesh_vertex_normals_numpy(mesh: Mesh) -> np.ndarray:
+    """Compute the normals of all vertices of a mesh at once.
+
+    Parameters
+    ----------
+    mesh : :class:`Mesh`
+        The mesh.
+
+    Returns
+    -------
+    numpy.ndarray
+        The unit vertex normals, in the order of ``mesh.vertices()``, as an array of shape ``(v, 3)``.
+
+    Notes
+    -----
+    As with ``Mesh.vertex_normal``, the normal of a vertex is the normalized sum
+    of the area-weighted normals of the faces around the vertex.
+
+    """
+    V, F = mesh.to_vertices_and_faces()
+    xyz = np.asarray(V, dtype=float)
+    normals = np.zeros_like(xyz)
+
+    degree_faces: dict[int, list[list[int]]] = {}
+    for face in F:
+        degree_faces.setdefault(len(face), []).append(face)
+
+    for faces in degree_faces.values():
+        indices = np.asarray(faces)
+        points = xyz[indices]
+        points = points - points.mean(axis=1, keepdims=True)
+        facenormals = 0.5 * np.cross(np.roll(points, 1, axis=1), points).sum(axis=1)
+        np.add.at(normals, indices.ravel(), np.repeat(facenormals, indices.shape[1], axis=0))
+
+    lengths = np.linalg.norm(normals, axis=1)
+    lengths[lengths == 0] = 1.0
+    return normals / lengths[:, None]
+
+
+def project_mesh_to_target(mesh: Mesh, target: Mesh) -> np.ndarray:
+    """Project the vertices of a mesh onto a target mesh along the vertex normals.
+
+    Parameters
+    ----------
+    mesh : :class:`Mesh`
+        The mesh to project.
+        The mesh is modified in place.
+    target : :class:`Mesh`
+        The target mesh.
+
+    Returns
+    -------
+    numpy.ndarray
+        The signed distances along the vertex normals between the original and projected vertices,
+        in the order of ``mesh.vertices()``, as an array of shape ``(v,)``.
+        The distance is ``nan`` for vertices that were not projected.
+
+    Notes
+    -----
+    The rays of all vertices are cast in a single call against the triangles of the target.
+    A vertex is projected to the nearest hit in the direction of its normal,
+    or, if there is none, to the nearest hit in the opposite direction.
+    Vertices for which neither ray hits the target are not moved.
+
+    """
+    points = np.array(mesh.vertices_attributes("xyz"), dtype=float)
+    normals = mesh_vertex_normals_numpy(mesh)
+    target_mesh = target.to_vertices_and_faces(triangulated=True)
+
+    distances = np.full(len(points), np.nan)
+    for sign in (1.0, -1.0):
+        rays = np.nonzero(np.isnan(distances))[0]
+        if not len(rays):
+            break
+        hits = intersection_rays_mesh(list(zip(points[rays].tolist(), (sign * normals[rays]).tolist())), target_mesh)
+        for ray, ray_hits in zip(rays.tolist(), hits):
+            if len(ray_hits):
+                distances[ray] = sign * min(hit[3] for hit in ray_hits)
+
+    hits = ~np.isnan(distances)
+    projected = points[hits] + normals[hits] * distances[hits, None]
+    for vertex, point in zip(np.array(list(mesh.vertices()))[hits].tolist(), projected.tolist()):
+        mesh.vertex_attributes(vertex, "xyz", point)
+
+    return distances
+
+
+def pattern_unify_cycles(faces: list[list[int]]) -> list[list[int]]:
+    # align the cycle directions of the faces with the first face of their connected component,
+    # walking over the shared edges instead of searching all pairs of faces
+    faces = [list(face) for face in faces]
+    edge_faces: dict[tuple[int, int], list[int]] = {}
+    for index, face in enumerate(faces):
+        for u, v in zip(face, face[1:] + face[:1]):
+            edge_faces.setdefault((u, v) if u < v else (v, u), []).append(index)
+
+    visited = [False] * len(faces)
+    for root in range(len(faces)):
+        if visited[root]:
+            continue
+        visited[root] = True
+        stack = [root]
+        while stack:
+            face = faces[stack.pop()]
+            for u, v in zip(face, face[1:] + face[:1]):
+                for index in edge_faces[(u, v) if u < v else (v, u)]:
+                    if visited[index]:
+                        continue
+                    visited[index] = True
+                    other = faces[index]
+                    if other[(other.index(u) + 1) % len(other)] == v:
+                        other.reverse()
+                    stack.append(index)
+    return faces
 
 
 def pattern_inverse_height_thickness(pattern: Mesh, tmin=None, tmax=None):
@@ -53,55 +159,274 @@ def pattern_inverse_height_thickness(pattern: Mesh, tmin=None, tmax=None):
     tmax = tmax or 50 * d / 1000
 
     pattern.update_default_vertex_attributes(thickness=0)
-    zvalues: list[float] = pattern.vertices_attribute(name="z")  # type: ignore
-    zmin = min(zvalues)
-    zmax = max(zvalues)
+    z = np.array(pattern.vertices_attribute(name="z"), dtype=float)  # type: ignore
+    z = (z - z.min()) / (z.max() - z.min())
+    thickness = (1 - z) * (tmax - tmin) + tmin
 
-    for vertex in pattern.vertices():
-        point = pattern.vertex_point(vertex)
-        z = (point.z - zmin) / (zmax - zmin)
-        thickness = (1 - z) * (tmax - tmin) + tmin
-        pattern.vertex_attribute(vertex, name="thickness", value=thickness)
+    for vertex, t in zip(pattern.vertices(), thickness.tolist()):
+        pattern.vertex_attribute(vertex, name="thickness", value=t)
 
 
 def pattern_idos(pattern: Mesh) -> Mesh:
     idos: Mesh = pattern.copy()
-    for vertex in idos.vertices():
-        point = pattern.vertex_point(vertex)
-        normal = pattern.vertex_normal(vertex)
-        thickness = pattern.vertex_attribute(vertex, name="thickness")
-        idos.vertex_attributes(vertex, names="xyz", values=point - normal * (0.5 * thickness))  # type: ignore
+    points = np.array(pattern.vertices_attributes("xyz"), dtype=float)
+    normals = mesh_vertex_normals_numpy(pattern)
+    thickness = np.array(pattern.vertices_attribute("thickness"), dtype=float)
+    points -= normals * (0.5 * thickness[:, None])
+    for vertex, point in zip(idos.vertices(), points.tolist()):
+        idos.vertex_attributes(vertex, names="xyz", values=point)
     return idos
 
 
-def pattern_face_block(pattern: Mesh, idos: Mesh, face: int) -> Mesh:
-    vertices = pattern.face_vertices(face)
-    normals = [pattern.vertex_normal(vertex) for vertex in vertices]
-    thickness = pattern.vertices_attribute("thickness", keys=vertices)
-    bottom = idos.vertices_points(vertices)
-    top = [point + vector * t for point, vector, t in zip(bottom, normals, thickness)]  # type: ignore
-    frame = Frame(*bestfit_frame_numpy(top))
-    plane = Plane.from_frame(frame)
-    flattop = []
-    for a, b in zip(bottom, top):
-        b = plane.intersection_with_line(Line(a, b))
-        flattop.append(b)
-    sides = []
-    for (a, b), (aa, bb) in zip(pairwise(bottom + bottom[:1]), pairwise(flattop + flattop[:1])):
-        sides.append([a, b, bb, aa])
-    polygons = [bottom[::-1], flattop] + sides
-    block: Mesh = Mesh.from_polygons(polygons)
-    return block
+def pattern_block_faces(degree: int) -> list[list[int]]:
+    # the faces of a block extruded from a pattern face with the given number of vertices,
+    # with the vertices of the bottom in reverse order followed by the vertices of the top
+    bottom = list(range(degree))
+    top = list(range(degree, 2 * degree))
+    sides = [[degree - 1 - i, degree - 1 - (i + 1) % degree, degree + (i + 1) % degree, degree + i] for i in range(degree)]
+    return [bottom, top] + sides
+
+
+def intersection_lines_bestfit_planes_numpy(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Intersect batches of lines with the best-fit planes through their end points.
+
+    Parameters
+    ----------
+    start : numpy.ndarray
+        The start points of the lines as an array of shape ``(m, k, 3)``.
+    end : numpy.ndarray
+        The end points of the lines as an array of shape ``(m, k, 3)``.
+        Every group of ``k`` end points defines a best-fit plane.
+
+    Returns
+    -------
+    numpy.ndarray
+        The intersection points as an array of shape ``(m, k, 3)``.
+        Lines parallel to their plane are not intersected and keep their end point.
+
+    Notes
+    -----
+    The best-fit planes pass through the centroids of the end points,
+    with as normal the right-singular vector of the smallest singular value of the centered points.
+
+    """
+    origins = end.mean(axis=1, keepdims=True)
+    normals = np.linalg.svd(end - origins)[2][:, -1][:, None, :]
+    directions = end - start
+    denominator = np.einsum("ijk,ijk->ij", normals, directions)
+    numerator = np.einsum("ijk,ijk->ij", normals, origins - start)
+    parallel = np.abs(denominator) < 1e-12
+    t = np.where(parallel, 1.0, numerator / np.where(parallel, 1.0, denominator))
+    return start + directions * t[..., None]
+
+
+def pattern_corners_numpy(pattern: Mesh, idos: Mesh) -> tuple[dict[int, int], np.ndarray, np.ndarray]:
+    """Compute the bottom and flattened top corners of the blocks of all faces of a pattern.
+
+    Parameters
+    ----------
+    pattern : :class:`Mesh`
+        The pattern, with a thickness per vertex.
+    idos : :class:`Mesh`
+        The pattern offset to the bottom of the blocks.
+
+    Returns
+    -------
+    tuple[dict[int, int], numpy.ndarray, numpy.ndarray]
+        0. The row of the first corner of every face.
+        1. The bottom corners of all faces, in the order of the face vertices, as an array of shape ``(c, 3)``.
+        2. The top corners of all faces, in the order of the face vertices, as an array of shape ``(c, 3)``.
+
+    """
+    vertices = list(pattern.vertices())
+    vertex_index = {vertex: index for index, vertex in enumerate(vertices)}
+    normals = mesh_vertex_normals_numpy(pattern)
+    thickness = np.array(pattern.vertices_attribute("thickness", keys=vertices), dtype=float)
+    bottoms = np.array(idos.vertices_attributes("xyz", keys=vertices), dtype=float)
+    tops = bottoms + normals * thickness[:, None]
+
+    face_start: dict[int, int] = {}
+    degree_faces: dict[int, list[int]] = {}
+    count = 0
+    face: int
+    for face in pattern.faces():  # type: ignore
+        degree = len(pattern.face_vertices(face))
+        face_start[face] = count
+        degree_faces.setdefault(degree, []).append(face)
+        count += degree
+
+    bottom = np.empty((count, 3))
+    top = np.empty((count, 3))
+    for degree, faces in degree_faces.items():
+        indices = np.array([[vertex_index[vertex] for vertex in pattern.face_vertices(face)] for face in faces])
+        rows = np.array([face_start[face] for face in faces])[:, None] + np.arange(degree)
+        bottom[rows] = bottoms[indices]
+        top[rows] = intersection_lines_bestfit_planes_numpy(bottoms[indices], tops[indices])
+
+    return face_start, bottom, top
 
 
 def pattern_blocks(pattern: Mesh, idos: Mesh) -> dict[int, Mesh]:
+    face_start, bottom, top = pattern_corners_numpy(pattern, idos)
+    bottom = bottom.tolist()
+    top = top.tolist()
+
+    degree_blockfaces: dict[int, list[list[int]]] = {}
     face_block: dict[int, Mesh] = {}
-    face: int
-    for face in pattern.faces():  # type: ignore
-        face_block[face] = pattern_face_block(pattern, idos, face)
+    for face, start in face_start.items():
+        degree = len(pattern.face_vertices(face))
+        if degree not in degree_blockfaces:
+            degree_blockfaces[degree] = pattern_block_faces(degree)
+        end = start + degree
+        face_block[face] = Mesh.from_vertices_and_faces(bottom[start:end][::-1] + top[start:end], degree_blockfaces[degree])
     return face_block
 
 
+def pattern_interfaces_numpy(pattern: Mesh, idos: Mesh) -> tuple[np.ndarray, list[np.ndarray]]:
+    """Compute the interfaces between the blocks of neighbouring faces of a pattern.
+
+    Parameters
+    ----------
+    pattern : :class:`Mesh`
+        The pattern, with a thickness per vertex.
+    idos : :class:`Mesh`
+        The pattern offset to the bottom of the blocks.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, list[numpy.ndarray]]
+        0. The pairs of neighbouring faces as an array of shape ``(m, 2)``.
+        1. The interface polygons as arrays of shape ``(4, 3)`` or ``(5, 3)``.
+           The corners are ordered such that the polygon normal points from the first to the second face of the pair.
+
+    Notes
+    -----
+    The blocks of two faces sharing an edge have the bottom corners of the edge in common,
+    and their side faces along the edge lie on the same lines through these corners.
+    The interface is the overlap of the two side faces.
+    If the top corner of the same block is the lower one on both lines,
+    the overlap is the side face of that block.
+    Otherwise the top edges cross, and the overlap is a pentagon through the lower top corners and the crossing point.
+
+    The overlap is exact if the two lines are coplanar, for example if the pattern is flat.
+    Otherwise the side faces are slightly twisted, and the crossing point is the midpoint of the closest points of the top edges
+    at the parameter where the difference in height along the lines vanishes.
+
+    """
+    face_start, bottom, top = pattern_corners_numpy(pattern, idos)
+
+    pairs = []
+    corners = []
+    for u, v in pattern.edges():
+        face = pattern.halfedge[u][v]
+        nbr = pattern.halfedge[v][u]
+        if face is None or nbr is None:
+            continue
+        face_vertices = pattern.face_vertices(face)
+        nbr_vertices = pattern.face_vertices(nbr)
+        i = face_vertices.index(u)
+        j = nbr_vertices.index(v)
+        pairs.append((face, nbr))
+        corners.append(
+            (
+                face_start[face] + i,
+                face_start[face] + (i + 1) % len(face_vertices),
+                face_start[nbr] + (j + 1) % len(nbr_vertices),
+                face_start[nbr] + j,
+            )
+        )
+
+    if not pairs:
+        return np.empty((0, 2), dtype=int), []
+
+    a, b, c, d = np.array(corners).T
+    # the differences in height of the top corners of the two blocks along the lines through the bottom corners
+    height_u = np.linalg.norm(top[a] - bottom[a], axis=1) - np.linalg.norm(top[c] - bottom[a], axis=1)
+    height_v = np.linalg.norm(top[b] - bottom[b], axis=1) - np.linalg.norm(top[d] - bottom[b], axis=1)
+
+    quads = np.empty((len(pairs), 4, 3))
+    quads[:, 0] = bottom[a]
+    quads[:, 1] = bottom[b]
+    quads[:, 2] = np.where(height_v[:, None] <= 0, top[b], top[d])
+    quads[:, 3] = np.where(height_u[:, None] <= 0, top[a], top[c])
+    polygons = list(quads)
+
+    crossing = np.nonzero(height_u * height_v < 0)[0]
+    if len(crossing):
+        a, b, c, d = a[crossing], b[crossing], c[crossing], d[crossing]
+        t = (height_u[crossing] / (height_u[crossing] - height_v[crossing]))[:, None]
+        points = 0.5 * ((1 - t) * (top[a] + top[c]) + t * (top[b] + top[d]))
+        pentagons = np.concatenate([quads[crossing, :3], points[:, None], quads[crossing, 3:]], axis=1)
+        for row, pentagon in zip(crossing.tolist(), pentagons):
+            polygons[row] = pentagon
+
+    return np.array(pairs), polygons
+
+
+def polygons_frames_numpy(polygons: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the centroids, local axes and areas of a batch of planar polygons.
+
+    Parameters
+    ----------
+    polygons : numpy.ndarray
+        The corners of the polygons as an array of shape ``(m, k, 3)``.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        0. The area centroids of the polygons.
+        1. The x axes of the polygon frames, aligned with the first edge of the polygons.
+        2. The y axes of the polygon frames.
+        3. The areas of the polygons.
+
+    Notes
+    -----
+    The z axes of the frames, the cross product of the x and y axes,
+    are the normals of the polygons following the cycle direction of their corners.
+
+    """
+    polygons = np.asarray(polygons, dtype=float)
+    a = polygons[:, :1]
+    b = polygons[:, 1:-1]
+    c = polygons[:, 2:]
+    cross = np.cross(b - a, c - a)
+    normals = 0.5 * cross.sum(axis=1)
+    areas = np.linalg.norm(normals, axis=1)
+    zaxes = normals / areas[:, None]
+
+    weights = 0.5 * np.einsum("ijk,ik->ij", cross, zaxes)
+    centers = (a + b + c) / 3
+    centroids = np.einsum("ij,ijk->ik", weights, centers) / weights.sum(axis=1)[:, None]
+
+    xaxes = polygons[:, 1] - polygons[:, 0]
+    xaxes -= zaxes * np.einsum("ij,ij->i", xaxes, zaxes)[:, None]
+    xaxes /= np.linalg.norm(xaxes, axis=1)[:, None]
+    yaxes = np.cross(zaxes, xaxes)
+
+    return centroids, xaxes, yaxes, areas
+
+
+def _edge_point_forces(graph, edge) -> Optional[tuple[list, list]]:
+    # the contact points and point forces of a solved interface
+    points = graph.edge_attribute(edge, "contact_point")
+    vectors = graph.edge_attribute(edge, "force_vector")
+    if points and vectors and len(points) == len(vectors):
+        return [list(point) for point in points], [list(vector) for vector in vectors]
+
+    contact = graph.edge_attribute(edge, "contact_data")
+    if contact is not None and getattr(contact, "forces", None) and len(contact.forces) == len(contact.points):
+        frame = contact.frame
+        axes = np.array([frame.zaxis, frame.xaxis, frame.yaxis], dtype=float)
+        components = np.array([[f.get("c_np", 0.0) - f.get("c_nn", 0.0), f.get("c_u", 0.0), f.get("c_v", 0.0)] for f in contact.forces])
+        return [list(point) for point in contact.points], (components @ axes).tolist()
+
+    force = graph.edge_attribute(edge, "force")
+    if points and force is not None:
+        return [np.mean(np.array(points, dtype=float), axis=0).tolist()], [list(force)]
+
+    return None
+
+
 class BlockModel(Model):
     """Variation of COMPAS Model specifically designed for working with Discrete Element Models in the context of masonry construction."""
 
@@ -198,6 +523,10 @@ class BlockModel(Model):
     def from_template(cls, template: Template) -> "BlockModel":
         """Construct a block model from a template.
 
+        If the template provides its interfaces,
+        the contacts between the blocks are added directly from the interface polygons,
+        and calling :meth:`compute_contacts` is not necessary.
+
         Parameters
         ----------
         template : :class:`Template`
@@ -208,15 +537,61 @@ class BlockModel(Model):
         :class:`BlockModel`
 
         """
-        return cls.from_boxes(template.blocks())
+        tracer = current_tracer()
+        with tracer.span("model.from_template", template=type(template).__name__):
+            model = cls()
+            nodes = []
+            for mesh in template.blocks():
+                if mesh.attributes.get("is_support"):
+                    node = model.add_support_from_mesh(mesh)
+                else:
+                    node = model.add_block_from_mesh(mesh)
+                nodes.append(node)
+            tracer.count("blocks", len(nodes))
+
+            try:
+                pairs, polygons = template.interfaces_numpy()
+            except NotImplementedError:
+                return model
+
+            model.add_contacts_from_polygons(np.array(nodes)[pairs], polygons)
+            return model
 
     @classmethod
-    def from_stack(cls) -> "BlockModel":
-        raise NotImplementedError
+    def from_stack(cls, template: StackTemplate) -> "BlockModel":
+        """Construct a block model from a stack template.
+
+        The contacts between the blocks are added directly from the template.
+
+        Parameters
+        ----------
+        template : :class:`StackTemplate`
+            The stack template.
+
+        Returns
+        -------
+        :class:`BlockModel`
+
+        """
+        return cls.from_template(template)
 
     @classmethod
-    def from_wall(cls) -> "BlockModel":
-        raise NotImplementedError
+    def from_wall(cls, template: WallTemplate) -> "BlockModel":
+        """Construct a block model from a wall template.
+
+        The contacts between the bricks are added directly from the bond pattern of the wall.
+
+        Parameters
+        ----------
+        template : :class:`WallTemplate`
+            The wall template.
+
+        Returns
+        -------
+        :class:`BlockModel`
+
+        """
+        return cls.from_template(template)
 
     @classmethod
     def from_arch(cls):
@@ -224,13 +599,40 @@ class BlockModel(Model):
 
     @classmethod
     def from_barrelvault(cls, template: BarrelVaultTemplate) -> "BlockModel":
-        """"""
-        model = cls()
-        for mesh in template.blocks():
-            block: Block = Block.from_mesh(mesh)
-            block.is_support = mesh.attributes["is_support"]
-            model.add_element(block)
-        return model
+        """Construct a block model from a barrel vault template.
+
+        The contacts between the blocks are added directly from the bond pattern of the vault.
+
+        Parameters
+        ----------
+        template : :class:`BarrelVaultTemplate`
+            The barrel vault template.
+
+        Returns
+        -------
+        :class:`BlockModel`
+
+        """
+        return cls.from_template(template)
+
+    @classmethod
+    def from_dome(cls, template: DomeTemplate) -> "BlockModel":
+        """Construct a block model from a dome template.
+
+        The contacts between the blocks are added directly from the known topology of the dome.
+        Calling :meth:`compute_contacts` is therefore not necessary.
+
+        Parameters
+        ----------
+        template : :class:`DomeTemplate`
+            The dome template.
+
+        Returns
+        -------
+        :class:`BlockModel`
+
+        """
+        return cls.from_template(template)
 
     @classmethod
     def from_crossvault(cls) -> "BlockModel":
@@ -269,33 +671,40 @@ class BlockModel(Model):
         -------
         :class:`BlockModel`
 
+        Notes
+        -----
+        The contacts between the blocks are computed from the side faces along the shared edges of the pattern,
+        without ``compute_contacts``.
+
         """
-        temp: Mesh = mesh.copy()
-        temp.quads_to_triangles()
-        M = temp.to_vertices_and_faces()
+        tracer = current_tracer()
 
-        V1, F1, V2, F2 = trimesh_dual(M, length_factor=lengthfactor, number_of_iterations=100)  # type: ignore
-        dual = Mesh.from_vertices_and_faces(V2, F2)
-        dual.unify_cycles()
+        with tracer.span("model.pattern"):
+            temp: Mesh = mesh.copy()
+            temp.quads_to_triangles()
+            M = temp.to_vertices_and_faces()
 
-        pattern_inverse_height_thickness(dual, tmin=tmin, tmax=tmax)
-        idos = pattern_idos(dual)
-        face_block: dict[int, Mesh] = pattern_blocks(dual, idos)
+            V1, F1, V2, F2 = trimesh_dual(M, length_factor=lengthfactor, number_of_iterations=100)  # type: ignore
+            dual = Mesh.from_vertices_and_faces(V2, pattern_unify_cycles(F2))
+
+        with tracer.span("model.pattern_blocks", faces=dual.number_of_faces()):
+            pattern_inverse_height_thickness(dual, tmin=tmin, tmax=tmax)
+            idos = pattern_idos(dual)
+            face_block: dict[int, Mesh] = pattern_blocks(dual, idos)
 
         face: int
         face_node: dict[int, int] = {}
 
-        model = cls()
-        for face, block in face_block.items():
-            node = model.add_block_from_mesh(block)
-            face_node[face] = node
+        with tracer.span("model.add_blocks"):
+            model = cls()
+            for face, block in face_block.items():
+                node = model.add_block_from_mesh(block)
+                face_node[face] = node
+            tracer.count("blocks", len(face_node))
 
-        for face in dual.faces():  # type: ignore
-            u = face_node[face]
-            nbrs = dual.face_neighbors(face)
-            for nbr in nbrs:
-                v = face_node[nbr]
-                model.graph.add_edge(u, v)
+        with tracer.span("model.pattern_interfaces"):
+            pairs, polygons = pattern_interfaces_numpy(dual, idos)
+            model.add_contacts_from_polygons([[face_node[face], face_node[nbr]] for face, nbr in pairs.tolist()], polygons)
 
         return model
 
@@ -320,35 +729,44 @@ class BlockModel(Model):
         -------
         :class:`BlockModel`
 
+        Notes
+        -----
+        The contacts between the blocks are computed from the side faces along the shared edges of the pattern,
+        without ``compute_contacts``.
+
         """
-        average_length = sum(mesh.edge_length(edge) for edge in mesh.edges()) / mesh.number_of_edges()
-        target_edge_length = 0.5 * average_length
-        temp: Mesh = mesh.copy()
-        temp.quads_to_triangles()
-        M = temp.to_vertices_and_faces()
-        V, F = trimesh_remesh(M, target_edge_length=target_edge_length, number_of_iterations=100)  # type: ignore
-        trimesh = Mesh.from_vertices_and_faces(V, F)  # type: ignore
-        pattern = map_pattern_to_mesh(patternname, trimesh, **kwargs)
-        pattern.unify_cycles()
-        project_mesh_on_mesh(pattern, trimesh)  # type: ignore
-        pattern_inverse_height_thickness(pattern, tmin=tmin, tmax=tmax)
-        idos = pattern_idos(pattern)
-        face_block: dict[int, Mesh] = pattern_blocks(pattern, idos)
+        tracer = current_tracer()
+
+        with tracer.span("model.pattern", pattern=patternname):
+            average_length = sum(mesh.edge_length(edge) for edge in mesh.edges()) / mesh.number_of_edges()
+            target_edge_length = 0.5 * average_length
+            temp: Mesh = mesh.copy()
+            temp.quads_to_triangles()
+            M = temp.to_vertices_and_faces()
+            V, F = trimesh_remesh(M, target_edge_length=target_edge_length, number_of_iterations=100)  # type: ignore
+            trimesh = Mesh.from_vertices_and_faces(V, F)  # type: ignore
+            V, F = map_pattern_to_mesh(patternname, trimesh, **kwargs).to_vertices_and_faces()
+            pattern = Mesh.from_vertices_and_faces(V, pattern_unify_cycles(F))
+            project_mesh_on_mesh(pattern, trimesh)  # type: ignore
+
+        with tracer.span("model.pattern_blocks", faces=pattern.number_of_faces()):
+            pattern_inverse_height_thickness(pattern, tmin=tmin, tmax=tmax)
+            idos = pattern_idos(pattern)
+            face_block: dict[int, Mesh] = pattern_blocks(pattern, idos)
 
         face: int
         face_node: dict[int, int] = {}
 
-        model = cls()
-        for face, block in face_block.items():
-            node = model.add_block_from_mesh(block)
-            face_node[face] = node
+        with tracer.span("model.add_blocks"):
+            model = cls()
+            for face, block in face_block.items():
+                node = model.add_block_from_mesh(block)
+                face_node[face] = node
+            tracer.count("blocks", len(face_node))
 
-        for face in pattern.faces():  # type: ignore
-            u = face_node[face]
-            nbrs = pattern.face_neighbors(face)
-            for nbr in nbrs:
-                v = face_node[nbr]
-                model.graph.add_edge(u, v)
+        with tracer.span("model.pattern_interfaces"):
+            pairs, polygons = pattern_interfaces_numpy(pattern, idos)
+            model.add_contacts_from_polygons([[face_node[face], face_node[nbr]] for face, nbr in pairs.tolist()], polygons)
 
         return model
 
@@ -384,6 +802,71 @@ class BlockModel(Model):
         self.add_element(block)
         return block.graphnode
 
+    def add_contacts_from_polygons(
+        self,
+        pairs: list[tuple[int, int]],
+        polygons: np.ndarray,
+        contacttype: Type[Contact] = FrictionContact,
+    ) -> None:
+        """Add contacts with known interface polygons between pairs of blocks.
+
+        Parameters
+        ----------
+        pairs : list[tuple[int, int]]
+            The graph nodes of the blocks in contact.
+        polygons : numpy.ndarray | list[numpy.ndarray]
+            The corners of the interface polygons, as an array of shape ``(m, k, 3)``,
+            or as a list of arrays of shape ``(k, 3)`` if the polygons have different numbers of corners.
+            The normal of every polygon should point from the first to the second block of the corresponding pair.
+        contacttype : Type[:class:`compas_model.interactions.Contact`], optional
+            The contact class to use for the generated contacts.
+
+        Returns
+        -------
+        None
+
+        """
+        if isinstance(polygons, np.ndarray):
+            polygons = polygons.astype(float)
+            centroids, xaxes, yaxes, areas = polygons_frames_numpy(polygons)
+        else:
+            polygons = [np.asarray(polygon, dtype=float) for polygon in polygons]
+            centroids = np.empty((len(polygons), 3))
+            xaxes = np.empty((len(polygons), 3))
+            yaxes = np.empty((len(polygons), 3))
+            areas = np.empty(len(polygons))
+            # the frames are computed per batch of polygons with the same number of corners
+            counts = np.array([len(polygon) for polygon in polygons], dtype=int)
+            for count in np.unique(counts).tolist():
+                rows = np.nonzero(counts == count)[0]
+                frames = polygons_frames_numpy(np.array([polygons[row] for row in rows.tolist()]))
+                centroids[rows], xaxes[rows], yaxes[rows], areas[rows] = frames
+
+        edge_contacts: dict[tuple[int, int], list[Contact]] = {}
+        for (u, v), points, origin, xaxis, yaxis, area in zip(
+            np.asarray(pairs).tolist(),
+            [polygon.tolist() for polygon in polygons],
+            centroids.tolist(),
+            xaxes.tolist(),
+            yaxes.tolist(),
+            areas.tolist(),
+        ):
+            if (v, u) in edge_contacts or self.graph.has_edge((v, u)):
+                # align the contact frame with the direction of the existing edge
+                u, v = v, u
+                points = points[::-1]
+                yaxis = [-axis for axis in yaxis]
+            contact = contacttype(points=points, frame=Frame(origin, xaxis, yaxis), size=area)
+            edge_contacts.setdefault((u, v), []).append(contact)
+
+        for edge, contacts in edge_contacts.items():
+            if self.graph.has_edge(edge):
+                self.graph.edge_attribute(edge, name="contacts", value=contacts)
+            else:
+                self.graph.add_edge(*edge, contacts=contacts)
+
+        current_tracer().count("contacts", len(polygons))
+
     # =============================================================================
     # Blocks & Supports
     # =============================================================================
@@ -412,6 +895,86 @@ class BlockModel(Model):
             if not element.is_support:
                 yield element
 
+    def support_reactions(self) -> tuple[list[int], np.ndarray, np.ndarray, np.ndarray]:
+        """Aggregate the contact forces of a solved model per support block.
+
+        Returns
+        -------
+        tuple[list[int], numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            0. The graph nodes of the supports.
+            1. The resultant reaction forces as an array of shape ``(s, 3)``.
+            2. The resultant reaction moments about the support centroids as an array of shape ``(s, 3)``.
+            3. The points of application of the reactions as an array of shape ``(s, 3)``.
+
+        Notes
+        -----
+        The reactions are computed from the contact forces stored on the graph edges by the solvers,
+        i.e. the per-point ``"force_vector"`` of LMGC90, the per-point forces of the ``"contact_data"`` of CRA,
+        or otherwise the interface ``"force"`` at the centroid of the ``"contact_point"`` list.
+        Contacts between two supports are ignored.
+
+        The force of every interface is oriented away from the support,
+        such that the reaction is the force exerted by the support on the structure.
+
+        The point of application is the point of the central axis of the reaction that is closest to the support centroid.
+        If the reaction force is zero, it is the support centroid.
+
+        """
+        nodes = [block.graphnode for block in self.supports()]
+        row = {node: i for i, node in enumerate(nodes)}
+        centroids = np.array([self.graph.node_element(node).point for node in nodes], dtype=float).reshape(-1, 3)  # type: ignore
+
+        # the contact points of all support interfaces,
+        # with the row of their support and the index of their interface
+        point_row = []
+        point_edge = []
+        points = []
+        forces = []
+        count = 0
+        for edge in self.graph.edges():
+            u, v = edge
+            if (u in row) == (v in row):
+                continue
+            data = _edge_point_forces(self.graph, edge)
+            if data is None:
+                continue
+            point_row += [row[u] if u in row else row[v]] * len(data[0])
+            point_edge += [count] * len(data[0])
+            points += data[0]
+            forces += data[1]
+            count += 1
+
+        reactions = np.zeros((len(nodes), 3))
+        moments = np.zeros((len(nodes), 3))
+
+        if points:
+            point_row = np.array(point_row, dtype=int)
+            point_edge = np.array(point_edge, dtype=int)
+            points = np.array(points, dtype=float)
+            forces = np.array(forces, dtype=float)
+
+            # orient the force of every interface away from its support
+            edge_force = np.zeros((count, 3))
+            edge_point = np.zeros((count, 3))
+            np.add.at(edge_force, point_edge, forces)
+            np.add.at(edge_point, point_edge, points)
+            edge_point /= np.bincount(point_edge)[:, None]
+            edge_row = np.zeros(count, dtype=int)
+            edge_row[point_edge] = point_row
+            sign = np.where(np.einsum("ij,ij->i", edge_force, edge_point - centroids[edge_row]) < 0, -1.0, 1.0)
+            forces *= sign[point_edge][:, None]
+
+            np.add.at(reactions, point_row, forces)
+            np.add.at(moments, point_row, np.cross(points - centroids[point_row], forces))
+
+        # the point of the central axis closest to the centroid
+        squared = np.einsum("ij,ij->i", reactions, reactions)
+        offsets = np.zeros_like(centroids)
+        nonzero = squared > 0
+        offsets[nonzero] = np.cross(reactions[nonzero], moments[nonzero]) / squared[nonzero][:, None]
+
+        return nodes, reactions, moments, centroids + offsets
+
     # =============================================================================
     # Contacts
     # =============================================================================
@@ -422,4 +985,9 @@ class BlockModel(Model):
         minimum_area=0.01,
         contacttype: Type[Contact] = FrictionContact,
     ) -> None:
-        return super().compute_contacts(tolerance, minimum_area, contacttype)
+        tracer = current_tracer()
+        with tracer.span("model.compute_contacts", blocks=self.graph.number_of_nodes()) as span:
+            super().compute_contacts(tolerance, minimum_area, contacttype)
+            contacts = sum(len(self.graph.edge_attribute(edge, "contacts") or []) for edge in self.graph.edges())
+            span["contacts"] = contacts
+        tracer.count("contacts", contacts)
@@ -1,3 +1,5 @@
+from typing import Union
+
 import numpy as np
 import pythreejs as three
 
@@ -9,7 +11,7 @@ from compas.geometry import earclip_polygon
 
 def meshes_to_edgesbuffer(
     meshes: list[Mesh],
-    color: Color,
+    color: Union[Color, list[Color]],
 ) -> three.LineSegments:
     """Convert the combined edges of a collection of meshes to one line segment buffer.
 
@@ -17,40 +19,26 @@ def meshes_to_edgesbuffer(
     ----------
     meshes : list[:class:`compas.datastructures.Mesh`]
         The mesh collection.
-    color : :class:`compas.colors.Color`
-        The color of the edges.
+    color : :class:`compas.colors.Color` | list[:class:`compas.colors.Color`]
+        The color of the edges, or one color per mesh.
 
     Returns
     -------
     pythreejs.LineSegments
 
     """
-    positions = []
-    colors = []
-
-    for mesh in meshes:
-        buffer = mesh_to_edgesbuffer(mesh, color)
-        positions += buffer[0]
-        colors += buffer[1]
-
-    positions = np.array(positions, dtype=np.float32)
-    colors = np.array(colors, dtype=np.float32)
-
-    geometry = three.BufferGeometry(
-        attributes={
-            "position": three.BufferAttribute(positions, normalized=False),
-            "color": three.BufferAttribute(colors, normalized=False, itemSize=3),
-        }
-    )
+    vertices, faces, vertex_mesh = meshes_to_vertices_and_faces_numpy(meshes)
+    edges = faces_to_edges_numpy(faces)
 
-    material = three.LineBasicMaterial(vertexColors="VertexColors")
+    positions = vertices[edges].reshape(-1, 3)
+    colors = colors_numpy(color, np.repeat(vertex_mesh[edges[:, 0]], 2))
 
-    return three.LineSegments(geometry, material)
+    return edgesbuffer_numpy(positions, colors)
 
 
 def meshes_to_facesbuffer(
     meshes: list[Mesh],
-    color: Color,
+    color: Union[Color, list[Color]],
 ) -> three.Mesh:
     """Convert the combined faces of a collection of meshes to one mesh buffer.
 
@@ -58,29 +46,69 @@ def meshes_to_facesbuffer(
     ----------
     meshes : list[:class:`compas.datastructures.Mesh`]
         The mesh collection.
-    color : :class:`compas.colors.Color`
-        The color of the faces.
+    color : :class:`compas.colors.Color` | list[:class:`compas.colors.Color`]
+        The color of the faces, or one color per mesh.
 
     Returns
     -------
     pythreejs.Mesh
 
     """
-    positions = []
-    colors = []
+    vertices, faces, vertex_mesh = meshes_to_vertices_and_faces_numpy(meshes)
+    triangles = faces_to_triangles_numpy(vertices, faces)
+
+    positions = vertices[triangles].reshape(-1, 3)
+    colors = colors_numpy(color, np.repeat(vertex_mesh[triangles[:, 0]], 3))
+
+    return facesbuffer_numpy(positions, colors)
+
+
+def edgesbuffer_numpy(positions: np.ndarray, colors: np.ndarray) -> three.LineSegments:
+    """Create a line segment buffer from arrays.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        The start and end points of the segments, as an array of shape ``(2 * n, 3)``.
+    colors : numpy.ndarray
+        The RGB values of the points, as an array of shape ``(2 * n, 3)``.
+
+    Returns
+    -------
+    pythreejs.LineSegments
+
+    """
+    geometry = three.BufferGeometry(
+        attributes={
+            "position": three.BufferAttribute(np.asarray(positions, dtype=np.float32), normalized=False),
+            "color": three.BufferAttribute(np.asarray(colors, dtype=np.float32), normalized=False, itemSize=3),
+        }
+    )
+
+    material = three.LineBasicMaterial(vertexColors="VertexColors")
+
+    return three.LineSegments(geometry, material)
 
-    for mesh in meshes:
-        buffer = mesh_to_facesbuffer(mesh, color)
-        positions += buffer[0]
-        colors += buffer[1]
 
-    positions = np.array(positions, dtype=np.float32)
-    colors = np.array(colors, dtype=np.float32)
+def facesbuffer_numpy(positions: np.ndarray, colors: np.ndarray) -> three.Mesh:
+    """Create a mesh buffer from arrays.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        The corners of the triangles, as an array of shape ``(3 * n, 3)``.
+    colors : numpy.ndarray
+        The RGB values of the corners, as an array of shape ``(3 * n, 3)``.
+
+    Returns
+    -------
+    pythreejs.Mesh
 
+    """
     geometry = three.BufferGeometry(
         attributes={
-            "position": three.BufferAttribute(positions, normalized=False),
-            "color": three.BufferAttribute(colors, normalized=False, itemSize=3),
+            "position": three.BufferAttribute(np.asarray(positions, dtype=np.float32), normalized=False),
+            "color": three.BufferAttribute(np.asarray(colors, dtype=np.float32), normalized=False, itemSize=3),
         }
     )
 
@@ -92,6 +120,182 @@ def meshes_to_facesbuffer(
     return three.Mesh(geometry, material)
 
 
+# =============================================================================
+# Array helpers
+# =============================================================================
+
+
+def meshes_to_vertices_and_faces_numpy(meshes: list[Mesh]) -> tuple[np.ndarray, dict[int, np.ndarray], np.ndarray]:
+    """Concatenate the vertices and faces of a collection of meshes.
+
+    Parameters
+    ----------
+    meshes : list[:class:`compas.datastructures.Mesh`]
+        The mesh collection.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, dict[int, numpy.ndarray], numpy.ndarray]
+        0. The vertex coordinates of all meshes as an array of shape ``(v, 3)``.
+        1. The faces of all meshes grouped per degree, as arrays of shape ``(f, degree)`` of indices into the vertex array.
+        2. The index of the mesh of every vertex as an array of shape ``(v,)``.
+
+    """
+    xyz: list[list[float]] = []
+    counts: list[int] = []
+    faces: dict[int, list[list[int]]] = {}
+    offsets: dict[int, list[int]] = {}
+
+    for mesh in meshes:
+        keys = list(mesh.vertex)
+        offset = len(xyz)
+        xyz += [[attr["x"], attr["y"], attr["z"]] for attr in mesh.vertex.values()]
+        counts.append(len(keys))
+
+        if keys == list(range(len(keys))):
+            cycles = mesh.face.values()
+        else:
+            index = {key: i for i, key in enumerate(keys)}
+            cycles = [[index[key] for key in cycle] for cycle in mesh.face.values()]
+
+        for cycle in cycles:
+            degree = len(cycle)
+            if degree not in faces:
+                faces[degree] = []
+                offsets[degree] = []
+            faces[degree].append(cycle)
+            offsets[degree].append(offset)
+
+    vertices = np.array(xyz, dtype=float).reshape(-1, 3)
+    faces_numpy = {degree: np.array(faces[degree], dtype=int) + np.array(offsets[degree], dtype=int)[:, None] for degree in sorted(faces)}
+    vertex_mesh = np.repeat(np.arange(len(counts)), counts)
+
+    return vertices, faces_numpy, vertex_mesh
+
+
+def polygons_to_vertices_and_faces_numpy(polygons: list[list[list[float]]]) -> tuple[np.ndarray, dict[int, np.ndarray], np.ndarray]:
+    """Concatenate the corners of a collection of polygons.
+
+    Parameters
+    ----------
+    polygons : list[list[[float, float, float]]]
+        The corner coordinates of the polygons.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, dict[int, numpy.ndarray], numpy.ndarray]
+        0. The corners of all polygons as an array of shape ``(v, 3)``.
+        1. The polygons grouped per degree, as arrays of shape ``(f, degree)`` of indices into the corner array.
+        2. The index of the polygon of every corner as an array of shape ``(v,)``.
+
+    """
+    counts = [len(points) for points in polygons]
+    vertices = np.array([point for points in polygons for point in points], dtype=float).reshape(-1, 3)
+    vertex_polygon = np.repeat(np.arange(len(counts)), counts)
+    starts = np.cumsum([0] + counts[:-1]).astype(int)
+
+    faces: dict[int, np.ndarray] = {}
+    degrees = np.array(counts, dtype=int)
+    for degree in np.unique(degrees):
+        faces[int(degree)] = starts[degrees == degree][:, None] + np.arange(degree)
+
+    return vertices, faces, vertex_polygon
+
+
+def faces_to_triangles_numpy(vertices: np.ndarray, faces: dict[int, np.ndarray]) -> np.ndarray:
+    """Triangulate faces grouped per degree.
+
+    Parameters
+    ----------
+    vertices : numpy.ndarray
+        The vertex coordinates as an array of shape ``(v, 3)``.
+    faces : dict[int, numpy.ndarray]
+        The faces grouped per degree, as arrays of shape ``(f, degree)``.
+
+    Returns
+    -------
+    numpy.ndarray
+        The triangles as an array of shape ``(t, 3)`` of indices into the vertex array.
+
+    Notes
+    -----
+    Triangles are kept, quads are split along the diagonal from the first corner,
+    and convex faces of higher degree are fan-triangulated from the first corner.
+    Only the non-convex faces of higher degree are triangulated one by one, by ear clipping.
+
+    """
+    triangles = [np.zeros((0, 3), dtype=int)]
+
+    for degree, cycles in faces.items():
+        if degree < 3 or not len(cycles):
+            continue
+        if degree > 4:
+            convex = _faces_convex_numpy(vertices[cycles])
+            for cycle in cycles[~convex]:
+                ears: list[list[int]] = earclip_polygon(Polygon(vertices[cycle].tolist()))  # type: ignore
+                triangles.append(cycle[np.array(ears, dtype=int)])
+            cycles = cycles[convex]
+        fan = np.array([[0, i, i + 1] for i in range(1, degree - 1)])
+        triangles.append(cycles[:, fan].reshape(-1, 3))
+
+    return np.concatenate(triangles)
+
+
+def faces_to_edges_numpy(faces: dict[int, np.ndarray]) -> np.ndarray:
+    """Compute the unique edges of faces grouped per degree.
+
+    Parameters
+    ----------
+    faces : dict[int, numpy.ndarray]
+        The faces grouped per degree, as arrays of shape ``(f, degree)``.
+
+    Returns
+    -------
+    numpy.ndarray
+        The edges as an array of shape ``(e, 2)`` of indices into the vertex array.
+
+    """
+    edges = [np.zeros((0, 2), dtype=int)]
+    for cycles in faces.values():
+        edges.append(np.stack([cycles, np.roll(cycles, -1, axis=1)], axis=-1).reshape(-1, 2))
+    edges = np.sort(np.concatenate(edges), axis=1)
+    # unique pairs, through one integer key per pair
+    n = edges.max() + 1 if len(edges) else 0
+    keys = np.unique(edges[:, 0] * n + edges[:, 1])
+    return np.stack([keys // n, keys % n], axis=1)
+
+
+def colors_numpy(color: Union[Color, list[Color]], index: np.ndarray) -> np.ndarray:
+    """Pack the colors of the buffer vertices in a float array.
+
+    Parameters
+    ----------
+    color : :class:`compas.colors.Color` | list[:class:`compas.colors.Color`]
+        One color for all vertices, or one color per mesh.
+    index : numpy.ndarray
+        The index of the mesh of every buffer vertex.
+
+    Returns
+    -------
+    numpy.ndarray
+        The RGB values as an array of shape ``(len(index), 3)`` of type ``float32``.
+
+    """
+    if isinstance(color, Color):
+        colors = np.empty((len(index), 3), dtype=np.float32)
+        colors[:] = color.rgb
+        return colors
+    table = np.array([c.rgb for c in color], dtype=np.float32).reshape(-1, 3)
+    return table[index]
+
+
+def _faces_convex_numpy(points: np.ndarray) -> np.ndarray:
+    # a face is convex if the turn at every corner is in the direction of the face normal
+    turns = np.cross(points - np.roll(points, 1, axis=1), np.roll(points, -1, axis=1) - points)
+    normals = turns.sum(axis=1)
+    return np.all(np.einsum("ijk,ik->ij", turns, normals) >= 0, axis=1)
+
+
 def mesh_to_edgesbuffer(mesh: Mesh, color: Color) -> tuple[list[list[float]], list[Color]]:
     positions = []
     colors = []
@@ -1,18 +1,36 @@
 from typing import Optional
 from typing import Union
 
+import numpy as np
 import pythreejs as three
 from compas_notebook.scene import ThreeSceneObject
 
 from compas.colors import Color
+from compas.geometry import Transformation
+from compas_dem.elements import Block
 from compas_dem.models import BlockModel
 
+from .buffers import colors_numpy
+from .buffers import edgesbuffer_numpy
+from .buffers import faces_to_edges_numpy
+from .buffers import faces_to_triangles_numpy
+from .buffers import facesbuffer_numpy
 from .buffers import meshes_to_edgesbuffer
 from .buffers import meshes_to_facesbuffer
+from .buffers import meshes_to_vertices_and_faces_numpy
+from .buffers import polygons_to_vertices_and_faces_numpy
 
 
 class ThreeBlockModelObject(ThreeSceneObject):
-    """Scene object for drawing mesh."""
+    """Scene object for drawing mesh.
+
+    Notes
+    -----
+    The buffers of the blocks, supports and contacts are created once, by the first call to :meth:`draw`.
+    Subsequent calls only move the blocks of which the transformation has changed, see :meth:`update`.
+    The buffers are recreated if blocks are added or removed, or if the supports change.
+
+    """
 
     def __init__(
         self,
@@ -34,6 +52,10 @@ class ThreeBlockModelObject(ThreeSceneObject):
         self.color_supports = Color.red().lightened(50)
         self.color_contacts = Color.cyan().lightened(75)
 
+        self.transformations: dict[int, Transformation] = {}
+        self._buffers: Optional[dict[str, dict]] = None
+        self._topology: Optional[tuple] = None
+
     # @property
     # def settings(self) -> dict:
     #     settings = super().settings
@@ -47,37 +69,144 @@ class ThreeBlockModelObject(ThreeSceneObject):
     def model(self, model: BlockModel) -> None:
         self._item = model
         self._transformation = None
+        self._buffers = None
 
-    def draw(self):
+    def draw(self, rebuild: bool = False):
         """Draw the mesh associated with the scene object.
 
+        Parameters
+        ----------
+        rebuild : bool, optional
+            If True, recreate all buffers, for example after changing the geometry of the blocks.
+
         Returns
         -------
         list[three.Mesh, three.LineSegments]
             List of pythreejs objects created.
 
         """
-        self._guids = []
+        topology = self.model_topology()
+
+        if rebuild or self._buffers is None or topology != self._topology:
+            self._guids = []
+            self._buffers = {}
+            self._topology = topology
+
+            if self.show_blocks:
+                self._buffers["blocks"] = self._create_buffers(list(self.model.blocks()), self.color_blocks, self.show_blockfaces)
+
+            if self.show_supports:
+                self._buffers["supports"] = self._create_buffers(list(self.model.supports()), self.color_supports, True)
 
-        if self.show_blocks:
-            facesbuffer, edgesbuffer = self.draw_blocks()
-            if facesbuffer:
+            if self.show_contacts:
+                facesbuffer, edgesbuffer = self.draw_contacts()
                 self._guids.append(facesbuffer)
-            if edgesbuffer:
                 self._guids.append(edgesbuffer)
 
-        if self.show_supports:
-            facesbuffer, edgesbuffer = self.draw_supports()
-            self._guids.append(facesbuffer)
-            self._guids.append(edgesbuffer)
-
-        if self.show_contacts:
-            facesbuffer, edgesbuffer = self.draw_contacts()
-            self._guids.append(facesbuffer)
-            self._guids.append(edgesbuffer)
+        self._update_buffers()
 
         return self.guids
 
+    def update(self, transformations: Optional[dict[int, Transformation]] = None) -> list[int]:
+        """Move the blocks of which the transformation has changed.
+
+        Parameters
+        ----------
+        transformations : dict[int, :class:`compas.geometry.Transformation`], optional
+            The transformations of the blocks per graph node, with respect to the model geometry.
+            Blocks without a transformation are not changed.
+            If None, the ``"transformation"`` node attributes of the model graph are used,
+            for example the results of :func:`compas_dem.analysis.lmgc90.lmgc90_solve`.
+
+        Returns
+        -------
+        list[int]
+            The graph nodes of the blocks that were moved.
+
+        Notes
+        -----
+        Only the positions of the moved blocks are recomputed.
+        The other buffer data, such as the triangulation and the colors, is reused.
+
+        """
+        if transformations is None:
+            transformations = {}
+            for node in self.model.graph.nodes():
+                transformation = self.model.graph.node_attribute(node, "transformation")
+                if transformation is not None:
+                    transformations[node] = transformation
+
+        self.transformations.update(transformations)
+
+        if self._buffers is None:
+            return []
+        return self._update_buffers()
+
+    def model_topology(self) -> tuple:
+        """Identify the blocks, supports and contacts of the model, to detect changes that require new buffers.
+
+        Returns
+        -------
+        tuple
+
+        """
+        return (
+            tuple(block.graphnode for block in self.model.blocks()),
+            tuple(block.graphnode for block in self.model.supports()),
+            self.model.graph.number_of_edges(),
+        )
+
+    def _create_buffers(self, blocks: list[Block], color: Color, show_faces: Union[bool, None]) -> dict:
+        # the persistent arrays of a group of blocks
+        vertices, faces, vertex_mesh = meshes_to_vertices_and_faces_numpy([block.modelgeometry for block in blocks])
+
+        group = {
+            "nodes": [block.graphnode for block in blocks],
+            "vertices": vertices,
+            "vertex_mesh": vertex_mesh,
+            "matrices": np.tile(np.eye(4), (len(blocks), 1, 1)),
+            "buffers": [],
+        }
+
+        if show_faces:
+            index = faces_to_triangles_numpy(vertices, faces).ravel()
+            buffer = facesbuffer_numpy(vertices[index], colors_numpy(color, vertex_mesh[index]))
+            group["buffers"].append((buffer, index))
+
+        index = faces_to_edges_numpy(faces).ravel()
+        buffer = edgesbuffer_numpy(vertices[index], colors_numpy(self.color_edges, vertex_mesh[index]))
+        group["buffers"].append((buffer, index))
+
+        for buffer, _ in group["buffers"]:
+            self._guids.append(buffer)
+
+        return group
+
+    def _update_buffers(self) -> list[int]:
+        # recompute the positions of the blocks of which the transformation changed
+        moved = []
+
+        for group in self._buffers.values():  # type: ignore
+            nodes = group["nodes"]
+            matrices = np.array([self.transformations[node].matrix if node in self.transformations else np.eye(4) for node in nodes]).reshape(-1, 4, 4)
+            changed = np.any(np.abs(matrices - group["matrices"]) > 1e-12, axis=(1, 2))
+            if not changed.any():
+                continue
+
+            group["matrices"] = matrices
+            moved += [node for node, flag in zip(nodes, changed) if flag]
+
+            for buffer, index in group["buffers"]:
+                rows = np.nonzero(changed[group["vertex_mesh"][index]])[0]
+                vertices = group["vertices"][index[rows]]
+                xform = matrices[group["vertex_mesh"][index[rows]]]
+                attribute = buffer.geometry.attributes["position"]
+                attribute.array[rows] = np.einsum("nij,nj->ni", xform[:, :3, :3], vertices) + xform[:, :3, 3]
+                # the array is modified in place, which is not detected as a change of the trait
+                attribute.send_state("array")
+
+        return moved
+
     def draw_blocks(self) -> tuple[Union[three.Mesh, None], three.LineSegments]:
         """Draw the blocks of the model."""
         meshes = [block.modelgeometry for block in self.model.blocks()]
@@ -102,10 +231,13 @@ class ThreeBlockModelObject(ThreeSceneObject):
 
     def draw_contacts(self) -> tuple[three.Mesh, three.LineSegments]:
         """Draw the contacts between the blocks."""
-        meshes = [contact.polygon.to_mesh() for contact in self.model.contacts()]
+        vertices, faces, _ = polygons_to_vertices_and_faces_numpy([contact.polygon.points for contact in self.model.contacts()])
 
-        facesbuffer = meshes_to_facesbuffer(meshes, self.color_contacts)
-        edgesbuffer = meshes_to_edgesbuffer(meshes, self.color_edges)
+        index = faces_to_triangles_numpy(vertices, faces).ravel()
+        facesbuffer = facesbuffer_numpy(vertices[index], colors_numpy(self.color_contacts, index))
+
+        index = faces_to_edges_numpy(faces).ravel()
+        edgesbuffer = edgesbuffer_numpy(vertices[index], colors_numpy(self.color_edges, index))
 
         return facesbuffer, edgesbuffer
 
@@ -130,9 +262,7 @@ class ThreeBlockModelObject(ThreeSceneObject):
         return meshes_to_edgesbuffer(meshes, self.color_edges)
 
     def draw_contactfaces(self):
-        meshes = [contact.polygon.to_mesh() for contact in self.model.contacts()]
-        return meshes_to_facesbuffer(meshes, self.color_contacts)
+        return self.draw_contacts()[0]
 
     def draw_contactedges(self):
-        meshes = [contact.polygon.to_mesh() for contact in self.model.contacts()]
-        return meshes_to_edgesbuffer(meshes, self.color_edges)
+        return self.draw_contacts()[1]
@@ -1,5 +1,39 @@
 from .boundary_conditions import BoundaryConditions
+from .fields import SampledField
+from .selectors import BlockQuery
+from .selectors import Selector
+from .selectors import InBox
+from .selectors import HalfSpace
+from .selectors import NearPlane
+from .selectors import Course
+from .selectors import Degree
 from .problem import Problem
 from .solvers import Solver
+from .backends import SolverBackend
+from .backends import LMGC90Backend
+from .backends import CRABackend
+from .backends import RBEBackend
+from .backends import register_solver_backend
+from .backends import solver_backend
+from .backends import solver_backends
 
-__all__ = ["BoundaryConditions", "Problem", "Solver"]
+__all__ = [
+    "BoundaryConditions",
+    "SampledField",
+    "BlockQuery",
+    "Selector",
+    "InBox",
+    "HalfSpace",
+    "NearPlane",
+    "Course",
+    "Degree",
+    "Problem",
+    "Solver",
+    "SolverBackend",
+    "LMGC90Backend",
+    "CRABackend",
+    "RBEBackend",
+    "register_solver_backend",
+    "solver_backend",
+    "solver_backends",
+]
@@ -0,0 +1,338 @@
+from typing import Any
+from typing import Optional
+
+from compas_dem.problem.problem import Problem
+
+SOLVER_BACKENDS: dict[str, "SolverBackend"] = {}
+
+CAPABILITIES = ("dynamic", "tension", "prescribed_displacements", "parallel_safe")
+
+
+class SolverBackend:
+    """Base class of the solver backends to which :meth:`compas_dem.problem.Problem.solve` dispatches.
+
+    A backend solves a problem in three stages, :meth:`prepare`, :meth:`solve` and :meth:`postprocess`,
+    such that drivers can run, cache or batch the stages of every backend in the same way.
+    The state passed between the stages is defined by the backend.
+
+    Attributes
+    ----------
+    name : str
+        The name of the solver configurations handled by the backend, see :class:`compas_dem.problem.Solver`.
+    dynamic : bool
+        True if the backend integrates the motion of the blocks in time, False if it solves for static equilibrium.
+    tension : bool
+        True if contacts can transfer tension.
+    prescribed_displacements : bool
+        True if prescribed displacements and rotations other than fixed supports are applied.
+    parallel_safe : bool
+        True if several problems can be solved at the same time in one process, for example in threads.
+        Backends that are not parallel-safe can still be run in separate worker processes,
+        see :class:`compas_dem.analysis.LMGC90Executor`.
+
+    Examples
+    --------
+    A third-party backend is registered under the name of its solver configurations.
+
+    >>> class MyBackend(SolverBackend):
+    ...     name = "MySolver"
+    ...     parallel_safe = True
+    ...
+    ...     def prepare(self, problem, **parameters):
+    ...         return {"problem": problem, "parameters": parameters}
+    ...
+    ...     def solve(self, state):
+    ...         state["result"] = "solved"
+    ...
+    ...     def postprocess(self, state):
+    ...         return state["result"]
+    >>> register_solver_backend(MyBackend())
+    >>> solver_backend("MySolver").capabilities()["parallel_safe"]
+    True
+
+    """
+
+    name: Optional[str] = None
+    dynamic: bool = False
+    tension: bool = False
+    prescribed_displacements: bool = False
+    parallel_safe: bool = False
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name})"
+
+    def capabilities(self) -> dict[str, bool]:
+        """Collect the capabilities of the backend.
+
+        Returns
+        -------
+        dict[str, bool]
+            The ``dynamic``, ``tension``, ``prescribed_displacements`` and ``parallel_safe`` flags.
+
+        """
+        return {name: getattr(self, name) for name in CAPABILITIES}
+
+    def check(self, problem: Problem) -> None:
+        """Check that the backend supports the conditions of a problem.
+
+        Parameters
+        ----------
+        problem : :class:`compas_dem.problem.Problem`
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the problem has prescribed displacements other than fixed supports,
+            and the backend does not apply them.
+
+        """
+        if self.prescribed_displacements:
+            return
+        nodes, mask, values = problem.boundary_conditions.dof_table()
+        fixed = (mask & (values == 0.0)).all(axis=1)
+        if mask[~fixed].any():
+            raise ValueError(f"Solver '{self.name}' does not support prescribed displacements other than fixed supports.")
+
+    def prepare(self, problem: Problem, **parameters) -> Any:
+        """Translate a problem to the input of the solver.
+
+        Parameters
+        ----------
+        problem : :class:`compas_dem.problem.Problem`
+        **parameters : dict, optional
+            The parameters of the solver configuration.
+
+        Returns
+        -------
+        Any
+            The state of the solve.
+
+        """
+        raise NotImplementedError
+
+    def solve(self, state: Any) -> None:
+        """Run the solver.
+
+        Parameters
+        ----------
+        state : Any
+            The state returned by :meth:`prepare`.
+
+        Returns
+        -------
+        None
+
+        """
+        raise NotImplementedError
+
+    def postprocess(self, state: Any) -> Any:
+        """Write the results of the solver to the model of the problem.
+
+        Parameters
+        ----------
+        state : Any
+            The state returned by :meth:`prepare`, after :meth:`solve`.
+
+        Returns
+        -------
+        Any
+            The result of the solve, if any.
+
+        """
+        raise NotImplementedError
+
+    def run(self, problem: Problem, **parameters) -> Any:
+        """Check, prepare, solve and postprocess a problem.
+
+        Parameters
+        ----------
+        problem : :class:`compas_dem.problem.Problem`
+        **parameters : dict, optional
+            The parameters of the solver configuration.
+
+        Returns
+        -------
+        Any
+            The result of :meth:`postprocess`.
+
+        """
+        self.check(problem)
+        state = self.prepare(problem, **parameters)
+        self.solve(state)
+        return self.postprocess(state)
+
+
+class LMGC90Backend(SolverBackend):
+    """Dynamic contact simulation with LMGC90, see :class:`compas_dem.analysis.LMGC90Session`.
+
+    The state is the session, which is closed after post-processing.
+    LMGC90 keeps one simulation per process, so the backend is not parallel-safe.
+
+    """
+
+    name = "LMGC90"
+    dynamic = True
+    prescribed_displacements = True
+
+    def prepare(
+        self,
+        problem: Problem,
+        contact_law: str = "IQS_CLB",
+        duration: Optional[float] = None,
+        n_steps: Optional[int] = None,
+        dt: Optional[float] = None,
+        theta: float = 0.5,
+        urf_threshold: Optional[float] = None,
+        track_block: Optional[int] = None,
+    ):
+        from compas_dem.analysis.lmgc90 import LMGC90Session
+
+        session = LMGC90Session(problem, contact_law=contact_law, theta=theta)
+        session.setup(duration=duration, n_steps=n_steps, dt=dt)
+        return session, {"urf_threshold": urf_threshold, "track_block": track_block}
+
+    def solve(self, state) -> None:
+        session, parameters = state
+        session.run(postprocess=False, **parameters)
+
+    def postprocess(self, state) -> None:
+        session, _ = state
+        try:
+            session.postprocess()
+        finally:
+            session.close()
+
+
+class CRABackend(SolverBackend):
+    """Static equilibrium with the penalty formulation of CRA, see :func:`compas_dem.analysis.cra.cra_solve`.
+
+    The state is a dict with the assembly and the parameters of the solve.
+
+    """
+
+    name = "CRA"
+    parallel_safe = True
+
+    def prepare(
+        self,
+        problem: Problem,
+        method: str = "cra",
+        mu: Optional[float] = None,
+        d_bnd: float = 0.01,
+        eps: float = 0.001,
+        verbose: bool = True,
+        timer: bool = False,
+    ) -> dict:
+        from compas_dem.analysis.cra import _prepare_cra
+
+        assembly, mu, density = _prepare_cra(problem, mu=mu)
+        return {
+            "problem": problem,
+            "assembly": assembly,
+            "density": density,
+            "parameters": {"method": method, "mu": mu, "d_bnd": d_bnd, "eps": eps, "verbose": verbose, "timer": timer},
+        }
+
+    def solve(self, state: dict) -> None:
+        from compas_dem.analysis.cra import _run_cra
+
+        _run_cra(state["assembly"], **state["parameters"])
+
+    def postprocess(self, state: dict) -> None:
+        from compas_dem.analysis.cra import _post_processing_cra
+        from compas_dem.instrumentation import current_tracer
+
+        with current_tracer().span("cra.post_processing"):
+            _post_processing_cra(state["assembly"], state["problem"], density=state["density"])
+
+
+class RBEBackend(CRABackend):
+    """Static equilibrium with the rigid block equilibrium formulation of CRA.
+
+    Unlike CRA, the contact forces may include tension, which is minimised rather than excluded.
+
+    """
+
+    name = "RBE"
+    tension = True
+
+    def prepare(self, problem: Problem, method: str = "rbe", **parameters) -> dict:
+        return super().prepare(problem, method=method, **parameters)
+
+
+def register_solver_backend(backend: SolverBackend, replace: bool = False) -> None:
+    """Register a solver backend under its name.
+
+    Parameters
+    ----------
+    backend : :class:`SolverBackend`
+    replace : bool, optional
+        If True, replace a backend registered under the same name.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If the backend has no name, or a backend with the same name is registered and `replace` is False.
+
+    Notes
+    -----
+    :meth:`compas_dem.problem.Problem.solve_async` sends the registered backend to its worker process,
+    so the module that defines the class of the backend should be importable there.
+    Other worker processes started with ``"spawn"`` only know the backends registered on import of the modules they load.
+
+    """
+    if not backend.name:
+        raise ValueError("A solver backend should have a name.")
+    if backend.name in SOLVER_BACKENDS and not replace:
+        raise ValueError(f"A solver backend named '{backend.name}' is already registered.")
+    SOLVER_BACKENDS[backend.name] = backend
+
+
+def solver_backend(name: str) -> SolverBackend:
+    """Get a registered solver backend.
+
+    Parameters
+    ----------
+    name : str
+        The name of the backend, which is the name of its solver configurations.
+
+    Returns
+    -------
+    :class:`SolverBackend`
+
+    Raises
+    ------
+    ValueError
+        If no backend is registered under the name.
+
+    """
+    try:
+        return SOLVER_BACKENDS[name]
+    except KeyError:
+        available = ", ".join(f"'{name}'" for name in SOLVER_BACKENDS)
+        raise ValueError(f"Solver '{name}' is not recognised. Available: {available}.") from None
+
+
+def solver_backends() -> dict[str, dict[str, bool]]:
+    """Collect the capabilities of all registered solver backends.
+
+    Returns
+    -------
+    dict[str, dict[str, bool]]
+        The capabilities per backend name, see :meth:`SolverBackend.capabilities`.
+
+    """
+    return {name: backend.capabilities() for name, backend in SOLVER_BACKENDS.items()}
+
+
+register_solver_backend(LMGC90Backend())
+register_solver_backend(CRABackend())
+register_solver_backend(RBEBackend())
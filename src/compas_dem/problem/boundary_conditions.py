@@ -1,4 +1,9 @@
+import math
+from typing import Callable
 from typing import Optional
+from typing import Union
+
+import numpy as np
 
 from compas.data import Data
 from compas.geometry import Polygon
@@ -25,13 +30,24 @@ class BoundaryConditions(Data):
     >>> bc.add_point_load(block_index=10, force=[0, 0, -5000])
     >>> bc.add_support(block_index=0)
     >>> bc.add_support(block_index=99)
+
+    Notes
+    -----
+    The point and surface loads are stored column by column, such that thousands of loads,
+    for example the hydrostatic pressure on the faces of a wall, can be added with :meth:`add_point_loads`
+    and :meth:`add_surface_loads`, and resolved to the block centroids with :meth:`resolve_loads_numpy`.
+    The corners of all loaded polygons are stored in one list, with the offsets of the polygons in that list.
     """
 
     def __init__(self, gravity: bool = False, g: float = 9.81, name: Optional[str] = None, **kwargs) -> None:
         self._body_forces: list[list[float]] = []
-        self._point_loads: list[dict] = []
-        self._surface_loads: list[dict] = []
+        self._body_force_fields: list[Callable] = []
+        self._point_columns: dict[str, list] = {"block_index": [], "force": [], "moment": [], "point": [], "ramp": []}
+        self._surface_columns: dict[str, list] = {"block_index": [], "magnitude": [], "direction": [], "offsets": [0], "points": []}
+        self._point_table: Optional[tuple[np.ndarray, ...]] = None
+        self._surface_table: Optional[tuple[np.ndarray, ...]] = None
         self._displacements: list[dict] = []
+        self._dof_table: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None
 
         super().__init__(name=name)
 
@@ -40,13 +56,17 @@ class BoundaryConditions(Data):
 
     @property
     def __data__(self) -> dict:
+        for field in self._body_force_fields:
+            if not isinstance(field, Data):
+                raise TypeError(f"The body force field {field!r} cannot be serialised. Use a compas.data.Data field, such as SampledField.")
         return {
             "name": self.name,
             "gravity": self.gravity,
             "g": self.g,
             "body_forces": self._body_forces,
-            "point_loads": self._point_loads,
-            "surface_loads": self._surface_loads,
+            "body_force_fields": self._body_force_fields,
+            "point_loads": self.point_loads,
+            "surface_loads": self.surface_loads,
             "displacements": self._displacements,
         }
 
@@ -58,9 +78,13 @@ class BoundaryConditions(Data):
             name=data.get("name"),
         )
         obj._body_forces = data["body_forces"]
-        obj._point_loads = data["point_loads"]
-        obj._surface_loads = data["surface_loads"]
+        obj._body_force_fields = data.get("body_force_fields", [])
+        for entry in data["point_loads"]:
+            obj.add_point_load(**entry)
+        for entry in data["surface_loads"]:
+            obj.add_surface_load(**entry)
         obj._displacements = data["displacements"]
+        obj._dof_table = None
         return obj
 
     # =========================================================================
@@ -89,6 +113,34 @@ class BoundaryConditions(Data):
         """
         self._body_forces.append([ax, ay, az])
 
+    def add_body_force_field(self, field: Callable) -> None:
+        """Add a body acceleration that varies over the blocks.
+
+        The resultant force on each block is the acceleration at its centroid times its mass.
+
+        Parameters
+        ----------
+        field : callable
+            A function that computes the accelerations in [m/s²] at an array of points of shape ``(n, 3)``,
+            as an array of shape ``(n, 3)``, or a :class:`compas_dem.problem.SampledField`.
+            The function is called once with the centroids of all blocks.
+
+        Notes
+        -----
+        Only fields that are :class:`compas.data.Data`, such as :class:`compas_dem.problem.SampledField`,
+        can be serialised with the boundary conditions.
+        Serialising boundary conditions with other fields raises a :class:`TypeError`.
+
+        Examples
+        --------
+        An inverted-triangular seismic profile, with a peak acceleration of 0.3 g at a height of 12 m.
+
+        >>> bc = BoundaryConditions(gravity=True)
+        >>> bc.add_body_force_field(lambda points: np.outer(points[:, 2] / 12.0, [0.3 * 9.81, 0.0, 0.0]))
+
+        """
+        self._body_force_fields.append(field)
+
     def add_point_load(
         self,
         block_index: int,
@@ -122,19 +174,63 @@ class BoundaryConditions(Data):
         ValueError
             If both `moment` and `point` are provided.
         """
-        if moment is not None and point is not None:
+        self.add_point_loads(
+            [block_index],
+            [force],
+            moments=None if moment is None else [moment],
+            points=None if point is None else [point],
+            loading_type=loading_type,
+        )
+
+    def add_point_loads(
+        self,
+        block_indices: Union[list[int], np.ndarray],
+        forces: Union[list[list[float]], np.ndarray],
+        moments: Optional[Union[list[list[float]], np.ndarray]] = None,
+        points: Optional[Union[list[list[float]], np.ndarray]] = None,
+        loading_type: str = "ramp",
+    ) -> None:
+        """Add concentrated forces to many blocks at once.
+
+        Parameters
+        ----------
+        block_indices : list[int] | numpy.ndarray
+            Graph node indices of the target blocks, one per load.
+        forces : list[list[float]] | numpy.ndarray
+            Force vectors, as an array of shape ``(n, 3)``, or a single vector for all loads.
+        moments : list[list[float]] | numpy.ndarray, optional
+            Moment vectors applied at the centroids, as an array of shape ``(n, 3)``, or a single vector for all loads.
+            Cannot be combined with `points`.
+        points : list[list[float]] | numpy.ndarray, optional
+            Application points, as an array of shape ``(n, 3)``, or a single vector for all loads.
+            Cannot be combined with `moments`.
+        loading_type : str, optional
+            Time-series shape used by the solver for all loads, see :meth:`add_point_load`.
+
+        Raises
+        ------
+        ValueError
+            If both `moments` and `points` are provided.
+            If the shapes of the arrays do not match.
+        """
+        if moments is not None and points is not None:
             raise ValueError("Provide either `moment` or `point`, not both.")
         if loading_type not in ("ramp", "instantaneous"):
             raise ValueError("loading_type must be 'ramp' or 'instantaneous'.")
-        self._point_loads.append(
-            {
-                "block_index": block_index,
-                "force": force,
-                "moment": moment,
-                "point": point,
-                "loading_type": loading_type,
-            }
-        )
+
+        block_indices = np.asarray(block_indices, dtype=int).reshape(-1)
+        n = len(block_indices)
+        forces = _vectors(forces, n, "forces")
+        moments = _vectors(moments, n, "moments")
+        points = _vectors(points, n, "points")
+
+        columns = self._point_columns
+        columns["block_index"] += block_indices.tolist()
+        columns["force"] += forces.tolist()
+        columns["moment"] += moments.tolist()
+        columns["point"] += points.tolist()
+        columns["ramp"] += [loading_type == "ramp"] * n
+        self._point_table = None
 
     def add_surface_load(
         self,
@@ -156,15 +252,202 @@ class BoundaryConditions(Data):
         direction : list[float], optional
             Unit vector [dx, dy, dz]. If ``None``, the polygon outward normal is used.
         """
-        self._surface_loads.append(
-            {
-                "block_index": block_index,
-                "polygon": polygon,
-                "magnitude": magnitude,
-                "direction": direction,
-            }
+        self.add_surface_loads(
+            [block_index],
+            [polygon],
+            [magnitude],
+            directions=None if direction is None else [direction],
         )
 
+    def add_surface_loads(
+        self,
+        block_indices: Union[list[int], np.ndarray],
+        polygons: list[Union[Polygon, list[list[float]], np.ndarray]],
+        magnitudes: Union[list[float], np.ndarray],
+        directions: Optional[Union[list[list[float]], np.ndarray]] = None,
+    ) -> None:
+        """Add distributed pressure loads over many polygons at once.
+
+        Parameters
+        ----------
+        block_indices : list[int] | numpy.ndarray
+            Graph node indices of the target blocks, one per load.
+        polygons : list[:class:`compas.geometry.Polygon` | list[list[float]] | numpy.ndarray]
+            The loaded polygons, or the coordinates of their corners.
+        magnitudes : list[float] | numpy.ndarray
+            Pressure magnitudes in [N/m²].
+        directions : list[list[float]] | numpy.ndarray, optional
+            Unit vectors, as an array of shape ``(n, 3)``, or a single vector for all loads.
+            If ``None``, the normals of the polygons are used.
+
+        Raises
+        ------
+        ValueError
+            If the numbers of block indices, polygons, magnitudes and directions do not match.
+            If a polygon has less than three corners.
+        """
+        block_indices = np.asarray(block_indices, dtype=int).reshape(-1)
+        n = len(block_indices)
+        magnitudes = np.asarray(magnitudes, dtype=float).reshape(-1)
+        if len(polygons) != n or len(magnitudes) != n:
+            raise ValueError("The numbers of block indices, polygons and magnitudes do not match.")
+        directions = _vectors(directions, n, "directions")
+
+        columns = self._surface_columns
+        offset = columns["offsets"][-1]
+        offsets = []
+        for polygon in polygons:
+            points = polygon.points if isinstance(polygon, Polygon) else polygon
+            points = np.asarray(points, dtype=float).reshape(-1, 3)
+            if len(points) < 3:
+                raise ValueError("A loaded polygon needs at least three corners.")
+            columns["points"] += points.tolist()
+            offset += len(points)
+            offsets.append(offset)
+
+        columns["block_index"] += block_indices.tolist()
+        columns["magnitude"] += magnitudes.tolist()
+        columns["direction"] += directions.tolist()
+        columns["offsets"] += offsets
+        self._surface_table = None
+
+    def point_load_table(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Collect the point loads in arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            0. The graph nodes of the loaded blocks, as an array of shape ``(n,)``.
+            1. The forces, as an array of shape ``(n, 3)``.
+            2. The moments, as an array of shape ``(n, 3)``, with NaN if no moment was given.
+            3. The application points, as an array of shape ``(n, 3)``, with NaN if no point was given.
+            4. Flags indicating ramp loading, as a boolean array of shape ``(n,)``.
+
+        Notes
+        -----
+        The table is cached, and recomputed after point loads are added.
+
+        """
+        if self._point_table is None:
+            columns = self._point_columns
+            self._point_table = (
+                np.array(columns["block_index"], dtype=int),
+                np.array(columns["force"], dtype=float).reshape(-1, 3),
+                np.array(columns["moment"], dtype=float).reshape(-1, 3),
+                np.array(columns["point"], dtype=float).reshape(-1, 3),
+                np.array(columns["ramp"], dtype=bool),
+            )
+        return self._point_table
+
+    def surface_load_table(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Collect the surface loads in arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            0. The graph nodes of the loaded blocks, as an array of shape ``(n,)``.
+            1. The pressure magnitudes, as an array of shape ``(n,)``.
+            2. The directions, as an array of shape ``(n, 3)``, with NaN if the polygon normal is used.
+            3. The offsets of the polygons in the corner array, as an array of shape ``(n + 1,)``.
+            4. The corners of all polygons, as an array of shape ``(k, 3)``.
+
+        Notes
+        -----
+        The corners of polygon ``i`` are ``points[offsets[i]:offsets[i + 1]]``.
+        The table is cached, and recomputed after surface loads are added.
+
+        """
+        if self._surface_table is None:
+            columns = self._surface_columns
+            self._surface_table = (
+                np.array(columns["block_index"], dtype=int),
+                np.array(columns["magnitude"], dtype=float),
+                np.array(columns["direction"], dtype=float).reshape(-1, 3),
+                np.array(columns["offsets"], dtype=int),
+                np.array(columns["points"], dtype=float).reshape(-1, 3),
+            )
+        return self._surface_table
+
+    def resolve_loads_numpy(
+        self,
+        nodes: Union[list[int], np.ndarray],
+        centroids: np.ndarray,
+        masses: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Resolve all loads to equivalent forces and moments at the block centroids.
+
+        Parameters
+        ----------
+        nodes : list[int] | numpy.ndarray
+            The graph nodes of the blocks, as an array of shape ``(b,)``.
+        centroids : numpy.ndarray
+            The centroids of the blocks, as an array of shape ``(b, 3)``.
+        masses : numpy.ndarray
+            The masses of the blocks, as an array of shape ``(b,)``.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            0. The forces, as an array of shape ``(b, 3)``.
+            1. The moments about the centroids, as an array of shape ``(b, 3)``.
+            2. Flags indicating ramp loading, as a boolean array of shape ``(b,)``.
+               The loading type of a block is that of the last point load applied to it.
+
+        Raises
+        ------
+        KeyError
+            If a load is applied to a block that is not in `nodes`.
+
+        Notes
+        -----
+        The area, centroid and normal of the loaded polygons are computed in the same way as
+        :func:`compas.geometry.area_polygon`, :func:`compas.geometry.centroid_polygon` and :func:`compas.geometry.normal_polygon`,
+        from the triangles connecting the edges of the polygons to the averages of their corners.
+        The direction of a non-planar polygon is the average normal of these triangles,
+        which differs slightly from the normal of the best-fit plane of :attr:`compas.geometry.Polygon.normal`.
+
+        """
+        nodes = np.asarray(nodes, dtype=int).reshape(-1)
+        centroids = np.asarray(centroids, dtype=float).reshape(-1, 3)
+        masses = np.asarray(masses, dtype=float).reshape(-1)
+        row = {node: i for i, node in enumerate(nodes.tolist())}
+
+        forces = np.zeros((len(nodes), 3))
+        moments = np.zeros((len(nodes), 3))
+        ramp = np.ones(len(nodes), dtype=bool)
+
+        acceleration = np.sum(self._body_forces, axis=0) if self._body_forces else np.zeros(3)
+        if self.gravity:
+            acceleration = acceleration + [0.0, 0.0, -self.g]
+        forces += masses[:, None] * acceleration
+        for field in self._body_force_fields:
+            forces += masses[:, None] * np.broadcast_to(np.asarray(field(centroids), dtype=float), forces.shape)
+
+        blocks, point_forces, point_moments, points, point_ramp = self.point_load_table()
+        if len(blocks):
+            rows = np.array([row[node] for node in blocks.tolist()], dtype=int)
+            arms = points - centroids[rows]
+            point_moments = np.where(np.isnan(point_moments), 0.0, point_moments)
+            point_moments = np.where(np.isnan(arms), point_moments, np.cross(np.nan_to_num(arms), point_forces))
+            np.add.at(forces, rows, point_forces)
+            np.add.at(moments, rows, point_moments)
+            last = np.full(len(nodes), -1)
+            np.maximum.at(last, rows, np.arange(len(rows)))
+            loaded = last >= 0
+            ramp[loaded] = point_ramp[last[loaded]]
+
+        blocks, magnitudes, directions, offsets, corners = self.surface_load_table()
+        if len(blocks):
+            rows = np.array([row[node] for node in blocks.tolist()], dtype=int)
+            areas, barycenters, normals = _polygons_numpy(corners, offsets)
+            directions = np.where(np.isnan(directions), normals, directions)
+            surface_forces = directions * (magnitudes * areas)[:, None]
+            surface_moments = np.cross(barycenters - centroids[rows], surface_forces)
+            np.add.at(forces, rows, surface_forces)
+            np.add.at(moments, rows, surface_moments)
+
+        return forces, moments, ramp
+
     # =========================================================================
     # Displacement BCs
     # =========================================================================
@@ -185,7 +468,7 @@ class BoundaryConditions(Data):
         dx, dy, dz : float, optional
             Displacement components in [m]. ``None`` leaves that DOF unconstrained.
         """
-        self._displacements.append(
+        self._add_displacement_entry(
             {
                 "block_index": block_index,
                 "translation": [dx, dy, dz],
@@ -203,7 +486,7 @@ class BoundaryConditions(Data):
         rotation : list[float]
             Rotation vector [rx, ry, rz] in [rad].
         """
-        self._displacements.append(
+        self._add_displacement_entry(
             {
                 "block_index": block_index,
                 "translation": None,
@@ -219,7 +502,7 @@ class BoundaryConditions(Data):
         block_index : int
             Graph node index of the block to fix.
         """
-        self._displacements.append(
+        self._add_displacement_entry(
             {
                 "block_index": block_index,
                 "translation": [0.0, 0.0, 0.0],
@@ -227,6 +510,59 @@ class BoundaryConditions(Data):
             }
         )
 
+    def _add_displacement_entry(self, entry: dict) -> None:
+        self._displacements.append(entry)
+        self._dof_table = None
+
+    def dof_table(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Collect the prescribed degrees of freedom of all constrained blocks in arrays.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            0. The graph nodes of the constrained blocks, in the order in which they were first constrained, as an array of shape ``(b,)``.
+            1. The masks of the prescribed DOFs as a boolean array of shape ``(b, 6)``.
+            2. The prescribed values as an array of shape ``(b, 6)``, with zeros for DOFs that are not prescribed.
+
+        Notes
+        -----
+        The columns are the translations along X, Y and Z, followed by the rotations about X, Y and Z.
+        If a DOF of a block is prescribed more than once, the last value is used.
+
+        The table is cached, and recomputed after the displacement conditions are modified.
+
+        """
+        if self._dof_table is None:
+            row: dict[int, int] = {}
+            for entry in self._displacements:
+                row.setdefault(entry["block_index"], len(row))
+
+            mask = np.zeros((len(row), 6), dtype=bool)
+            values = np.zeros((len(row), 6))
+            for entry in self._displacements:
+                i = row[entry["block_index"]]
+                for offset, key in ((0, "translation"), (3, "rotation")):
+                    for j, value in enumerate(entry[key] or []):
+                        if value is not None:
+                            mask[i, offset + j] = True
+                            values[i, offset + j] = value
+
+            self._dof_table = (np.array(list(row), dtype=int), mask, values)
+
+        return self._dof_table
+
+    def fixed_blocks(self) -> np.ndarray:
+        """Identify the blocks of which all DOFs are prescribed to be zero.
+
+        Returns
+        -------
+        numpy.ndarray
+            The graph nodes of the fixed blocks.
+
+        """
+        nodes, mask, values = self.dof_table()
+        return nodes[np.all(mask & (values == 0.0), axis=1)]
+
     # =========================================================================
     # Access
     # =========================================================================
@@ -235,14 +571,90 @@ class BoundaryConditions(Data):
     def body_forces(self) -> list[list[float]]:
         return self._body_forces
 
+    @property
+    def body_force_fields(self) -> list[Callable]:
+        return self._body_force_fields
+
     @property
     def point_loads(self) -> list[dict]:
-        return self._point_loads
+        columns = self._point_columns
+        return [
+            {
+                "block_index": block_index,
+                "force": force,
+                "moment": None if math.isnan(moment[0]) else moment,
+                "point": None if math.isnan(point[0]) else point,
+                "loading_type": "ramp" if ramp else "instantaneous",
+            }
+            for block_index, force, moment, point, ramp in zip(columns["block_index"], columns["force"], columns["moment"], columns["point"], columns["ramp"])
+        ]
 
     @property
     def surface_loads(self) -> list[dict]:
-        return self._surface_loads
+        columns = self._surface_columns
+        offsets = columns["offsets"]
+        return [
+            {
+                "block_index": block_index,
+                "polygon": Polygon(columns["points"][offsets[i] : offsets[i + 1]]),
+                "magnitude": magnitude,
+                "direction": None if math.isnan(direction[0]) else direction,
+            }
+            for i, (block_index, magnitude, direction) in enumerate(zip(columns["block_index"], columns["magnitude"], columns["direction"]))
+        ]
 
     @property
     def displacements(self) -> list[dict]:
-        return self._displacements
+        # copies of the entries, such that changes go through the methods that invalidate the DOF table
+        return [
+            {
+                "block_index": entry["block_index"],
+                "translation": None if entry["translation"] is None else list(entry["translation"]),
+                "rotation": None if entry["rotation"] is None else list(entry["rotation"]),
+            }
+            for entry in self._displacements
+        ]
+
+
+def _vectors(vectors: Optional[Union[list[list[float]], np.ndarray]], n: int, name: str) -> np.ndarray:
+    # optional vectors are stored as NaN, and a single vector is used for all loads
+    if vectors is None:
+        return np.full((n, 3), np.nan)
+    vectors = np.asarray(vectors, dtype=float)
+    if vectors.shape == (3,):
+        return np.tile(vectors, (n, 1))
+    vectors = vectors.reshape(-1, 3)
+    if len(vectors) != n:
+        raise ValueError(f"The number of {name} does not match the number of block indices.")
+    return vectors
+
+
+def _polygons_numpy(points: np.ndarray, offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # area, centroid and unit normal of polygons stored as corners with offsets
+    sizes = np.diff(offsets)
+    polygon = np.repeat(np.arange(len(sizes)), sizes)
+    centers = np.add.reduceat(points, offsets[:-1], axis=0) / sizes[:, None]
+
+    following = np.arange(len(points)) + 1
+    following[offsets[1:] - 1] = offsets[:-1]
+
+    a = points - centers[polygon]
+    b = points[following] - centers[polygon]
+    cross = np.cross(a, b)
+
+    vectors = np.add.reduceat(cross, offsets[:-1], axis=0)
+    lengths = np.linalg.norm(vectors, axis=1)
+    normals = vectors / np.where(lengths > 0, lengths, 1.0)[:, None]
+
+    # twice the area of the triangles, negative if they turn opposite to the triangle of the closing edge
+    first = cross[offsets[1:] - 1]
+    weights = np.linalg.norm(cross, axis=1)
+    weights[np.einsum("ij,ij->i", cross, first[polygon]) <= 0] *= -1
+    weights[offsets[1:] - 1] = np.linalg.norm(first, axis=1)
+    triangles = (points + points[following] + centers[polygon]) / 3
+    total = np.add.reduceat(weights, offsets[:-1])
+    areas = np.abs(total) / 2
+    barycenters = np.add.reduceat(triangles * weights[:, None], offsets[:-1], axis=0) / np.where(total != 0, total, 1.0)[:, None]
+    barycenters = np.where((total != 0)[:, None], barycenters, points[offsets[:-1]])
+
+    return areas, barycenters, normals
@@ -0,0 +1,102 @@
+import itertools
+from typing import Optional
+
+import numpy as np
+
+from compas.data import Data
+
+
+class SampledField(Data):
+    """Acceleration field sampled on a regular grid, interpolated linearly between the samples.
+
+    The grid is defined by the sample coordinates along the X, Y and Z axes.
+    Along an axis without samples the field is constant.
+
+    Parameters
+    ----------
+    values : list | numpy.ndarray
+        The accelerations at the samples, as an array of shape ``(nx, ny, nz, 3)``,
+        leaving out the dimensions of the axes without samples.
+        For example, a height profile with ``z`` has shape ``(nz, 3)``.
+    x, y, z : list[float], optional
+        The increasing coordinates of the samples along the axes.
+    name : str, optional
+
+    Notes
+    -----
+    Outside the grid the values at the nearest boundary are used.
+
+    Examples
+    --------
+    An inverted-triangular seismic profile, from zero at the base to 0.2 g at a height of 10 m.
+
+    >>> field = SampledField([[0, 0, 0], [0.2 * 9.81, 0, 0]], z=[0, 10])
+    >>> field([[0, 0, 5]]).tolist()
+    [[0.981, 0.0, 0.0]]
+
+    """
+
+    def __init__(
+        self,
+        values,
+        x: Optional[list[float]] = None,
+        y: Optional[list[float]] = None,
+        z: Optional[list[float]] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        super().__init__(name=name)
+        self.coordinates = [None if c is None else np.asarray(c, dtype=float).reshape(-1) for c in (x, y, z)]
+        shape = tuple(len(c) for c in self.coordinates if c is not None) + (3,)
+        self.values = np.asarray(values, dtype=float).reshape(shape)
+        for c in self.coordinates:
+            if c is not None and (len(c) == 0 or np.any(np.diff(c) <= 0)):
+                raise ValueError("The coordinates of the samples should be increasing.")
+
+    @property
+    def __data__(self) -> dict:
+        x, y, z = (None if c is None else c.tolist() for c in self.coordinates)
+        return {"values": self.values.tolist(), "x": x, "y": y, "z": z, "name": self.name}
+
+    @classmethod
+    def __from_data__(cls, data: dict) -> "SampledField":
+        return cls(data["values"], x=data["x"], y=data["y"], z=data["z"], name=data.get("name"))
+
+    def __call__(self, points) -> np.ndarray:
+        """Evaluate the field.
+
+        Parameters
+        ----------
+        points : list[list[float]] | numpy.ndarray
+            The points, as an array of shape ``(n, 3)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            The accelerations, as an array of shape ``(n, 3)``.
+
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        lower = []
+        weights = []
+        sizes = []
+        for axis, coordinates in enumerate(self.coordinates):
+            if coordinates is None:
+                continue
+            # the index of the sample below every point, and the relative position to the next sample
+            i = np.clip(np.searchsorted(coordinates, points[:, axis], side="right") - 1, 0, max(len(coordinates) - 2, 0))
+            if len(coordinates) > 1:
+                t = np.clip((points[:, axis] - coordinates[i]) / (coordinates[i + 1] - coordinates[i]), 0.0, 1.0)
+            else:
+                t = np.zeros(len(points))
+            lower.append(i)
+            weights.append(t)
+            sizes.append(len(coordinates))
+
+        accelerations = np.zeros((len(points), 3))
+        for corner in itertools.product((0, 1), repeat=len(lower)):
+            index = tuple(np.minimum(i + c, size - 1) for i, c, size in zip(lower, corner, sizes))
+            weight = np.ones(len(points))
+            for t, c in zip(weights, corner):
+                weight *= t if c else 1.0 - t
+            accelerations += weight[:, None] * self.values[index]
+        return accelerations
@@ -1,15 +1,25 @@
+from typing import Callable
 from typing import Optional
+from typing import Union
+
+import numpy as np
 
 import compas.geometry as cg
 from compas.colors import Color
 from compas.data import Data
 from compas.geometry import Vector
 from compas_cgal.measure import mesh_volume
+from compas_dem.instrumentation import MemoryProfiler
+from compas_dem.instrumentation import NullTracer
+from compas_dem.instrumentation import Tracer
+from compas_dem.instrumentation import current_tracer
 from compas_dem.interactions import ContactProperties
 from compas_dem.interactions import JointModel
 from compas_dem.interactions import MohrCoulomb
 from compas_dem.models import BlockModel
 from compas_dem.problem.boundary_conditions import BoundaryConditions
+from compas_dem.problem.selectors import BlockQuery
+from compas_dem.problem.selectors import Selector
 from compas_dem.problem.solvers import Solver
 
 
@@ -39,14 +49,16 @@ class Problem(Data):
         self._boundary_conditions = BoundaryConditions()
         self._blocks: dict[int, object] = {block.graphnode: block for block in model.elements()}
         self._contact_properties = ContactProperties()
+        self.memory_report: Optional[dict] = None
 
-        for block in self._blocks.values():
-            if block.material:
-                density = block.material.density
-            else:
-                raise ValueError(f"Block {block.graphnode} has no material assigned, cannot compute mass. Please assign a material with density or set block.mass manually.")
-            volume = mesh_volume(block.modelgeometry.to_vertices_and_faces(True))
-            block.mass = volume * density
+        with current_tracer().span("problem.masses", blocks=len(self._blocks)):
+            for block in self._blocks.values():
+                if block.material:
+                    density = block.material.density
+                else:
+                    raise ValueError(f"Block {block.graphnode} has no material assigned, cannot compute mass. Please assign a material with density or set block.mass manually.")
+                volume = mesh_volume(block.modelgeometry.to_vertices_and_faces(True))
+                block.mass = volume * density
 
     @property
     def __data__(self) -> dict:
@@ -128,6 +140,21 @@ class Problem(Data):
         """
         self._boundary_conditions.add_global_body_force(ax, ay, az)
 
+    def add_body_force_field(self, field: Callable) -> None:
+        """Add a body acceleration that varies over the blocks, for example a seismic or wind profile.
+
+        The resultant force on each block is the acceleration at its centroid times its mass.
+
+        Parameters
+        ----------
+        field : callable
+            A function that computes the accelerations in [m/s²] at an array of points of shape ``(n, 3)``,
+            as an array of shape ``(n, 3)``, or a :class:`compas_dem.problem.SampledField`.
+            Only :class:`compas.data.Data` fields can be serialised with the problem,
+            see :meth:`BoundaryConditions.add_body_force_field`.
+        """
+        self._boundary_conditions.add_body_force_field(field)
+
     def add_point_load(
         self,
         block_index: int,
@@ -178,6 +205,43 @@ class Problem(Data):
         """
         self._boundary_conditions.add_surface_load(block_index, polygon, magnitude, direction)
 
+    def add_point_loads(
+        self,
+        block_indices: Union[list[int], np.ndarray, Selector],
+        forces: Union[list[list[float]], np.ndarray],
+        moments: Optional[Union[list[list[float]], np.ndarray]] = None,
+        points: Optional[Union[list[list[float]], np.ndarray]] = None,
+        loading_type: str = "ramp",
+    ) -> None:
+        """Add concentrated forces to many blocks at once.
+
+        The blocks can be identified by a selector, in which case a single force, moment or point
+        is applied to every selected block.
+
+        See :meth:`BoundaryConditions.add_point_loads`.
+
+        Examples
+        --------
+        >>> from compas_dem.problem import Course
+        >>> problem.add_point_loads(Course(-1), [0, 0, -1000])  # doctest: +SKIP
+        """
+        if isinstance(block_indices, Selector):
+            block_indices = self.select(block_indices)
+        self._boundary_conditions.add_point_loads(block_indices, forces, moments, points, loading_type)
+
+    def add_surface_loads(
+        self,
+        block_indices: Union[list[int], np.ndarray],
+        polygons: list[Union[cg.Polygon, list[list[float]], np.ndarray]],
+        magnitudes: Union[list[float], np.ndarray],
+        directions: Optional[Union[list[list[float]], np.ndarray]] = None,
+    ) -> None:
+        """Add distributed pressure loads over many polygons at once.
+
+        See :meth:`BoundaryConditions.add_surface_loads`.
+        """
+        self._boundary_conditions.add_surface_loads(block_indices, polygons, magnitudes, directions)
+
     def add_displacement(
         self,
         block_index: int,
@@ -223,18 +287,42 @@ class Problem(Data):
         self._blocks[block_index].is_support = True
         self._boundary_conditions.add_support(block_index)
 
-    def add_supports(self, block_indices: list[int]) -> None:
+    def add_supports(self, block_indices: Union[list[int], Selector]) -> None:
         """Fix a block — zero translation and zero rotation.
 
         Parameters
         ----------
-        block_indices : list[int]
-            List of node indices of the blocks to fix.
+        block_indices : list[int] | :class:`Selector`
+            List of node indices of the blocks to fix, or a selector of the blocks.
         """
+        if isinstance(block_indices, Selector):
+            block_indices = self.select(block_indices).tolist()
         for block_index in block_indices:
             self._blocks[block_index].is_support = True
             self._boundary_conditions.add_support(block_index)
 
+    def select(self, selector: Selector) -> np.ndarray:
+        """Find the blocks identified by a selector.
+
+        Parameters
+        ----------
+        selector : :class:`Selector`
+            For example, the blocks in a box or half-space, near a plane, of a course, or with a number of contacts.
+
+        Returns
+        -------
+        numpy.ndarray
+            The graph nodes of the selected blocks.
+
+        Notes
+        -----
+        The centroids, bounding boxes and numbers of contacts of the blocks are collected in a :class:`BlockQuery`
+        for every selection, such that changes to the blocks and contacts of the model are taken into account.
+        To make many selections of an unchanged model, use the query directly.
+
+        """
+        return BlockQuery.from_model(self.model).select(selector)
+
     def add_supports_from_model(self) -> None:
         """Fix all blocks whose ``is_support`` flag is ``True`` in the block model."""
         for block in self._blocks.values():
@@ -253,12 +341,14 @@ class Problem(Data):
             self.add_gravity(bc.g)
         for acc in bc.body_forces:
             self.add_global_body_force(*acc)
+        for field in bc.body_force_fields:
+            self.add_body_force_field(field)
         for entry in bc.point_loads:
             self.add_point_load(**entry)
         for entry in bc.surface_loads:
             self.add_surface_load(**entry)
         for entry in bc.displacements:
-            self._boundary_conditions._displacements.append(entry)
+            self._boundary_conditions._add_displacement_entry(entry)
 
     @property
     def boundary_conditions(self) -> BoundaryConditions:
@@ -269,77 +359,55 @@ class Problem(Data):
     # Resolved loads and displacements (computed lazily from boundary_conditions)
     # =============================================================================
 
-    @property
-    def centroidal_loads(self) -> dict[int, dict]:
-        """Resolved (force, moment) pairs at each block centroid."""
-        bc = self._boundary_conditions
-        loads = {
-            idx: {
-                "force": Vector(0, 0, 0),
-                "moment": Vector(0, 0, 0),
-                "loading_type": "ramp",
-            }
-            for idx in self._blocks
-        }
+    def centroidal_wrenches(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Resolve all loads to forces and moments at the block centroids, in arrays.
 
-        if bc.gravity:
-            g_vec = Vector(0, 0, -bc.g)
-            for idx, block in self._blocks.items():
-                loads[idx]["force"] += g_vec * block.mass
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            0. The graph nodes of the blocks, as an array of shape ``(b,)``.
+            1. The forces, as an array of shape ``(b, 3)``.
+            2. The moments about the centroids, as an array of shape ``(b, 3)``.
+            3. Flags indicating ramp loading, as a boolean array of shape ``(b,)``.
 
-        for acc in bc.body_forces:
-            a_vec = Vector(*acc)
-            for idx, block in self._blocks.items():
-                loads[idx]["force"] += a_vec * block.mass
+        See Also
+        --------
+        :meth:`BoundaryConditions.resolve_loads_numpy`
 
-        for entry in bc.point_loads:
-            idx = entry["block_index"]
-            force = Vector(*entry["force"])
-            if entry["point"] is not None:
-                r = Vector(*entry["point"]) - self._blocks[idx].point
-                moment = Vector(*r.cross(force))
-            elif entry["moment"] is not None:
-                moment = Vector(*entry["moment"])
-            else:
-                moment = Vector(0, 0, 0)
-            loads[idx]["force"] += force
-            loads[idx]["moment"] += moment
-            loads[idx]["loading_type"] = entry["loading_type"]
+        """
+        nodes = np.array(list(self._blocks), dtype=int)
+        centroids = np.array([block.point for block in self._blocks.values()], dtype=float).reshape(-1, 3)
+        masses = np.array([block.mass for block in self._blocks.values()], dtype=float)
+        forces, moments, ramp = self._boundary_conditions.resolve_loads_numpy(nodes, centroids, masses)
+        return nodes, forces, moments, ramp
 
-        for entry in bc.surface_loads:
-            idx = entry["block_index"]
-            polygon = entry["polygon"]
-            magnitude = entry["magnitude"]
-            area = polygon.area
-            barycenter = polygon.centroid
-            direction = Vector(*entry["direction"]) if entry["direction"] is not None else Vector(*polygon.normal)
-            force = direction * (magnitude * area)
-            r = barycenter - self._blocks[idx].point
-            moment = Vector(*r.cross(force))
-            loads[idx]["force"] += force
-            loads[idx]["moment"] += moment
-
-        return loads
+    @property
+    def centroidal_loads(self) -> dict[int, dict]:
+        """Resolved (force, moment) pairs at each block centroid.
+
+        The arrays of :meth:`centroidal_wrenches` are faster to use for large models.
+        """
+        nodes, forces, moments, ramp = self.centroidal_wrenches()
+        return {
+            node: {
+                "force": Vector(*force),
+                "moment": Vector(*moment),
+                "loading_type": "ramp" if flag else "instantaneous",
+            }
+            for node, force, moment, flag in zip(nodes.tolist(), forces.tolist(), moments.tolist(), ramp.tolist())
+        }
 
     @property
     def centroidal_displacements(self) -> dict[int, dict]:
-        """Prescribed (translation, rotation) pairs per block index."""
+        """Prescribed (translation, rotation) pairs per block index.
+
+        The solvers use the array-based :meth:`BoundaryConditions.dof_table` instead.
+        """
+        nodes, mask, values = self._boundary_conditions.dof_table()
         displacements = {}
-        for entry in self._boundary_conditions.displacements:
-            idx = entry["block_index"]
-            if idx not in displacements:
-                displacements[idx] = {
-                    "translation": [None, None, None],
-                    "rotation": [None, None, None],
-                }
-            if entry["translation"] is not None:
-                for j, v in enumerate(entry["translation"]):
-                    if v is not None:
-                        displacements[idx]["translation"][j] = v
-            if entry["rotation"] is not None:
-                for j, v in enumerate(entry["rotation"]):
-                    if v is not None:
-                        displacements[idx]["rotation"][j] = v
+        for node, flags, row in zip(nodes.tolist(), mask.tolist(), values.tolist()):
+            components = [value if flag else None for flag, value in zip(flags, row)]
+            displacements[node] = {"translation": components[:3], "rotation": components[3:]}
         return displacements
 
     # =============================================================================
@@ -391,13 +459,22 @@ class Problem(Data):
     # Solve
     # =============================================================================
 
-    def solve(self, solver: Solver):
+    def solve(self, solver: Solver, tracer: Optional[Tracer] = None, memory: Union[bool, str] = False):
         """Solve the problem using the named solver.
 
         Parameters
         ----------
         solver : Solver
             The solver instance to use.
+        tracer : :class:`compas_dem.instrumentation.Tracer`, optional
+            A tracer collecting the spans, counters and events of the solve.
+            If none is provided, the active tracer is used, if any.
+        memory : bool | str, optional
+            If True, record the memory use of every stage of the solve.
+            The report is stored in :attr:`memory_report`,
+            see :class:`compas_dem.instrumentation.MemoryProfiler`.
+            If a file path, the report is also written to that JSON file after every stage.
+            This slows down the solve considerably.
 
         Returns
         -------
@@ -406,28 +483,72 @@ class Problem(Data):
         Raises
         ------
         ValueError
-            If the solver name is not recognised.
+            If no solver backend is registered under the solver name,
+            or the backend does not support the conditions of the problem.
+
+        Notes
+        -----
+        The solve is dispatched to the backend registered under the solver name,
+        see :func:`compas_dem.problem.register_solver_backend`.
         """
-        self.check_model_validity()
+        tracer = tracer or current_tracer()
+
+        if not memory:
+            return self._solve(solver, tracer)
+
+        if isinstance(tracer, NullTracer):
+            tracer = Tracer(name="problem.solve")
+        profiler = MemoryProfiler(tracer, filepath=memory if isinstance(memory, str) else None)
+        try:
+            with profiler:
+                return self._solve(solver, tracer)
+        finally:
+            self.memory_report = profiler.report()
+
+    def solve_async(self, solver: Solver, on_progress: Optional[Callable[[dict], None]] = None):
+        """Solve the problem in a worker process, without blocking the caller.
+
+        Parameters
+        ----------
+        solver : Solver
+            The solver instance to use.
+        on_progress : callable, optional
+            A function that is called with every progress record of the solve,
+            for example the step, URF and number of contacts of the LMGC90 steps.
+
+        Returns
+        -------
+        :class:`compas_dem.analysis.executor.SolveFuture`
+            A future with the problem as result, after the results are copied onto the model.
+            Cancelling the future kills the worker process.
+
+        Notes
+        -----
+        The problem is sent to the worker as JSON, so it cannot have body force fields that are plain functions.
+        The worker is started with the ``"spawn"`` method,
+        so scripts that solve asynchronously should run under ``if __name__ == "__main__":``.
 
-        if solver.name == "LMGC90":
-            from compas_dem.analysis.lmgc90 import lmgc90_solve
+        Examples
+        --------
+        >>> future = problem.solve_async(Solver.LMGC90(duration=1.0, n_steps=500), on_progress=print)  # doctest: +SKIP
+        >>> problem = await asyncio.wrap_future(future)  # doctest: +SKIP
+
+        """
+        from compas_dem.analysis.executor import SolveFuture
 
-            params = solver.parameters
-            return lmgc90_solve(self, **{k: v for k, v in params.items() if v is not None})
-        elif solver.name == "CRA":
-            from compas_dem.analysis.cra import cra_solve
+        future = SolveFuture(self, solver)
+        if on_progress is not None:
+            future.add_progress_callback(on_progress)
+        return future.start()
 
-            params = solver.parameters
-            return cra_solve(self, **{k: v for k, v in params.items() if v is not None})
-        elif solver.name == "RBE":
-            from compas_dem.analysis.cra import cra_solve
+    def _solve(self, solver: Solver, tracer: Tracer):
+        with tracer, tracer.span("problem.solve", solver=solver.name):
+            self.check_model_validity()
 
-            params = solver.parameters
-            return cra_solve(self, **{k: v for k, v in params.items() if v is not None})
+            from compas_dem.problem.backends import solver_backend
 
-        else:
-            raise ValueError(f"Solver '{solver.name}' is not recognised. Available: 'LMGC90', 'CRA', 'RBE'.")
+            backend = solver_backend(solver.name)
+            return backend.run(self, **{k: v for k, v in solver.parameters.items() if v is not None})
 
     def check_model_validity(self) -> None:
         """Check that the model is valid for solving.
@@ -0,0 +1,336 @@
+from typing import Callable
+from typing import Optional
+
+import numpy as np
+
+from compas_dem.models import BlockModel
+
+MODES = ("centroid", "inside", "overlap")
+
+
+class BlockQuery:
+    """Arrays of the centroids, bounding boxes and contact counts of the blocks of a model, for selecting blocks by region.
+
+    Parameters
+    ----------
+    nodes : numpy.ndarray
+        The graph nodes of the blocks, as an array of shape ``(b,)``.
+    centroids : numpy.ndarray
+        The centroids of the blocks, as an array of shape ``(b, 3)``.
+    boxes : numpy.ndarray
+        The corners with the smallest and largest coordinates of the axis-aligned bounding boxes of the blocks,
+        as an array of shape ``(b, 2, 3)``.
+    degrees : numpy.ndarray
+        The number of contacts of the blocks, as an array of shape ``(b,)``.
+
+    Examples
+    --------
+    >>> from compas_dem.templates import StackTemplate
+    >>> model = BlockModel.from_stack(StackTemplate(n=4))
+    >>> query = BlockQuery.from_model(model)
+    >>> query.select(Degree(maximum=1)).tolist()
+    [0, 3]
+
+    """
+
+    def __init__(self, nodes: np.ndarray, centroids: np.ndarray, boxes: np.ndarray, degrees: np.ndarray) -> None:
+        self.nodes = np.asarray(nodes, dtype=int).reshape(-1)
+        self.centroids = np.asarray(centroids, dtype=float).reshape(-1, 3)
+        self.boxes = np.asarray(boxes, dtype=float).reshape(-1, 2, 3)
+        self.degrees = np.asarray(degrees, dtype=int).reshape(-1)
+
+    @classmethod
+    def from_model(cls, model: BlockModel) -> "BlockQuery":
+        """Construct a query from the blocks of a model.
+
+        Parameters
+        ----------
+        model : :class:`compas_dem.models.BlockModel`
+
+        Returns
+        -------
+        :class:`BlockQuery`
+
+        """
+        blocks = list(model.elements())
+        nodes = np.array([block.graphnode for block in blocks], dtype=int)
+        centroids = np.array([block.point for block in blocks], dtype=float).reshape(-1, 3)
+
+        vertices = [block.modelgeometry.vertices_attributes("xyz") for block in blocks]
+        offsets = np.cumsum([0] + [len(points) for points in vertices[:-1]])
+        boxes = np.zeros((len(blocks), 2, 3))
+        if blocks:
+            points = np.array([point for points in vertices for point in points], dtype=float)
+            boxes[:, 0] = np.minimum.reduceat(points, offsets, axis=0)
+            boxes[:, 1] = np.maximum.reduceat(points, offsets, axis=0)
+
+        row = {node: i for i, node in enumerate(nodes.tolist())}
+        edges = np.array([(row[u], row[v]) for u, v in model.graph.edges() if u in row and v in row], dtype=int).reshape(-1, 2)
+        degrees = np.bincount(edges.ravel(), minlength=len(blocks))
+
+        return cls(nodes, centroids, boxes, degrees)
+
+    def select(self, selector: "Selector") -> np.ndarray:
+        """Find the blocks identified by a selector.
+
+        Parameters
+        ----------
+        selector : :class:`Selector`
+
+        Returns
+        -------
+        numpy.ndarray
+            The graph nodes of the selected blocks.
+
+        """
+        return self.nodes[selector(self)]
+
+    def distances(self, point: list[float], normal: list[float]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the signed distances of the centroids and bounding boxes to a plane.
+
+        Parameters
+        ----------
+        point : list[float]
+            A point on the plane.
+        normal : list[float]
+            The normal of the plane, pointing to the positive side.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            0. The distances of the centroids, as an array of shape ``(b,)``.
+            1. The smallest distances of the corners of the bounding boxes, as an array of shape ``(b,)``.
+            2. The largest distances of the corners of the bounding boxes, as an array of shape ``(b,)``.
+
+        """
+        normal = np.asarray(normal, dtype=float)
+        normal = normal / np.linalg.norm(normal)
+        point = np.asarray(point, dtype=float)
+
+        centers = self.boxes.mean(axis=1)
+        radii = (self.boxes[:, 1] - self.boxes[:, 0]) @ np.abs(normal) / 2
+        distances = (centers - point) @ normal
+        return (self.centroids - point) @ normal, distances - radii, distances + radii
+
+
+class Selector:
+    """Base class of the selectors of blocks.
+
+    A selector is called with a :class:`BlockQuery` and returns a boolean mask of the selected blocks.
+    Selectors can be combined with ``&``, ``|`` and ``~``.
+
+    Parameters
+    ----------
+    mode : {"centroid", "inside", "overlap"}, optional
+        Select the blocks with the centroid in the region (default),
+        with the bounding box inside the region, or with the bounding box overlapping the region.
+        Not used by all selectors.
+
+    """
+
+    def __init__(self, mode: str = "centroid") -> None:
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}.")
+        self.mode = mode
+
+    def __call__(self, query: BlockQuery) -> np.ndarray:
+        raise NotImplementedError
+
+    def __and__(self, other: "Selector") -> "Selector":
+        return _Combination(np.logical_and, self, other)
+
+    def __or__(self, other: "Selector") -> "Selector":
+        return _Combination(np.logical_or, self, other)
+
+    def __invert__(self) -> "Selector":
+        return _Negation(self)
+
+    def _interval(self, lower: np.ndarray, upper: np.ndarray, centroids: np.ndarray, minimum: float, maximum: float) -> np.ndarray:
+        # select by the values of the centroids, or by the intervals of values of the bounding boxes
+        if self.mode == "centroid":
+            return (centroids >= minimum) & (centroids <= maximum)
+        if self.mode == "inside":
+            return (lower >= minimum) & (upper <= maximum)
+        return (upper >= minimum) & (lower <= maximum)
+
+
+class _Combination(Selector):
+    def __init__(self, operator: Callable, a: Selector, b: Selector) -> None:
+        super().__init__()
+        self.operator = operator
+        self.a = a
+        self.b = b
+
+    def __call__(self, query: BlockQuery) -> np.ndarray:
+        return self.operator(self.a(query), self.b(query))
+
+
+class _Negation(Selector):
+    def __init__(self, a: Selector) -> None:
+        super().__init__()
+        self.a = a
+
+    def __call__(self, query: BlockQuery) -> np.ndarray:
+        return ~self.a(query)
+
+
+class InBox(Selector):
+    """Select the blocks in an axis-aligned box.
+
+    Parameters
+    ----------
+    minimum : list[float]
+        The corner of the box with the smallest coordinates.
+    maximum : list[float]
+        The corner of the box with the largest coordinates.
+    mode : {"centroid", "inside", "overlap"}, optional
+        See :class:`Selector`.
+
+    """
+
+    def __init__(self, minimum: list[float], maximum: list[float], mode: str = "centroid") -> None:
+        super().__init__(mode)
+        self.minimum = np.asarray(minimum, dtype=float)
+        self.maximum = np.asarray(maximum, dtype=float)
+
+    def __call__(self, query: BlockQuery) -> np.ndarray:
+        selected = self._interval(query.boxes[:, 0], query.boxes[:, 1], query.centroids, self.minimum, self.maximum)
+        return np.all(selected, axis=1)
+
+
+class HalfSpace(Selector):
+    """Select the blocks on the positive side of a plane.
+
+    Parameters
+    ----------
+    point : list[float]
+        A point on the plane.
+    normal : list[float]
+        The normal of the plane, pointing to the selected side.
+    mode : {"centroid", "inside", "overlap"}, optional
+        See :class:`Selector`.
+
+    """
+
+    def __init__(self, point: list[float], normal: list[float], mode: str = "centroid") -> None:
+        super().__init__(mode)
+        self.point = point
+        self.normal = normal
+
+    def __call__(self, query: BlockQuery) -> np.ndarray:
+        centroids, lower, upper = query.distances(self.point, self.normal)
+        return self._interval(lower, upper, centroids, 0.0, np.inf)
+
+
+class NearPlane(Selector):
+    """Select the blocks within a distance of a plane.
+
+    Parameters
+    ----------
+    point : list[float]
+        A point on the plane.
+    normal : list[float]
+        The normal of the plane.
+    distance : float
+        The largest distance to the plane, on either side.
+    mode : {"centroid", "inside", "overlap"}, optional
+        See :class:`Selector`.
+
+    """
+
+    def __init__(self, point: list[float], normal: list[float], distance: float, mode: str = "centroid") -> None:
+        super().__init__(mode)
+        self.point = point
+        self.normal = normal
+        self.distance = distance
+
+    def __call__(self, query: BlockQuery) -> np.ndarray:
+        centroids, lower, upper = query.distances(self.point, self.normal)
+        return self._interval(lower, upper, centroids, -self.distance, self.distance)
+
+
+class Course(Selector):
+    """Select the blocks of a course.
+
+    The courses are the layers of blocks of which the centroids have about the same height along an axis,
+    numbered from the bottom up.
+
+    Parameters
+    ----------
+    index : int | list[int]
+        The index or indices of the selected courses. Negative indices count from the top.
+    axis : list[float], optional
+        The direction of the height. Default is the Z axis.
+    tolerance : float, optional
+        The smallest difference in height between the centroids of successive courses.
+        Default is half of the median height of the bounding boxes of the blocks.
+
+    Raises
+    ------
+    IndexError
+        When called, if an index is out of range of the courses of the blocks.
+
+    """
+
+    def __init__(self, index, axis: Optional[list[float]] = None, tolerance: Optional[float] = None) -> None:
+        super().__init__()
+        self.index = index
+        self.axis = axis or [0.0, 0.0, 1.0]
+        self.tolerance = tolerance
+
+    def courses(self, query: BlockQuery) -> np.ndarray:
+        """Identify the course of every block.
+
+        Parameters
+        ----------
+        query : :class:`BlockQuery`
+
+        Returns
+        -------
+        numpy.ndarray
+            The index of the course of every block, as an array of shape ``(b,)``.
+
+        """
+        heights, lower, upper = query.distances([0.0, 0.0, 0.0], self.axis)
+        if not len(heights):
+            return np.zeros(0, dtype=int)
+        tolerance = self.tolerance if self.tolerance is not None else np.median(upper - lower) / 2
+
+        order = np.argsort(heights, kind="stable")
+        steps = np.diff(heights[order]) > tolerance
+        courses = np.empty(len(heights), dtype=int)
+        courses[order] = np.concatenate([[0], np.cumsum(steps)])
+        return courses
+
+    def __call__(self, query: BlockQuery) -> np.ndarray:
+        courses = self.courses(query)
+        if not len(courses):
+            return np.zeros(0, dtype=bool)
+        count = courses.max() + 1
+        indices = np.atleast_1d(self.index)
+        if np.any((indices >= count) | (indices < -count)):
+            raise IndexError(f"Course index {self.index} is out of range for {count} courses.")
+        return np.isin(courses, np.where(indices < 0, indices + count, indices))
+
+
+class Degree(Selector):
+    """Select the blocks by their number of contacts.
+
+    Parameters
+    ----------
+    minimum : int, optional
+        The smallest number of contacts.
+    maximum : int, optional
+        The largest number of contacts.
+
+    """
+
+    def __init__(self, minimum: Optional[int] = None, maximum: Optional[int] = None) -> None:
+        super().__init__()
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def __call__(self, query: BlockQuery) -> np.ndarray:
+        minimum = -np.inf if self.minimum is None else self.minimum
+        maximum = np.inf if self.maximum is None else self.maximum
+        return (query.degrees >= minimum) & (query.degrees <= maximum)
@@ -3,12 +3,26 @@ from .template import Template
 from .arch import ArchTemplate
 from .barrel import BarrelVaultTemplate
 from .dome import DomeTemplate
+from .stack import StackTemplate
 from .wall import WallTemplate
+from .sweep import ArchSweep
+from .sweep import arch_sweep
+from .sweep import mass_properties_numpy
+from .synthetic import SYNTHETIC_KINDS
+from .synthetic import running_bond_counts
+from .synthetic import synthetic_template
 
 __all__ = [
     "Template",
     "ArchTemplate",
     "BarrelVaultTemplate",
     "DomeTemplate",
+    "StackTemplate",
     "WallTemplate",
+    "ArchSweep",
+    "arch_sweep",
+    "mass_properties_numpy",
+    "SYNTHETIC_KINDS",
+    "running_bond_counts",
+    "synthetic_template",
 ]
@@ -1,15 +1,68 @@
-from math import radians
+import numpy as np
 
 from compas.datastructures import Mesh
-from compas.geometry import Rotation
-from compas.geometry import add_vectors
-from compas.geometry import angle_vectors
-from compas.geometry import subtract_vectors
-from compas.geometry import transform_points
 
 from .template import Template
 
 
+def arch_joints_numpy(rise, span, thickness, depth, n: int) -> np.ndarray:
+    """Compute the joints between the voussoirs of a batch of semi-circular arches with the same number of voussoirs.
+
+    Parameters
+    ----------
+    rise : float | array_like
+        The rise of the arches.
+    span : float | array_like
+        The span of the arches.
+    thickness : float | array_like
+        The thickness of the arches.
+    depth : float | array_like
+        The depth of the arches.
+    n : int
+        The number of voussoirs.
+
+    Returns
+    -------
+    numpy.ndarray
+        The corners of the joint sections as an array of shape ``(k, n + 1, 4, 3)``,
+        with ``k`` the number of arches after broadcasting the parameters.
+
+    Raises
+    ------
+    Exception
+        If one of the arches is not semicircular.
+
+    """
+    rise, span, thickness, depth = np.broadcast_arrays(*(np.atleast_1d(np.asarray(value, dtype=float)) for value in (rise, span, thickness, depth)))
+
+    if np.any(rise > span / 2):
+        raise Exception("Not a semicircular arch.")
+
+    radius = rise / 2 + span**2 / (8 * rise)
+    # the angle between the springing and the horizontal
+    center = rise - radius
+    springing = np.arccos(0.5 * span / np.hypot(0.5 * span, center))
+    sector = np.pi - 2 * springing
+    angle = sector / n
+
+    # the section of the arch at the crown, relative to the center
+    zeros = np.zeros_like(rise)
+    section = np.empty((len(rise), 4, 3))
+    section[:, :, 0] = 0.0
+    section[:, :, 1] = np.stack([zeros, depth, depth, zeros], axis=1)
+    section[:, :, 2] = np.stack([rise, rise, rise + thickness, rise + thickness], axis=1) - center[:, None]
+
+    # rotate the crown section to all joints between the voussoirs
+    theta = 0.5 * sector[:, None] - angle[:, None] * np.arange(n + 1)
+    cos = np.cos(theta)[:, :, None]
+    sin = np.sin(theta)[:, :, None]
+    joints = np.empty((len(rise), n + 1, 4, 3))
+    joints[..., 0] = cos * section[:, None, :, 0] + sin * section[:, None, :, 2]
+    joints[..., 1] = section[:, None, :, 1]
+    joints[..., 2] = -sin * section[:, None, :, 0] + cos * section[:, None, :, 2] + center[:, None, None]
+    return joints
+
+
 class ArchTemplate(Template):
     """Create voussoir geometry for a semi-circular arch with given rise and span.
 
@@ -27,6 +80,15 @@ class ArchTemplate(Template):
 
     """
 
+    faces = [
+        [0, 1, 2, 3],
+        [7, 6, 5, 4],
+        [3, 7, 4, 0],
+        [6, 2, 1, 5],
+        [7, 3, 2, 6],
+        [5, 1, 0, 4],
+    ]
+
     def __init__(self, rise, span, thickness, depth, n=None):
         super().__init__()
         self.rise = rise
@@ -35,6 +97,42 @@ class ArchTemplate(Template):
         self.depth = depth
         self.n = n
 
+    def blocks_numpy(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the corner coordinates of all voussoirs at once.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            0. The block vertices as an array of shape ``(n, 8, 3)``.
+            1. The block faces shared by all blocks as an array of shape ``(6, 4)``.
+            2. The support flags of the blocks as a boolean array of shape ``(n,)``.
+               The first and the last voussoir are the supports.
+
+        """
+        joints = self._joints()
+        vertices = np.concatenate((joints[:-1], joints[1:]), axis=1)
+        faces = np.array(self.faces)
+        supports = np.zeros(self.n, dtype=bool)
+        supports[[0, -1]] = True
+        return vertices, faces, supports
+
+    def interfaces_numpy(self) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the interfaces between the voussoirs.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            0. The pairs of block indices as an array of shape ``(n - 1, 2)``.
+            1. The interface polygons as an array of shape ``(n - 1, 4, 3)``.
+               The corners are ordered such that the polygon normal points from the first to the second block of the pair.
+
+        """
+        joints = self._joints()
+        index = np.arange(self.n - 1)
+        pairs = np.stack([index, index + 1], axis=1)
+        polygons = joints[1:-1, ::-1]
+        return pairs, polygons
+
     def blocks(self):
         """Compute the blocks.
 
@@ -49,42 +147,16 @@ class ArchTemplate(Template):
         to create an assembly "from geometry".
 
         """
-        if self.rise > self.span / 2:
-            raise Exception("Not a semicircular arch.")
-
-        radius = self.rise / 2 + self.span**2 / (8 * self.rise)
-        # base = [0.0, 0.0, 0.0]
-        top = [0.0, 0.0, self.rise]
-        left = [-self.span / 2, 0.0, 0.0]
-        center = [0.0, 0.0, self.rise - radius]
-        vector = subtract_vectors(left, center)
-        springing = angle_vectors(vector, [-1.0, 0.0, 0.0])
-        sector = radians(180) - 2 * springing
-        angle = sector / self.n
-
-        a = top
-        b = add_vectors(top, [0, self.depth, 0])
-        c = add_vectors(top, [0, self.depth, self.thickness])
-        d = add_vectors(top, [0, 0, self.thickness])
-
-        R = Rotation.from_axis_and_angle([0, 1.0, 0], 0.5 * sector, center)
-        bottom = transform_points([a, b, c, d], R)
+        vertices, faces, supports = self.blocks_numpy()
+        faces = faces.tolist()
 
         blocks = []
-        for i in range(self.n):
-            R = Rotation.from_axis_and_angle([0, 1.0, 0], -angle, center)
-            top = transform_points(bottom, R)
-            vertices = bottom + top
-            faces = [
-                [0, 1, 2, 3],
-                [7, 6, 5, 4],
-                [3, 7, 4, 0],
-                [6, 2, 1, 5],
-                [7, 3, 2, 6],
-                [5, 1, 0, 4],
-            ]
-            mesh = Mesh.from_vertices_and_faces(vertices, faces)
+        for points, is_support in zip(vertices.tolist(), supports.tolist()):
+            mesh = Mesh.from_vertices_and_faces(points, faces)
+            mesh.attributes["is_support"] = is_support
             blocks.append(mesh)
-            bottom = top
 
         return blocks
+
+    def _joints(self) -> np.ndarray:
+        return arch_joints_numpy(self.rise, self.span, self.thickness, self.depth, self.n)[0]
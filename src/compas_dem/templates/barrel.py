@@ -1,14 +1,13 @@
 from math import radians
 
+import numpy as np
+
 from compas.datastructures import Mesh
-from compas.geometry import Rotation
-from compas.geometry import add_vectors
 from compas.geometry import angle_vectors
 from compas.geometry import subtract_vectors
-from compas.geometry import transform_points
-from compas.geometry import translate_points
 
 from .template import Template
+from .template import interval_overlaps_numpy
 
 
 class BarrelVaultTemplate(Template):
@@ -33,6 +32,15 @@ class BarrelVaultTemplate(Template):
 
     """
 
+    faces: list[list[int]] = [
+        [0, 1, 3, 2],
+        [0, 4, 5, 1],
+        [4, 6, 7, 5],
+        [6, 2, 3, 7],
+        [1, 5, 7, 3],
+        [2, 6, 4, 0],
+    ]
+
     def __init__(
         self,
         span: float = 6.0,
@@ -53,6 +61,89 @@ class BarrelVaultTemplate(Template):
         self.vou_length = vou_length
         self.zero_is_centerline_or_lowest_point = zero_is_centerline_or_lowest_point
 
+    def blocks_numpy(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the corner coordinates of all blocks at once.
+
+        The voussoir profiles of all courses are computed with a single rotation of the springing profile,
+        and the running bond along the length of the vault is generated by offsetting these profiles
+        with arrays of start and end positions.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            0. The block vertices as an array of shape ``(n, 8, 3)``.
+            1. The block faces shared by all blocks as an array of shape ``(6, 4)``.
+            2. The support flags of the blocks as a boolean array of shape ``(n,)``.
+
+        """
+        joints = self._joints()
+        cols, start, end = self._bond()
+
+        # the four corners of the section of every course
+        sections = np.concatenate((joints[:-1], joints[1:]), axis=1)
+
+        vertices = np.concatenate((sections[cols], sections[cols]), axis=1)
+        vertices[:, :4, 1] += start[:, None]
+        vertices[:, 4:, 1] += end[:, None]
+
+        faces = np.array(self.faces)
+        supports = (cols == 0) | (cols == self.vou_span - 1)
+
+        return vertices, faces, supports
+
+    def interfaces_numpy(self) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the interfaces between the blocks from the bond pattern.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            0. The pairs of block indices as an array of shape ``(m, 2)``.
+            1. The interface polygons as an array of shape ``(m, 4, 3)``.
+               The corners are ordered such that the polygon normal points from the first to the second block of the pair.
+
+        Notes
+        -----
+        The head joints connect consecutive blocks of the same course.
+        The bed joints connect the blocks of neighbouring courses that overlap along the length of the vault.
+
+        """
+        joints = self._joints()
+        cols, start, end = self._bond()
+
+        pairs = []
+        polygons = []
+
+        # blocks sorted per course, and along the length of the vault within a course
+        order = np.lexsort((start, cols))
+        bounds = np.searchsorted(cols[order], np.arange(self.vou_span + 1))
+
+        # head joints
+        a = order[:-1]
+        b = order[1:]
+        same = cols[a] == cols[b]
+        a = a[same]
+        b = b[same]
+        section = np.stack([joints[cols[a], 0], joints[cols[a] + 1, 0], joints[cols[a] + 1, 1], joints[cols[a], 1]], axis=1)
+        section[:, :, 1] += end[a][:, None]
+        pairs.append(np.stack([a, b], axis=1))
+        polygons.append(section)
+
+        # bed joints
+        for course in range(self.vou_span - 1):
+            a = order[bounds[course] : bounds[course + 1]]
+            b = order[bounds[course + 1] : bounds[course + 2]]
+            i, j, y0, y1 = interval_overlaps_numpy(start[a], end[a], start[b], end[b], tol=1e-12 * self.length)
+            i = a[i]
+            j = b[j]
+            joint = joints[course + 1]
+            polygon = np.stack([joint[0], joint[1], joint[1], joint[0]])[None].repeat(len(i), axis=0)
+            polygon[:, [0, 1], 1] += y0[:, None]
+            polygon[:, [2, 3], 1] += y1[:, None]
+            pairs.append(np.stack([i, j], axis=1))
+            polygons.append(polygon)
+
+        return np.concatenate(pairs), np.concatenate(polygons)
+
     def blocks(self) -> list[Mesh]:
         """Compute the blocks.
 
@@ -62,15 +153,25 @@ class BarrelVaultTemplate(Template):
             A list of blocks defined as simple meshes.
 
         """
+        vertices, faces, supports = self.blocks_numpy()
+        faces = faces.tolist()
+
+        meshes: list[Mesh] = []
+        for points, is_support in zip(vertices.tolist(), supports.tolist()):
+            mesh: Mesh = Mesh.from_vertices_and_faces(points, faces)
+            mesh.attributes["is_support"] = is_support
+            meshes.append(mesh)
+
+        return meshes
+
+    def _joints(self) -> np.ndarray:
         span = self.span
         length = self.length
         thickness = self.thickness
         rise = self.rise
         vou_span = self.vou_span
-        vou_length = self.vou_length
 
         radius: float = rise / 2 + span**2 / (8 * rise)
-        top: list[float] = [0, 0, rise]
         left: list[float] = [-span / 2, 0, 0]
         center: list[float] = [0.0, 0.0, rise - radius]
         vector: list[float] = subtract_vectors(left, center)
@@ -78,111 +179,57 @@ class BarrelVaultTemplate(Template):
         sector: float = radians(180) - 2 * springing
         angle: float = sector / vou_span
 
-        a: list[float] = [0, -length / 2, rise - (thickness / 2)]
-        d: list[float] = add_vectors(top, [0, -length / 2, (thickness / 2)])
-
-        R: Rotation = Rotation.from_axis_and_angle([0, 1.0, 0], 0.5 * sector, center)
-        bottom: list[list[float]] = transform_points([a, d], R)
-        brick_pts: list[list[list[float]]] = []
-        for i in range(vou_span + 1):
-            R_angle: Rotation = Rotation.from_axis_and_angle([0, 1.0, 0], -angle * i, center)
-            points: list[list[float]] = transform_points(bottom, R_angle)
-            brick_pts.append(points)
-
-        depth: float = length / vou_length
-        grouped_data: list[list[float]] = [pair[0] + pair[1] for pair in zip(brick_pts, brick_pts[1:])]
-
-        meshes: list[Mesh] = []
-        for i in range(vou_length):
-            for l, group in enumerate(grouped_data):  # noqa: E741
-                is_support: bool = l == 0 or l == (len(grouped_data) - 1)
-                if l % 2 == 0:
-                    point_l: list[list[float]] = [
-                        group[0],
-                        group[1],
-                        group[2],
-                        group[3],
-                    ]
-                    point_list: list[list[float]] = [
-                        [group[0][0], group[0][1] + (depth * i), group[0][2]],
-                        [group[1][0], group[1][1] + (depth * i), group[1][2]],
-                        [group[2][0], group[2][1] + (depth * i), group[2][2]],
-                        [group[3][0], group[3][1] + (depth * i), group[3][2]],
-                    ]
-                    p_t: list[list[float]] = translate_points(point_l, [0, depth * (i + 1), 0])
-                    vertices: list[list[float]] = point_list + p_t
-                    faces: list[list[int]] = [
-                        [0, 1, 3, 2],
-                        [0, 4, 5, 1],
-                        [4, 6, 7, 5],
-                        [6, 2, 3, 7],
-                        [1, 5, 7, 3],
-                        [2, 6, 4, 0],
-                    ]
-                    mesh: Mesh = Mesh.from_vertices_and_faces(vertices, faces)
-                    mesh.attributes["is_support"] = is_support
-                    meshes.append(mesh)
-                else:
-                    point_l: list[list[float]] = [
-                        group[0],
-                        group[1],
-                        group[2],
-                        group[3],
-                    ]
-                    points_base: list[list[float]] = translate_points(point_l, [0, depth / 2, 0])
-                    points_b_t: list[list[float]] = translate_points(points_base, [0, depth * i, 0])
-                    points_t: list[list[float]] = translate_points(points_base, [0, depth * (i + 1), 0])
-                    vertices: list[list[float]] = points_b_t + points_t
-                    if i != vou_length - 1:
-                        faces: list[list[int]] = [
-                            [0, 1, 3, 2],
-                            [0, 4, 5, 1],
-                            [4, 6, 7, 5],
-                            [6, 2, 3, 7],
-                            [1, 5, 7, 3],
-                            [2, 6, 4, 0],
-                        ]
-                        mesh: Mesh = Mesh.from_vertices_and_faces(vertices, faces)
-                        mesh.attributes["is_support"] = is_support
-                        meshes.append(mesh)
-
-        for l, group in enumerate(grouped_data):  # noqa: E741
-            is_support: bool = l == 0 or l == (len(grouped_data) - 1)
-            if l % 2 != 0:
-                point_l: list[list[float]] = [group[0], group[1], group[2], group[3]]
-                p_t: list[list[float]] = translate_points(point_l, [0, depth / 2, 0])
-                vertices: list[list[float]] = point_l + p_t
-                faces: list[list[int]] = [
-                    [0, 1, 3, 2],
-                    [0, 4, 5, 1],
-                    [4, 6, 7, 5],
-                    [6, 2, 3, 7],
-                    [1, 5, 7, 3],
-                    [2, 6, 4, 0],
-                ]
-                mesh: Mesh = Mesh.from_vertices_and_faces(vertices, faces)
-                mesh.attributes["is_support"] = is_support
-                meshes.append(mesh)
-
-                point_f: list[list[float]] = translate_points(point_l, [0, length, 0])
-                p_f: list[list[float]] = translate_points(point_f, [0, -depth / 2, 0])
-                vertices: list[list[float]] = p_f + point_f
-                faces: list[list[int]] = [
-                    [0, 1, 3, 2],
-                    [0, 4, 5, 1],
-                    [4, 6, 7, 5],
-                    [6, 2, 3, 7],
-                    [1, 5, 7, 3],
-                    [2, 6, 4, 0],
-                ]
-                mesh: Mesh = Mesh.from_vertices_and_faces(vertices, faces)
-                mesh.attributes["is_support"] = is_support
-                meshes.append(mesh)
+        # intrados and extrados points of the profile at the crown,
+        # relative to the center of the arch
+        profile = np.array(
+            [
+                [0, -length / 2, rise - (thickness / 2)],
+                [0, -length / 2, rise + (thickness / 2)],
+            ]
+        ) - np.array(center)
+
+        # rotate the crown profile to all joints between the courses
+        theta = 0.5 * sector - angle * np.arange(vou_span + 1)
+        cos = np.cos(theta)[:, None]
+        sin = np.sin(theta)[:, None]
+        joints = np.empty((vou_span + 1, 2, 3))
+        joints[:, :, 0] = cos * profile[:, 0] + sin * profile[:, 2] + center[0]
+        joints[:, :, 1] = profile[:, 1] + center[1]
+        joints[:, :, 2] = -sin * profile[:, 0] + cos * profile[:, 2] + center[2]
 
         # Find the lowest z-coordinate and move all the block to zero.
         if not self.zero_is_centerline_or_lowest_point:
-            min_z: float = min([min(mesh.vertex_coordinates(key)[2] for key in mesh.vertices()) for mesh in meshes])
-            for mesh in meshes:
-                mesh.translate([0, 0, -min_z])
+            joints[:, :, 2] -= joints[:, :, 2].min()
 
-        return meshes
+        return joints
+
+    def _bond(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        length = self.length
+        vou_span = self.vou_span
+        vou_length = self.vou_length
+
+        depth: float = length / vou_length
+        courses = np.arange(vou_span)
+        odd = courses % 2 == 1
+
+        # full blocks, row by row, with the odd courses shifted by half a block
+        # the last row of the odd courses is replaced by half blocks at both ends
+        rows, cols = np.meshgrid(np.arange(vou_length), courses, indexing="ij")
+        keep = ~(odd[cols] & (rows == vou_length - 1))
+        rows = rows[keep]
+        cols = cols[keep]
+        shift = np.where(odd[cols], depth / 2, 0.0)
+        start = shift + depth * rows
+        end = shift + depth * (rows + 1)
+
+        # half blocks at the start and end of the odd courses
+        halves = courses[odd]
+        half_cols = np.repeat(halves, 2)
+        half_start = np.tile([0.0, length - depth / 2], len(halves))
+        half_end = np.tile([depth / 2, length], len(halves))
+
+        cols = np.concatenate((cols, half_cols))
+        start = np.concatenate((start, half_start))
+        end = np.concatenate((end, half_end))
+
+        return cols, start, end
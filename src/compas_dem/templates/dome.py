@@ -2,6 +2,8 @@ from math import cos
 from math import pi
 from math import sin
 
+import numpy as np
+
 from compas.datastructures import Mesh
 
 from .template import Template
@@ -15,6 +17,13 @@ def geom_dome(ro, theta, phi):
     return point
 
 
+def _spherical_to_cartesian(ro: np.ndarray, theta: np.ndarray, phi: np.ndarray) -> np.ndarray:
+    x = ro * np.sin(theta) * np.cos(phi)
+    y = ro * np.sin(theta) * np.sin(phi)
+    z = ro * np.cos(theta)
+    return np.stack([x, y, z], axis=-1)
+
+
 def radius(r_i, r_f, theta_upper, theta_lower, theta):
     r = r_i + (r_f - r_i) / (theta_upper - theta_lower) * theta
     return r
@@ -23,6 +32,15 @@ def radius(r_i, r_f, theta_upper, theta_lower, theta):
 class DomeTemplate(Template):
     """Create voussoirs for a spherical dome geometry with given rise and span."""
 
+    faces = [
+        [0, 4, 5, 1],
+        [1, 5, 6, 2],
+        [0, 1, 2, 3],
+        [0, 3, 7, 4],
+        [5, 4, 7, 6],
+        [6, 7, 3, 2],
+    ]
+
     def __init__(
         self,
         meridians=40,
@@ -45,6 +63,102 @@ class DomeTemplate(Template):
         self.R_i = R_i
         self.R_f = R_f
 
+    def blocks_numpy(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the corner coordinates of all blocks at once.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            0. The block vertices as an array of shape ``(meridians * hoops, 8, 3)``.
+            1. The block faces shared by all blocks as an array of shape ``(6, 4)``.
+            2. The support flags of the blocks as a boolean array.
+               The blocks of the lowest hoop are the supports.
+
+        Notes
+        -----
+        The blocks are ordered per meridian, and per hoop within each meridian.
+        The index of the block in meridian ``j`` and hoop ``i`` is ``j * hoops + i``.
+
+        """
+        phi, theta, r, R, step = self._grid()
+
+        # per block, the spherical coordinates of the eight corners
+        j, i = np.meshgrid(np.arange(self.meridians), np.arange(self.hoops), indexing="ij")
+        j = j.ravel()
+        i = i.ravel()
+
+        start = phi[j] + step[i]
+        end = phi[j + 1] + step[i]
+
+        rho = np.stack([r[i], R[i], R[i], r[i], r[i + 1], R[i + 1], R[i + 1], r[i + 1]], axis=1)
+        th = np.stack([theta[i]] * 4 + [theta[i + 1]] * 4, axis=1)
+        ph = np.stack([start, start, end, end] * 2, axis=1)
+
+        vertices = _spherical_to_cartesian(rho, th, ph)
+        faces = np.array(self.faces)
+        supports = i == self.hoops - 1
+
+        return vertices, faces, supports
+
+    def interfaces_numpy(self) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the interfaces between the blocks from the known topology of the dome.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            0. The pairs of block indices as an array of shape ``(m, 2)``.
+            1. The interface polygons as an array of shape ``(m, 4, 3)``.
+               The corners are ordered such that the polygon normal points from the first to the second block of the pair.
+
+        Notes
+        -----
+        The meridian joints between neighbouring blocks of the same hoop are shared faces of the two blocks.
+        Because of the staggered bond, the faces of the bed joints between two hoops are not coplanar.
+        Their interfaces are the overlapping parts of the conical joint surface on which the corners of both faces lie.
+
+        """
+        M = self.meridians
+        H = self.hoops
+
+        phi, theta, r, R, step = self._grid()
+        vertices = self.blocks_numpy()[0]
+
+        # meridian joints: the face at the end of every block
+        j, i = np.meshgrid(np.arange(M), np.arange(H), indexing="ij")
+        j = j.ravel()
+        i = i.ravel()
+
+        meridian_pairs = np.stack([j * H + i, ((j + 1) % M) * H + i], axis=1)
+        meridian_polygons = vertices[:, [3, 2, 6, 7]]
+
+        # hoop joints: every block touches two blocks of the next hoop
+        # the first half of the block overlaps with the block that starts half a block earlier
+        # the second half with the block that starts half a block later
+        j, i = np.meshgrid(np.arange(M), np.arange(H - 1), indexing="ij")
+        j = np.repeat(j.ravel(), 2)
+        i = np.repeat(i.ravel(), 2)
+        half = np.tile([0, 1], len(j) // 2)
+
+        offset = np.where(i % 2 == 0, -1, 0) + half
+        k = (j + offset) % M
+
+        hoop_pairs = np.stack([j * H + i, k * H + i + 1], axis=1)
+
+        delta = 0.5 * (phi[1] - phi[0])
+        start = phi[j] + step[i] + half * delta
+        end = start + delta
+
+        rho = np.stack([r[i + 1], R[i + 1], R[i + 1], r[i + 1]], axis=1)
+        th = np.stack([theta[i + 1]] * 4, axis=1)
+        ph = np.stack([end, end, start, start], axis=1)
+
+        hoop_polygons = _spherical_to_cartesian(rho, th, ph)
+
+        pairs = np.concatenate((meridian_pairs, hoop_pairs))
+        polygons = np.concatenate((meridian_polygons, hoop_polygons))
+
+        return pairs, polygons
+
     def blocks(self):
         """Compute the blocks.
 
@@ -59,55 +173,28 @@ class DomeTemplate(Template):
         to create an assembly "from geometry".
 
         """
-        step_phi = (2 * pi - 0) / (2 * self.meridians)
-        phi_delta = (2 * pi - 0) / self.meridians
-        theta_delta = (self.spring - self.oculus) / self.hoops
-
-        phi = []
-        for i in range(self.meridians + 1):
-            phi.append(0 + i * phi_delta)
-
-        theta = []
-        for i in range(self.hoops + 1):
-            theta.append(self.oculus + i * theta_delta)
+        vertices, faces, supports = self.blocks_numpy()
+        faces = faces.tolist()
 
         blocks = []
+        for points, is_support in zip(vertices.tolist(), supports.tolist()):
+            block = Mesh.from_vertices_and_faces(points, faces)
+            block.attributes["is_support"] = is_support
+            blocks.append(block)
 
-        for j in range(self.meridians):
-            for i in range(self.hoops):
-                if i % 2 == 0:
-                    step = 0
-                else:
-                    step = step_phi
-
-                vertices = []
-
-                r = radius(self.r_i, self.r_f, self.spring, self.oculus, theta[i])
-                R = radius(self.R_i, self.R_f, self.spring, self.oculus, theta[i])
-
-                vertices.append(geom_dome(r, theta[i], phi[j] + step))
-                vertices.append(geom_dome(R, theta[i], phi[j] + step))
-                vertices.append(geom_dome(R, theta[i], phi[j + 1] + step))
-                vertices.append(geom_dome(r, theta[i], phi[j + 1] + step))
+        return blocks
 
-                r = radius(self.r_i, self.r_f, self.spring, self.oculus, theta[i + 1])
-                R = radius(self.R_i, self.R_f, self.spring, self.oculus, theta[i + 1])
+    def _grid(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        step_phi = (2 * pi - 0) / (2 * self.meridians)
+        phi_delta = (2 * pi - 0) / self.meridians
+        theta_delta = (self.spring - self.oculus) / self.hoops
 
-                vertices.append(geom_dome(r, theta[i + 1], phi[j] + step))
-                vertices.append(geom_dome(R, theta[i + 1], phi[j] + step))
-                vertices.append(geom_dome(R, theta[i + 1], phi[j + 1] + step))
-                vertices.append(geom_dome(r, theta[i + 1], phi[j + 1] + step))
+        phi = 0 + np.arange(self.meridians + 1) * phi_delta
+        theta = self.oculus + np.arange(self.hoops + 1) * theta_delta
 
-                faces = [
-                    [0, 4, 5, 1],
-                    [1, 5, 6, 2],
-                    [0, 1, 2, 3],
-                    [0, 3, 7, 4],
-                    [5, 4, 7, 6],
-                    [6, 7, 3, 2],
-                ]
+        r = radius(self.r_i, self.r_f, self.spring, self.oculus, theta)
+        R = radius(self.R_i, self.R_f, self.spring, self.oculus, theta)
 
-                block = Mesh.from_vertices_and_faces(vertices, faces)
-                blocks.append(block)
+        step = np.where(np.arange(self.hoops) % 2 == 0, 0, step_phi)
 
-        return blocks
+        return phi, theta, r, R, step
@@ -0,0 +1,134 @@
+import numpy as np
+
+from compas.datastructures import Mesh
+
+from .template import Template
+
+
+class StackTemplate(Template):
+    """Create blocks for a stack of boxes.
+
+    Parameters
+    ----------
+    n : int, optional
+        The number of blocks.
+    width : float, optional
+        The size of the blocks along the X axis.
+    depth : float, optional
+        The size of the blocks along the Y axis.
+    height : float, optional
+        The height of the blocks.
+    shift : float, optional
+        The offset along the X axis of every block with respect to the block below.
+        The absolute value of the offset should be smaller than the width of the blocks.
+
+    Notes
+    -----
+    The stack is built starting at the origin, along the Z axis.
+    The bottom block is the support.
+
+    """
+
+    faces = [
+        [0, 3, 2, 1],
+        [4, 5, 6, 7],
+        [0, 1, 5, 4],
+        [1, 2, 6, 5],
+        [2, 3, 7, 6],
+        [3, 0, 4, 7],
+    ]
+
+    def __init__(
+        self,
+        n: int = 10,
+        width: float = 1.0,
+        depth: float = 1.0,
+        height: float = 0.5,
+        shift: float = 0.0,
+    ):
+        super().__init__()
+
+        if abs(shift) >= width:
+            raise ValueError("The shift should be smaller than the width of the blocks.")
+
+        self.n = n
+        self.width = width
+        self.depth = depth
+        self.height = height
+        self.shift = shift
+
+    def blocks_numpy(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the corner coordinates of all blocks at once.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            0. The block vertices as an array of shape ``(n, 8, 3)``.
+            1. The block faces shared by all blocks as an array of shape ``(6, 4)``.
+            2. The support flags of the blocks as a boolean array of shape ``(n,)``.
+
+        """
+        x0, x1, z0, z1 = self._boxes()
+        y0 = np.zeros_like(x0)
+        y1 = y0 + self.depth
+
+        vertices = np.empty((len(x0), 8, 3))
+        vertices[:, :, 0] = np.stack([x0, x1, x1, x0] * 2, axis=1)
+        vertices[:, :, 1] = np.stack([y0, y0, y1, y1] * 2, axis=1)
+        vertices[:, :, 2] = np.stack([z0] * 4 + [z1] * 4, axis=1)
+
+        faces = np.array(self.faces)
+        supports = np.zeros(len(x0), dtype=bool)
+        supports[0] = True
+
+        return vertices, faces, supports
+
+    def interfaces_numpy(self) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the bed joints between consecutive blocks.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            0. The pairs of block indices as an array of shape ``(n - 1, 2)``.
+            1. The interface polygons as an array of shape ``(n - 1, 4, 3)``.
+               The corners are ordered such that the polygon normal points from the lower to the upper block.
+
+        """
+        x0, x1, _, z1 = self._boxes()
+        lo = np.maximum(x0[:-1], x0[1:])
+        hi = np.minimum(x1[:-1], x1[1:])
+        index = np.arange(len(x0) - 1)
+
+        polygons = np.empty((len(index), 4, 3))
+        polygons[:, :, 0] = np.stack([lo, hi, hi, lo], axis=1)
+        polygons[:, :, 1] = [0.0, 0.0, self.depth, self.depth]
+        polygons[:, :, 2] = z1[:-1, None]
+
+        return np.stack([index, index + 1], axis=1), polygons
+
+    def blocks(self) -> list[Mesh]:
+        """Compute the blocks.
+
+        Returns
+        -------
+        list
+            A list of blocks defined as simple meshes.
+
+        """
+        vertices, faces, supports = self.blocks_numpy()
+        faces = faces.tolist()
+
+        meshes: list[Mesh] = []
+        for points, is_support in zip(vertices.tolist(), supports.tolist()):
+            mesh: Mesh = Mesh.from_vertices_and_faces(points, faces)
+            mesh.attributes["is_support"] = is_support
+            meshes.append(mesh)
+
+        return meshes
+
+    def _boxes(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # the x and z ranges of the blocks
+        i = np.arange(self.n)
+        x0 = i * self.shift
+        z0 = i * self.height
+        return x0, x0 + self.width, z0, z0 + self.height
@@ -0,0 +1,160 @@
+from itertools import product
+
+import numpy as np
+
+from .arch import ArchTemplate
+from .arch import arch_joints_numpy
+
+
+def mass_properties_numpy(vertices: np.ndarray, faces: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the volumes and centroids of a batch of closed blocks with the same face topology.
+
+    Parameters
+    ----------
+    vertices : numpy.ndarray
+        The block vertices as an array of shape ``(..., v, 3)``.
+    faces : numpy.ndarray
+        The faces shared by all blocks as an array of shape ``(f, k)``,
+        with the vertices of every face ordered counterclockwise when seen from outside the block.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        0. The volumes of the blocks as an array of shape ``(...)``.
+        1. The centroids of the blocks as an array of shape ``(..., 3)``.
+
+    Notes
+    -----
+    The faces are triangulated as fans around their first vertex,
+    and the volume and centroid are accumulated over the signed tetrahedra
+    formed by these triangles and the first vertex of every block.
+
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    faces = np.asarray(faces)
+
+    origin = vertices[..., :1, :]
+    points = vertices - origin
+
+    a = points[..., faces[:, :1], :]
+    b = points[..., faces[:, 1:-1], :]
+    c = points[..., faces[:, 2:], :]
+
+    volumes = np.einsum("...k,...k->...", a, np.cross(b, c)) / 6
+    centers = (a + b + c) / 4
+
+    volume = volumes.sum(axis=(-1, -2))
+    centroid = np.einsum("...ij,...ijk->...k", volumes, centers) / volume[..., None] + origin[..., 0, :]
+
+    return volume, centroid
+
+
+class ArchSweep:
+    """A batch of arch templates with the same number of voussoirs.
+
+    The geometry of all arches of the batch is computed at once and stored in stacked arrays.
+    The face topology of the blocks and the topology of the interfaces are shared by all arches.
+
+    Parameters
+    ----------
+    templates : list[:class:`ArchTemplate`]
+        The arch templates of the batch.
+
+    Attributes
+    ----------
+    n : int
+        The number of voussoirs of all arches.
+    vertices : numpy.ndarray
+        The block vertices as an array of shape ``(k, n, 8, 3)``.
+    faces : numpy.ndarray
+        The block faces shared by all blocks as an array of shape ``(6, 4)``.
+    supports : numpy.ndarray
+        The support flags shared by all arches as an array of shape ``(n,)``.
+    pairs : numpy.ndarray
+        The interface pairs shared by all arches as an array of shape ``(n - 1, 2)``.
+    polygons : numpy.ndarray
+        The interface polygons as an array of shape ``(k, n - 1, 4, 3)``.
+
+    Raises
+    ------
+    ValueError
+        If the templates do not have the same number of voussoirs.
+
+    """
+
+    def __init__(self, templates: list[ArchTemplate]):
+        n = {template.n for template in templates}
+        if len(n) != 1:
+            raise ValueError("All templates of a sweep should have the same number of voussoirs.")
+
+        self.templates = templates
+        self.n: int = n.pop()
+
+        joints = arch_joints_numpy(
+            [template.rise for template in templates],
+            [template.span for template in templates],
+            [template.thickness for template in templates],
+            [template.depth for template in templates],
+            self.n,
+        )
+
+        index = np.arange(self.n - 1)
+
+        self.vertices = np.concatenate((joints[:, :-1], joints[:, 1:]), axis=2)
+        self.faces = np.array(ArchTemplate.faces)
+        self.supports = np.zeros(self.n, dtype=bool)
+        self.supports[[0, -1]] = True
+        self.pairs = np.stack([index, index + 1], axis=1)
+        self.polygons = joints[:, 1:-1, ::-1]
+
+    def __len__(self) -> int:
+        return len(self.templates)
+
+    def mass_properties(self) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the volumes and centroids of all blocks of all arches.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            0. The volumes as an array of shape ``(k, n)``.
+            1. The centroids as an array of shape ``(k, n, 3)``.
+
+        """
+        return mass_properties_numpy(self.vertices, self.faces)
+
+
+def arch_sweep(rise, span, thickness, depth, n) -> dict[int, ArchSweep]:
+    """Generate all combinations of the given arch parameters, grouped per number of voussoirs.
+
+    Parameters
+    ----------
+    rise : float | list[float]
+        The values of the rise.
+    span : float | list[float]
+        The values of the span.
+    thickness : float | list[float]
+        The values of the thickness.
+    depth : float | list[float]
+        The values of the depth.
+    n : int | list[int]
+        The values of the number of voussoirs.
+
+    Returns
+    -------
+    dict[int, :class:`ArchSweep`]
+        The batches of arches, per number of voussoirs.
+
+    Examples
+    --------
+    >>> sweeps = arch_sweep(rise=[2, 3], span=10, thickness=[0.3, 0.5], depth=0.5, n=[10, 20])
+    >>> sweeps[10].vertices.shape
+    (4, 10, 8, 3)
+
+    """
+    values = [np.atleast_1d(value).tolist() for value in (rise, span, thickness, depth)]
+
+    sweeps: dict[int, ArchSweep] = {}
+    for count in np.atleast_1d(n).tolist():
+        templates = [ArchTemplate(*parameters, n=count) for parameters in product(*values)]
+        sweeps[count] = ArchSweep(templates)
+    return sweeps
@@ -0,0 +1,95 @@
+from math import sqrt
+
+from .arch import ArchTemplate
+from .barrel import BarrelVaultTemplate
+from .stack import StackTemplate
+from .template import Template
+from .wall import WallTemplate
+
+SYNTHETIC_KINDS = ("stack", "wall", "arch", "vault")
+
+
+def running_bond_counts(courses: int, units: int) -> tuple[int, int]:
+    """Count the blocks and interfaces of a running bond.
+
+    Parameters
+    ----------
+    courses : int
+        The number of courses.
+    units : int
+        The number of full blocks of the even courses.
+        The odd courses have one full block less, and a half block at both ends.
+
+    Returns
+    -------
+    tuple[int, int]
+        0. The number of blocks.
+        1. The number of interfaces.
+
+    Notes
+    -----
+    Every course has a head joint between consecutive blocks,
+    and every full block of an even course overlaps with two blocks of each neighbouring course.
+
+    """
+    odd = courses // 2
+    even = courses - odd
+    blocks = courses * units + odd
+    interfaces = even * (units - 1) + odd * units + (courses - 1) * 2 * units
+    return blocks, interfaces
+
+
+def synthetic_template(kind: str, n: int) -> tuple[Template, int, int]:
+    """Create a template of a given kind with approximately a given number of blocks.
+
+    Parameters
+    ----------
+    kind : {"stack", "wall", "arch", "vault"}
+        The kind of template.
+        A stack is a column of boxes, a wall is a square running bond wall,
+        an arch is a semicircular arch, and a vault is a barrel vault in running bond
+        with about as many courses as blocks per course.
+    n : int
+        The target number of blocks.
+
+    Returns
+    -------
+    tuple[:class:`Template`, int, int]
+        0. The template.
+        1. The number of blocks of the template.
+        2. The number of interfaces of the template.
+
+    Raises
+    ------
+    ValueError
+        If the kind is not recognised.
+
+    Notes
+    -----
+    The numbers of blocks and interfaces are computed from the bond of the template,
+    without generating the geometry,
+    such that they can be used to check the contacts of models generated from the template.
+
+    Examples
+    --------
+    >>> template, blocks, interfaces = synthetic_template("stack", 100)
+    >>> blocks, interfaces
+    (100, 99)
+
+    """
+    if kind == "stack":
+        return StackTemplate(n=n), n, n - 1
+
+    if kind == "arch":
+        return ArchTemplate(rise=3, span=10, thickness=0.5, depth=0.5, n=n), n, n - 1
+
+    if kind in ("wall", "vault"):
+        units = max(2, round(sqrt(n)))
+        courses = max(1, round(n / (units + 0.5)))
+        blocks, interfaces = running_bond_counts(courses, units)
+        if kind == "wall":
+            return WallTemplate(courses=courses, bricks=units), blocks, interfaces
+        template = BarrelVaultTemplate(length=6.0 * units / courses, vou_span=courses, vou_length=units)
+        return template, blocks, interfaces
+
+    raise ValueError(f"Kind '{kind}' is not recognised. Available: {', '.join(SYNTHETIC_KINDS)}.")
@@ -1,3 +1,52 @@
+import numpy as np
+
+
+def interval_overlaps_numpy(
+    start_a: np.ndarray,
+    end_a: np.ndarray,
+    start_b: np.ndarray,
+    end_b: np.ndarray,
+    tol: float = 1e-12,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Find the overlapping intervals of two sorted sequences of disjoint intervals.
+
+    Parameters
+    ----------
+    start_a : numpy.ndarray
+        The start values of the first sequence of intervals, in increasing order.
+    end_a : numpy.ndarray
+        The end values of the first sequence of intervals, in increasing order.
+    start_b : numpy.ndarray
+        The start values of the second sequence of intervals, in increasing order.
+    end_b : numpy.ndarray
+        The end values of the second sequence of intervals, in increasing order.
+    tol : float, optional
+        The minimum length of an overlap.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        0. The indices of the overlapping intervals in the first sequence.
+        1. The indices of the overlapping intervals in the second sequence.
+        2. The start values of the overlaps.
+        3. The end values of the overlaps.
+
+    """
+    # per interval of the first sequence, the range of overlapping intervals of the second
+    first = np.searchsorted(end_b, start_a, side="right")
+    last = np.searchsorted(start_b, end_a, side="left")
+    count = np.maximum(last - first, 0)
+
+    i = np.repeat(np.arange(len(start_a)), count)
+    j = np.repeat(first - np.cumsum(count) + count, count) + np.arange(count.sum())
+
+    lo = np.maximum(start_a[i], start_b[j])
+    hi = np.minimum(end_a[i], end_b[j])
+    overlap = hi - lo > tol
+
+    return i[overlap], j[overlap], lo[overlap], hi[overlap]
+
+
 class Template:
     def __init__(self):
         pass
@@ -5,9 +54,25 @@ class Template:
     def blocks(self):
         raise NotImplementedError
 
-    def interfaces(self):
+    def blocks_numpy(self):
         raise NotImplementedError
 
+    def interfaces_numpy(self):
+        raise NotImplementedError
+
+    def interfaces(self):
+        """Compute the interfaces between the blocks.
+
+        Returns
+        -------
+        list[tuple[tuple[int, int], list[list[float]]]]
+            A list of interfaces defined as a pair of block indices and the corners of the interface polygon.
+            The normal of the polygon points from the first to the second block of the pair.
+
+        """
+        pairs, polygons = self.interfaces_numpy()
+        return [((u, v), points) for (u, v), points in zip(pairs.tolist(), polygons.tolist())]
+
     def to_blocks_and_interfaces(self):
         """Convert the geometry to a list of block meshes,
         and a list of block index pairs representing connections or interfaces.
@@ -18,4 +83,4 @@ class Template:
             0. List of meshes representing the block geometries.
             1. List of block index pairs representing connections or interfaces.
         """
-        raise NotImplementedError
+        return self.blocks(), [pair for pair, _ in self.interfaces()]
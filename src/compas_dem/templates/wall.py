@@ -1,13 +1,169 @@
+from typing import Optional
+
+import numpy as np
+
+from compas.datastructures import Mesh
+
 from .template import Template
+from .template import interval_overlaps_numpy
 
 
 class WallTemplate(Template):
-    """Create voussoirs for a typical brick wall."""
+    """Create blocks for a typical brick wall.
+
+    Parameters
+    ----------
+    courses : int, optional
+        The number of courses.
+    bricks : int, optional
+        The number of stretchers per course.
+        The length of the wall is ``bricks * brick_length``.
+    brick_length : float, optional
+        The length of the bricks.
+    brick_width : float, optional
+        The width of the bricks.
+    brick_height : float, optional
+        The height of the bricks.
+    bond : {"running", "english"}, optional
+        The bond pattern.
+        A running bond wall is one brick wide, with every other course shifted by half a brick.
+        An English bond wall is one brick long, with alternating courses of stretchers and headers.
+    openings : list[list[float]], optional
+        Rectangular openings in the wall, defined as ``[xmin, xmax, zmin, zmax]``.
+        Bricks overlapping with an opening are omitted.
+
+    Notes
+    -----
+    The wall is built without mortar joints, starting at the origin, along the X axis.
+    The bricks of the first course are the supports.
+
+    For English bond, the width of the bricks is taken as half their length,
+    such that two stretchers match the length of one header.
+    The header courses are closed with queen closers of half the width of a header at both ends.
+
+    """
 
-    def __init__(self):
+    faces = [
+        [0, 3, 2, 1],
+        [4, 5, 6, 7],
+        [0, 1, 5, 4],
+        [1, 2, 6, 5],
+        [2, 3, 7, 6],
+        [3, 0, 4, 7],
+    ]
+
+    def __init__(
+        self,
+        courses: int = 10,
+        bricks: int = 10,
+        brick_length: float = 0.24,
+        brick_width: float = 0.115,
+        brick_height: float = 0.07,
+        bond: str = "running",
+        openings: Optional[list[list[float]]] = None,
+    ):
         super().__init__()
 
-    def blocks(self):
+        if bond not in ("running", "english"):
+            raise ValueError("bond must be 'running' or 'english'.")
+
+        self.courses = courses
+        self.bricks = bricks
+        self.brick_length = brick_length
+        self.brick_width = brick_width
+        self.brick_height = brick_height
+        self.bond = bond
+        self.openings = openings or []
+
+    def blocks_numpy(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the corner coordinates of all bricks at once.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            0. The block vertices as an array of shape ``(n, 8, 3)``.
+            1. The block faces shared by all blocks as an array of shape ``(6, 4)``.
+            2. The support flags of the blocks as a boolean array of shape ``(n,)``.
+
+        Notes
+        -----
+        The bricks are ordered per course, per wythe within a course, and along the wall within a wythe.
+
+        """
+        boxes, courses, _ = self._layout()
+        x0, x1, y0, y1, z0, z1 = boxes.T
+
+        vertices = np.empty((len(boxes), 8, 3))
+        vertices[:, :, 0] = np.stack([x0, x1, x1, x0] * 2, axis=1)
+        vertices[:, :, 1] = np.stack([y0, y0, y1, y1] * 2, axis=1)
+        vertices[:, :, 2] = np.stack([z0] * 4 + [z1] * 4, axis=1)
+
+        faces = np.array(self.faces)
+        supports = courses == 0
+
+        return vertices, faces, supports
+
+    def interfaces_numpy(self) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the bed, head and collar joints between the bricks from the bond pattern.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            0. The pairs of block indices as an array of shape ``(m, 2)``.
+            1. The interface polygons as an array of shape ``(m, 4, 3)``.
+               The corners are ordered such that the polygon normal points from the first to the second block of the pair.
+
+        Notes
+        -----
+        The head joints connect consecutive bricks of the same wythe.
+        The collar joints connect the bricks of neighbouring wythes of the same course.
+        The bed joints connect the bricks of neighbouring courses that overlap in plan.
+
+        """
+        boxes, _, wythes = self._layout()
+        x0, x1, y0, y1, z0, z1 = boxes.T
+        tol = 1e-9 * self.brick_length
+
+        pairs = []
+        polygons = []
+
+        # head joints
+        a = np.arange(len(boxes) - 1)
+        b = a + 1
+        touching = (np.abs(x1[a] - x0[b]) < tol) & (y0[a] == y0[b]) & (z0[a] == z0[b])
+        a = a[touching]
+        b = b[touching]
+        x = x1[a]
+        polygon = np.empty((len(a), 4, 3))
+        polygon[:, :, 0] = x[:, None]
+        polygon[:, :, 1] = np.stack([y0[a], y1[a], y1[a], y0[a]], axis=1)
+        polygon[:, :, 2] = np.stack([z0[a], z0[a], z1[a], z1[a]], axis=1)
+        pairs.append(np.stack([a, b], axis=1))
+        polygons.append(polygon)
+
+        for (course_a, ya0, ya1, first_a, last_a), (course_b, yb0, yb1, first_b, last_b) in self._neighbouring_wythes(wythes):
+            a = np.arange(first_a, last_a)
+            b = np.arange(first_b, last_b)
+            i, j, lo, hi = interval_overlaps_numpy(x0[a], x1[a], x0[b], x1[b], tol=tol)
+            i = a[i]
+            j = b[j]
+            polygon = np.empty((len(i), 4, 3))
+            if course_a == course_b:
+                # collar joints
+                polygon[:, :, 0] = np.stack([lo, lo, hi, hi], axis=1)
+                polygon[:, :, 1] = ya1
+                polygon[:, :, 2] = np.stack([z0[i], z1[i], z1[i], z0[i]], axis=1)
+            else:
+                # bed joints
+                polygon[:, :, 0] = np.stack([lo, hi, hi, lo], axis=1)
+                polygon[:, :, 1] = [max(ya0, yb0), max(ya0, yb0), min(ya1, yb1), min(ya1, yb1)]
+                polygon[:, :, 2] = z1[i][:, None]
+            pairs.append(np.stack([i, j], axis=1))
+            polygons.append(polygon)
+
+        return np.concatenate(pairs), np.concatenate(polygons)
+
+    def blocks(self) -> list[Mesh]:
         """Compute the blocks.
 
         Returns
@@ -21,4 +177,82 @@ class WallTemplate(Template):
         to create an assembly "from geometry".
 
         """
-        pass
+        vertices, faces, supports = self.blocks_numpy()
+        faces = faces.tolist()
+
+        meshes: list[Mesh] = []
+        for points, is_support in zip(vertices.tolist(), supports.tolist()):
+            mesh: Mesh = Mesh.from_vertices_and_faces(points, faces)
+            mesh.attributes["is_support"] = is_support
+            meshes.append(mesh)
+
+        return meshes
+
+    def _wythes(self, course: int) -> list[tuple[float, float, np.ndarray]]:
+        # the wythes of a course, as the y range and the x coordinates of the head joints
+        length = self.brick_length
+        n = self.bricks
+        full = np.arange(n + 1) * length
+        shifted = np.concatenate(([0.0], length / 2 + np.arange(n) * length, [n * length]))
+
+        if self.bond == "running":
+            if course % 2 == 0:
+                return [(0.0, self.brick_width, full)]
+            return [(0.0, self.brick_width, shifted)]
+
+        if course % 2 == 0:
+            return [(0.0, length / 2, full), (length / 2, length, full)]
+        headers = np.concatenate(([0.0], length / 4 + np.arange(2 * n) * length / 2, [n * length]))
+        return [(0.0, length, headers)]
+
+    def _layout(self) -> tuple[np.ndarray, np.ndarray, list[tuple[int, float, float, int, int]]]:
+        # the boxes of the bricks as [x0, x1, y0, y1, z0, z1],
+        # the course of every brick,
+        # and the wythes as course, y range and index range of their bricks
+        boxes = []
+        courses = []
+        wythes = []
+        count = 0
+
+        openings = np.array(self.openings, dtype=float).reshape(-1, 4)
+
+        for course in range(self.courses):
+            z0 = course * self.brick_height
+            z1 = z0 + self.brick_height
+
+            for y0, y1, x in self._wythes(course):
+                box = np.empty((len(x) - 1, 6))
+                box[:, 0] = x[:-1]
+                box[:, 1] = x[1:]
+                box[:, 2] = y0
+                box[:, 3] = y1
+                box[:, 4] = z0
+                box[:, 5] = z1
+
+                if len(openings):
+                    overlap_x = (np.minimum(box[:, 1, None], openings[:, 1]) - np.maximum(box[:, 0, None], openings[:, 0])) > 0
+                    overlap_z = (np.minimum(z1, openings[:, 3]) - np.maximum(z0, openings[:, 2])) > 0
+                    box = box[~np.any(overlap_x & overlap_z, axis=1)]
+
+                boxes.append(box)
+                courses.append(np.full(len(box), course))
+                wythes.append((course, y0, y1, count, count + len(box)))
+                count += len(box)
+
+        return np.concatenate(boxes), np.concatenate(courses), wythes
+
+    def _neighbouring_wythes(self, wythes):
+        # pairs of wythes of the same course that touch,
+        # and pairs of wythes of consecutive courses that overlap in plan
+        course_wythes: dict[int, list] = {}
+        for wythe in wythes:
+            course_wythes.setdefault(wythe[0], []).append(wythe)
+
+        for course, items in course_wythes.items():
+            for a in items:
+                for b in items:
+                    if b[1] == a[2]:
+                        yield a, b
+                for b in course_wythes.get(course + 1, []):
+                    if min(a[2], b[2]) > max(a[1], b[1]):
+                        yield a, b
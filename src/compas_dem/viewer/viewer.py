@@ -1,3 +1,5 @@
+from typing import Optional
+
 import numpy as np
 from compas_viewer.config import Config
 from compas_viewer.scene import ViewerSceneObject
@@ -5,6 +7,8 @@ from compas_viewer.viewer import Viewer
 
 import compas.geometry as cg
 from compas.colors import Color
+from compas.datastructures import Graph
+from compas.datastructures import Mesh
 from compas.scene import Group
 from compas_dem.models import BlockModel
 
@@ -105,16 +109,41 @@ config.ui.menubar.items.append(
 
 
 class DEMViewer(Viewer):
+    """Viewer for block models and their solutions.
+
+    Parameters
+    ----------
+    model : :class:`compas_dem.models.BlockModel`
+        The block model.
+    config : :class:`compas_viewer.config.Config`, optional
+        The viewer configuration.
+    merged : bool, optional
+        If True, all blocks, all contacts and all force lines are drawn as one scene object per group,
+        instead of one scene object per element.
+        This is much faster for large models.
+        The elements of the faces and lines of the merged objects are listed in :attr:`index_maps`.
+
+    Attributes
+    ----------
+    index_maps : dict[str, list]
+        Per merged scene object, the block graph node or the contact graph edge
+        of every face of a merged mesh, or of every edge of a merged line graph.
+        See :meth:`find_element`.
+
+    """
+
     blockcolor: Color = Color.grey().lightened(85)
     supportcolor: Color = Color.red().lightened(50)
     interfacecolor: Color = Color.cyan().lightened(50)
     graphnodecolor: Color = Color.blue()
     graphedgecolor: Color = Color.cyan().lightened(50)
 
-    def __init__(self, model: BlockModel, config=config):
+    def __init__(self, model: BlockModel, config=config, merged: bool = False):
         super().__init__(config=config)
         self.model = model
+        self.merged = merged
         self.groups = {}
+        self.index_maps: dict[str, list] = {}
 
     # def add_formdiagram(self, formdiagram: FormDiagram, maxradius=50, minradius=10):
     #     formgroup = self.scene.add_group(name="FormDiagram")
@@ -165,36 +194,167 @@ class DEMViewer(Viewer):
 
     def add_supports(self):
         parent: Group = self.groups["supports"]
+        blocks = list(self.model.supports())
 
-        for block in self.model.supports():
-            parent.add(
-                block.modelgeometry,
-                facecolor=self.supportcolor,  # type: ignore
-                edgecolor=self.supportcolor.contrast,
-                linewidth=0.5,  # type: ignore
-                name=f"Block {block.graphnode}",  # type: ignore
-            )
+        self.add_meshes(
+            parent,
+            [block.modelgeometry for block in blocks],
+            [block.graphnode for block in blocks],
+            facecolor=self.supportcolor,  # type: ignore
+            edgecolor=self.supportcolor.contrast,
+            linewidth=0.5,  # type: ignore
+        )
 
     def add_blocks(self):
         parent: Group = self.groups["blocks"]
+        blocks = list(self.model.blocks())
 
-        for block in self.model.blocks():
-            parent.add(
-                block.modelgeometry,
-                facecolor=self.blockcolor,  # type: ignore
-                edgecolor=self.blockcolor.contrast,
-                linewidth=0.5,  # type: ignore
-                name=f"Block {block.graphnode}",  # type: ignore
-            )
+        self.add_meshes(
+            parent,
+            [block.modelgeometry for block in blocks],
+            [block.graphnode for block in blocks],
+            facecolor=self.blockcolor,  # type: ignore
+            edgecolor=self.blockcolor.contrast,
+            linewidth=0.5,  # type: ignore
+        )
 
     def add_contacts(self):
         parent: Group = self.groups["contacts"]
+        color = self.interfacecolor
+
+        if self.merged:
+            edges = []
+            polygons = []
+            for edge in self.model.graph.edges():
+                for contact in self.model.graph.edge_attribute(edge, "contacts") or []:  # type: ignore
+                    edges.append(edge)
+                    polygons.append(contact.polygon)
+            self.add_polygons(parent, polygons, edges, facecolor=color, linecolor=color.contrast, linewidth=1)
+            return
 
         for contact in self.model.contacts():
             geometry = contact.polygon
-            color = self.interfacecolor
             parent.add(geometry, linewidth=1, surfacecolor=color, linecolor=color.contrast)  # type: ignore
 
+    # =============================================================================
+    # Merged scene objects
+    # =============================================================================
+
+    def add_meshes(self, parent: Group, meshes: list[Mesh], keys: list, transformations: Optional[list] = None, names: Optional[list[str]] = None, **kwargs):
+        """Add meshes to a group, as one scene object per mesh or as one merged scene object.
+
+        Parameters
+        ----------
+        parent : :class:`compas.scene.Group`
+            The group.
+        meshes : list[:class:`compas.datastructures.Mesh`]
+            The meshes.
+        keys : list
+            The model key of every mesh, for example the graph node of a block.
+        transformations : list[:class:`compas.geometry.Transformation`], optional
+            A transformation per mesh.
+        names : list[str], optional
+            The names of the individual scene objects. Default is ``"Block {key}"``.
+        **kwargs
+            The visualisation options of the scene objects.
+
+        Returns
+        -------
+        None
+
+        """
+        if not self.merged:
+            names = names or [f"Block {key}" for key in keys]
+            for index, (mesh, name) in enumerate(zip(meshes, names)):
+                if transformations:
+                    mesh = mesh.transformed(transformations[index])
+                parent.add(mesh, name=name, **kwargs)  # type: ignore
+            return
+
+        mesh, face_mesh = meshes_to_mesh(meshes, transformations)
+        parent.add(mesh, name=parent.name, **kwargs)  # type: ignore
+        self.index_maps[parent.name] = [keys[index] for index in face_mesh]
+
+    def add_polygons(self, parent: Group, polygons: list[cg.Polygon], keys: list, names: Optional[list[str]] = None, **kwargs):
+        """Add polygons to a group, as one scene object per polygon or as one merged mesh.
+
+        Parameters
+        ----------
+        parent : :class:`compas.scene.Group`
+            The group.
+        polygons : list[:class:`compas.geometry.Polygon`]
+            The polygons.
+        keys : list
+            The model key of every polygon, for example the graph edge of a contact.
+        names : list[str], optional
+            The names of the individual scene objects.
+        **kwargs
+            The visualisation options of the scene objects.
+
+        Returns
+        -------
+        None
+
+        """
+        if not self.merged:
+            names = names or [f"contact_polygon_{key}" for key in keys]
+            for polygon, name in zip(polygons, names):
+                parent.add(polygon.to_brep(), name=name, **kwargs)  # type: ignore
+            return
+
+        mesh = polygons_to_mesh(polygons)
+        parent.add(mesh, name=parent.name, **kwargs)  # type: ignore
+        self.index_maps[parent.name] = list(keys)
+
+    def add_lines(self, parent: Group, lines: list[cg.Line], keys: list, names: list[str], **kwargs):
+        """Add lines to a group, as one scene object per line or as one merged graph.
+
+        Parameters
+        ----------
+        parent : :class:`compas.scene.Group`
+            The group.
+        lines : list[:class:`compas.geometry.Line`]
+            The lines.
+        keys : list
+            The model key of every line, for example the graph edge of a contact.
+        names : list[str]
+            The names of the individual scene objects.
+        **kwargs
+            The visualisation options of the scene objects.
+
+        Returns
+        -------
+        None
+
+        """
+        if not self.merged:
+            for line, name in zip(lines, names):
+                parent.add(line, name=name, **kwargs)  # type: ignore
+            return
+
+        color = kwargs.pop("linecolor", None) or kwargs.pop("color", None)
+        graph = lines_to_graph(lines)
+        parent.add(graph, name=parent.name, show_nodes=False, edgecolor=color, **kwargs)  # type: ignore
+        self.index_maps[parent.name] = list(keys)
+
+    def find_element(self, name: str, index: int):
+        """Find the model element of a face or line of a merged scene object.
+
+        Parameters
+        ----------
+        name : str
+            The name of the merged scene object, which is the name of its group.
+        index : int
+            The index of the face of a merged mesh, or of the edge of a merged line graph.
+
+        Returns
+        -------
+        int | tuple[int, int]
+            The graph node of a block, or the graph edge of a contact.
+
+        """
+        return self.index_maps[name][index]
+
     # =============================================================================
     # Graph
     # =============================================================================
@@ -209,6 +369,14 @@ class DEMViewer(Viewer):
         nodegroup = self.scene.add_group(name="Nodes", parent=parent)  # type: ignore
         edgegroup = self.scene.add_group(name="Edges", parent=parent)  # type: ignore
 
+        if self.merged:
+            nodes = list(node_point)
+            index = {node: i for i, node in enumerate(nodes)}
+            graph = Graph.from_nodes_and_edges(points, [(index[u], index[v]) for u, v in self.model.graph.edges()])
+            nodegroup.add(graph, name="Nodes", show_edges=False, nodecolor=self.graphnodecolor)  # type: ignore
+            self.add_lines(edgegroup, lines, list(self.model.graph.edges()), [], linewidth=1, linecolor=self.graphedgecolor)
+            return
+
         nodegroup.add_from_list(points, pointsize=10, pointcolor=self.graphnodecolor)  # type: ignore
         edgegroup.add_from_list(lines, linewidth=1, linecolor=self.graphedgecolor)  # type: ignore
 
@@ -223,7 +391,7 @@ class DEMViewer(Viewer):
 
         """
 
-        moved_blocks = []
+        transformations = []
 
         solution_group = self.scene.add_group(name="Solution")
         updated_blocks = self.scene.add_group(name="Updated_Blocks", parent=solution_group)
@@ -237,20 +405,31 @@ class DEMViewer(Viewer):
         degenerate_contacts = self.scene.add_group(name="Degenerate_Contacts", parent=solution_group)
 
         block_ln = []
-        for block in self.model.elements():
+        blocks = list(self.model.elements())
+        for block in blocks:
             T = self.model.graph.node_attribute(block.graphnode, "transformation") or cg.Transformation()
-            new_block = block.modelgeometry.transformed(T)
-            moved_blocks.append(new_block)
-            updated_blocks.add(
-                new_block,
-                name=f"block_{block.graphnode}",
-                opacity=0.25,
-            )
+            transformations.append(T)
             try:
                 block_ln.append(block.modelgeometry.edge_length([0, 1]))
             except Exception:
                 pass
 
+        self.add_meshes(
+            updated_blocks,
+            [block.modelgeometry for block in blocks],
+            [block.graphnode for block in blocks],
+            transformations=transformations,
+            names=[f"block_{block.graphnode}" for block in blocks],
+            opacity=0.25,
+        )
+
+        # the geometry of the contacts is collected per group,
+        # and added as individual or merged scene objects at the end
+        force_lines: list[tuple[cg.Line, tuple, str]] = []
+        contact_polygons: list[tuple[cg.Polygon, tuple]] = []
+        point_lines: list[tuple[cg.Line, tuple, str]] = []
+        contact_lines: list[tuple[cg.Line, tuple]] = []
+
         forces = [np.array((self.model.graph.edge_attribute(edge, "force") or [0, 0, 0])) for edge in self.model.graph.edges()]
         max_force = max(np.linalg.norm(force) for force in forces)
         block_scale = scale * max(block_ln) / max_force if max_force > 0 else 1.0
@@ -261,100 +440,60 @@ class DEMViewer(Viewer):
         # =============================================================================
         # Supports and reactions
         # =============================================================================
-        supports = list(support.graphnode for support in self.model.supports())
-        support_edges = {s: [] for s in supports}
+        supports = set(support.graphnode for support in self.model.supports())
+        face_contact_set = set(face_contact_edges)
+        edge_contact_set = set(edge_contact_edges)
+
         for edge in self.model.graph.edges():
             u, v = edge
-            if u in supports:
-                support_edges[u].append(edge)
-            if v in supports:
-                support_edges[v].append(edge)
-
-        for support_node, edges in support_edges.items():
-            point_forces: list[tuple[cg.Point, cg.Vector]] = []
-            support_block = self.model.graph.node_element(support_node)
-            support_point = support_block.point
-
-            for edge in edges:
-                if edge in face_contact_edges:
-                    fc = self.model.graph.edge_attribute(edge, "contact_data")
-
-                    if fc is None:
-                        continue
-
-                    resultant = fc.resultantline()
-                    if resultant is None:
-                        continue
-
-                    from_support = cg.Vector.from_start_end(support_point, resultant.midpoint)
-                    if resultant.vector.dot(from_support) < 0:
-                        resultant.vector.flip()
-
-                    point_forces.append((fc.resultantpoint, resultant.vector))
-
-                    # Viz the contact polygon
-
-                    contact_polygon = self.model.graph.edge_attribute(edge, "contact_polygon")
-
-                    if contact_polygon.area < 1e-6:
-                        print(f"WARNING:\nContact polygon for support edge {edge} has very small area ({contact_polygon.area:.2e}), skipping visualization. \n")
-                        continue
+            if u not in supports and v not in supports:
+                continue
 
-                    polyg = contact_polygon.to_brep()
-                    support_contacts.add(
-                        polyg,
-                        name=f"contact_polygon_{edge}",
-                        color=Color.brown(),
-                        opacity=0.5,
-                    )
+            if edge in face_contact_set:
+                fc = self.model.graph.edge_attribute(edge, "contact_data")
+                if fc is None or fc.resultantline() is None:
+                    continue
 
-                elif edge in edge_contact_edges:
-                    ec = self.model.graph.edge_attribute(edge, "contact_data")
-                    support_contacts.add(
-                        cg.Line(ec.points[0], ec.points[1]),
-                        name=f"contact_line_{edge}",
-                        linewidth=2,
-                        linecolor=Color.brown(),
-                    )
+                contact_polygon = self.model.graph.edge_attribute(edge, "contact_polygon")
 
-                    if ec.resultantline() is None:
-                        continue
+                if contact_polygon.area < 1e-6:
+                    print(f"WARNING:\nContact polygon for support edge {edge} has very small area ({contact_polygon.area:.2e}), skipping visualization. \n")
+                    continue
 
-                    from_support = cg.Vector.from_start_end(support_point, resultant.midpoint)
+                polyg = contact_polygon.to_brep()
+                support_contacts.add(
+                    polyg,
+                    name=f"contact_polygon_{edge}",
+                    color=Color.brown(),
+                    opacity=0.5,
+                )
 
-                    if resultant.vector.dot(from_support) < 0:
-                        resultant.vector.flip()
-                    point_forces.append((ec.resultantpoint, ec.resultantline().vector))
+            elif edge in edge_contact_set:
+                ec = self.model.graph.edge_attribute(edge, "contact_data")
+                support_contacts.add(
+                    cg.Line(ec.points[0], ec.points[1]),
+                    name=f"contact_line_{edge}",
+                    linewidth=2,
+                    linecolor=Color.brown(),
+                )
 
-            if point_forces:
-                weights = [f.length for _, f in point_forces]
+        _, forces, _, points = self.model.support_reactions()
+        for force, point in zip(forces.tolist(), points.tolist()):
+            resultant = cg.Vector(*force)
+            if not resultant.length:
+                continue
 
-                total_weight = sum(weights)
+            forcevector = resultant * 0.5
+            position = cg.Point(*point)
 
-                if total_weight > 0:
-                    position = cg.Point(
-                        sum(p.x * w for (p, _), w in zip(point_forces, weights)) / total_weight,
-                        sum(p.y * w for (p, _), w in zip(point_forces, weights)) / total_weight,
-                        sum(p.z * w for (p, _), w in zip(point_forces, weights)) / total_weight,
-                    )
-                    resultant = cg.Vector(0, 0, 0)
-
-                    for _, f in point_forces:
-                        if f:
-                            resultant += f
-
-                    # if resultant.dot(cg.Vector(0, 0, 1)) < 0:
-                    #     resultant.flip()
-                    forcevector = resultant * 0.5
-
-                    p1 = position + forcevector * block_scale
-                    p2 = position - forcevector * block_scale
-                    reactions.add(
-                        cg.Line(p1, p2),
-                        name=f"F=({resultant.x:.1f}, {resultant.y:.1f}, {resultant.z:.1f}) \n|F|={resultant.length:.1f}",
-                        linewidth=2.5,
-                        color=Color.red(),
-                    )
+            p1 = position + forcevector * block_scale
+            p2 = position - forcevector * block_scale
+            reactions.add(
+                cg.Line(p1, p2),
+                name=f"F=({resultant.x:.1f}, {resultant.y:.1f}, {resultant.z:.1f}) \n|F|={resultant.length:.1f}",
+                linewidth=2.5,
+                color=Color.red(),
+            )
 
         # =============================================================================
         # Visualize forces at contacts
@@ -371,12 +510,7 @@ class DEMViewer(Viewer):
                 continue
             resultant_line = fc.resultantline(scale=block_scale)
             if resultant_line is not None:
-                resultant_forces.add(
-                    resultant_line,
-                    name=f"F=({resultant.x:.1f}, {resultant.y:.1f}, {resultant.z:.1f}) \n|F|={resultant.length:.1f}",
-                    linewidth=2.5,
-                    linecolor=Color.blue(),
-                )
+                force_lines.append((resultant_line, edge, f"F=({resultant.x:.1f}, {resultant.y:.1f}, {resultant.z:.1f}) \n|F|={resultant.length:.1f}"))
 
             if contact_polygon.area < 1e-6:
                 if len(contact_polygon.points) < 3:
@@ -410,13 +544,7 @@ class DEMViewer(Viewer):
 
                 continue
 
-            polyg = contact_polygon.to_brep()
-            face_contacts.add(
-                polyg,
-                name=f"contact_polygon_{edge}",
-                color=Color.green(),
-                opacity=0.5,
-            )
+            contact_polygons.append((contact_polygon, edge))
 
             # Viz the point forces
 
@@ -431,12 +559,7 @@ class DEMViewer(Viewer):
                     forcevector = forcevector_unsc * block_scale
                     p1 = point.translated(forcevector)
                     p2 = point.translated(-forcevector)
-                    point_results.add(
-                        cg.Line(p1, p2),
-                        name=f"[{c_np:.1f}, {c_u:.1f}, {c_v:.1f}] \n|F|={forcevector_unsc.length:.1f}",
-                        linewidth=2.5,
-                        linecolor=Color.magenta(),
-                    )
+                    point_lines.append((cg.Line(p1, p2), edge, f"[{c_np:.1f}, {c_u:.1f}, {c_v:.1f}] \n|F|={forcevector_unsc.length:.1f}"))
 
         # Edge contacts
         # --------------
@@ -450,16 +573,103 @@ class DEMViewer(Viewer):
 
             if line is None:
                 continue
-            resultant_forces.add(
-                line,
-                name=f"F=({resultant.x:.1f}, {resultant.y:.1f}, {resultant.z:.1f}) \n|F|={resultant.length:.1f}",
-                linewidth=2.5,
-                linecolor=Color.blue(),
-            )
-
-            edge_contacts.add(
-                cg.Line(ec.points[0], ec.points[1]),
-                name=f"contact_line_{edge}",
-                linewidth=2,
-                linecolor=Color.red(),
-            )
+            force_lines.append((line, edge, f"F=({resultant.x:.1f}, {resultant.y:.1f}, {resultant.z:.1f}) \n|F|={resultant.length:.1f}"))
+            contact_lines.append((cg.Line(ec.points[0], ec.points[1]), edge))
+
+        if force_lines:
+            lines, keys, names = zip(*force_lines)
+            self.add_lines(resultant_forces, list(lines), list(keys), list(names), linewidth=2.5, linecolor=Color.blue())
+
+        if contact_polygons:
+            polygons, keys = zip(*contact_polygons)
+            self.add_polygons(face_contacts, list(polygons), list(keys), color=Color.green(), opacity=0.5)
+
+        if point_lines:
+            lines, keys, names = zip(*point_lines)
+            self.add_lines(point_results, list(lines), list(keys), list(names), linewidth=2.5, linecolor=Color.magenta())
+
+        if contact_lines:
+            lines, keys = zip(*contact_lines)
+            self.add_lines(edge_contacts, list(lines), list(keys), [f"contact_line_{key}" for key in keys], linewidth=2, linecolor=Color.red())
+
+
+# =============================================================================
+# Merged geometry
+# =============================================================================
+
+
+def meshes_to_mesh(meshes: list[Mesh], transformations: Optional[list[cg.Transformation]] = None) -> tuple[Mesh, list[int]]:
+    """Merge a collection of meshes into one mesh.
+
+    Parameters
+    ----------
+    meshes : list[:class:`compas.datastructures.Mesh`]
+        The meshes.
+    transformations : list[:class:`compas.geometry.Transformation`], optional
+        A transformation per mesh, applied to the vertices of the merged mesh.
+
+    Returns
+    -------
+    tuple[:class:`compas.datastructures.Mesh`, list[int]]
+        0. The merged mesh.
+        1. The index of the original mesh of every face of the merged mesh.
+
+    """
+    vertices = []
+    faces = []
+    counts = []
+    face_mesh = []
+
+    for index, mesh in enumerate(meshes):
+        xyz, cycles = mesh.to_vertices_and_faces()
+        offset = len(vertices)
+        vertices += xyz
+        faces += [[offset + vertex for vertex in cycle] for cycle in cycles]
+        counts.append(len(xyz))
+        face_mesh += [index] * len(cycles)
+
+    if transformations and vertices:
+        matrices = np.array([T.matrix for T in transformations])[np.repeat(np.arange(len(counts)), counts)]
+        points = np.array(vertices, dtype=float)
+        vertices = (np.einsum("nij,nj->ni", matrices[:, :3, :3], points) + matrices[:, :3, 3]).tolist()
+
+    return Mesh.from_vertices_and_faces(vertices, faces), face_mesh
+
+
+def polygons_to_mesh(polygons: list[cg.Polygon]) -> Mesh:
+    """Merge a collection of polygons into one mesh with one face per polygon.
+
+    Parameters
+    ----------
+    polygons : list[:class:`compas.geometry.Polygon`]
+        The polygons.
+
+    Returns
+    -------
+    :class:`compas.datastructures.Mesh`
+
+    """
+    vertices = []
+    faces = []
+    for polygon in polygons:
+        faces.append(list(range(len(vertices), len(vertices) + len(polygon.points))))
+        vertices += polygon.points
+    return Mesh.from_vertices_and_faces(vertices, faces)
+
+
+def lines_to_graph(lines: list[cg.Line]) -> Graph:
+    """Merge a collection of lines into one graph with one edge per line.
+
+    Parameters
+    ----------
+    lines : list[:class:`compas.geometry.Line`]
+        The lines.
+
+    Returns
+    -------
+    :class:`compas.datastructures.Graph`
+
+    """
+    nodes = [point for line in lines for point in (line.start, line.end)]
+    edges = [(2 * i, 2 * i + 1) for i in range(len(lines))]
+    return Graph.from_nodes_and_edges(nodes, edges)
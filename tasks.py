@@ -7,6 +7,27 @@ from compas_invocations2 import docs
 from compas_invocations2 import style
 from compas_invocations2 import tests
 from invoke import Collection
+from invoke import task
+
+
+@task(
+    help={
+        "save": "Save the results as a baseline with this name.",
+        "compare": "Compare the results with a saved baseline, e.g. 0001 or the name of the baseline.",
+        "threshold": "The regression that makes the comparison fail, e.g. mean:25%.",
+    }
+)
+def benchmark(ctx, save=None, compare=None, threshold="mean:25%"):
+    """Run the benchmark suite, optionally saving or comparing the results as JSON baselines."""
+    storage = os.path.join(os.path.dirname(__file__), "benchmarks", "baselines")
+    command = ["pytest", "benchmarks", "--benchmark-storage=file://{}".format(storage)]
+    if save:
+        command.append("--benchmark-save={}".format(save))
+    if compare:
+        command.append("--benchmark-compare={}".format(compare))
+        command.append("--benchmark-compare-fail={}".format(threshold))
+    ctx.run(" ".join(command), pty=True)
+
 
 ns = Collection(
     docs.help,
@@ -18,6 +39,7 @@ ns = Collection(
     tests.test,
     tests.testdocs,
     tests.testcodeblocks,
+    benchmark,
     build.prepare_changelog,
     build.clean,
     build.release,
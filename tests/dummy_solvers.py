@@ -0,0 +1,43 @@
+"""Solve functions and a solver backend for the tests of the worker processes, importable by the spawned workers."""
+
+import time
+
+from compas.geometry import Translation
+from compas_dem.instrumentation import current_tracer
+from compas_dem.problem import SolverBackend
+from compas_dem.problem import register_solver_backend
+
+
+def solve(problem, mode="done", **parameters):
+    if mode == "sleep":
+        time.sleep(30)
+    elif mode == "error":
+        raise ValueError("The dummy solve failed.")
+    elif mode == "memory":
+        bytearray(2**33)
+
+    graph = problem.model.graph
+    for node in graph.nodes():
+        graph.node_attribute(node, "transformation", Translation.from_vector([0.0, 0.0, 0.1 * node]))
+    for edge in graph.edges():
+        graph.edge_attribute(edge, "force", [0.0, 0.0, 1.0])
+
+
+class DummyBackend(SolverBackend):
+    name = "Dummy"
+    parallel_safe = True
+
+    def prepare(self, problem, n_steps=3, delay=0.0):
+        return {"problem": problem, "n_steps": n_steps, "delay": delay}
+
+    def solve(self, state):
+        tracer = current_tracer()
+        for step in range(state["n_steps"]):
+            time.sleep(state["delay"])
+            tracer.event("dummy.step", step=step, n_steps=state["n_steps"], urf=1.0 / (step + 1), interactions=2)
+
+    def postprocess(self, state):
+        solve(state["problem"])
+
+
+register_solver_backend(DummyBackend(), replace=True)
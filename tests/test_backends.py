@@ -0,0 +1,63 @@
+import pytest
+
+from compas_dem.material import Stone
+from compas_dem.models import BlockModel
+from compas_dem.problem import Problem
+from compas_dem.problem import Solver
+from compas_dem.problem import SolverBackend
+from compas_dem.problem import register_solver_backend
+from compas_dem.problem import solver_backend
+from compas_dem.problem import solver_backends
+from compas_dem.problem.backends import SOLVER_BACKENDS
+from compas_dem.templates import StackTemplate
+
+
+class RecordingBackend(SolverBackend):
+    name = "Recording"
+    parallel_safe = True
+
+    def prepare(self, problem, **parameters):
+        return {"problem": problem, "parameters": parameters, "stages": ["prepare"]}
+
+    def solve(self, state):
+        state["stages"].append("solve")
+
+    def postprocess(self, state):
+        state["stages"].append("postprocess")
+        return state
+
+
+def test_solver_backends():
+    capabilities = solver_backends()
+    assert capabilities["LMGC90"]["dynamic"] and not capabilities["LMGC90"]["parallel_safe"]
+    assert not capabilities["CRA"]["dynamic"] and not capabilities["CRA"]["tension"]
+    assert capabilities["RBE"]["tension"]
+
+    with pytest.raises(ValueError):
+        solver_backend("Unknown")
+    with pytest.raises(ValueError):
+        register_solver_backend(solver_backend("CRA"))
+
+    model = BlockModel.from_template(StackTemplate(n=3))
+    stone = Stone(fc=30e6, density=2400)
+    model.add_material(stone)
+    model.assign_material(stone, elements=list(model.elements()))
+    model.compute_contacts()
+    problem = Problem(model)
+    problem.add_supports([0])
+    problem.add_contact_model("MohrCoulomb", mu=0.6, c=0)
+
+    register_solver_backend(RecordingBackend())
+    try:
+        solver = Solver()
+        solver.name = "Recording"
+        solver.parameters = {"tolerance": 1e-3, "unused": None}
+        state = problem.solve(solver)
+        assert state["stages"] == ["prepare", "solve", "postprocess"]
+        assert state["parameters"] == {"tolerance": 1e-3}
+
+        problem.boundary_conditions.add_displacement(2, dz=0.01)
+        with pytest.raises(ValueError):
+            problem.solve(solver)
+    finally:
+        del SOLVER_BACKENDS["Recording"]
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from compas.datastructures import Mesh
+from compas.geometry import area_polygon
+from compas.geometry import centroid_polygon
+from compas_dem.models import BlockModel
+from compas_dem.models.blockmodel import pattern_blocks
+from compas_dem.models.blockmodel import pattern_idos
+from compas_dem.models.blockmodel import pattern_interfaces_numpy
+from compas_dem.models.blockmodel import project_mesh_to_target
+from compas_dem.templates import StackTemplate
+
+
+def test_support_reactions():
+    model = BlockModel.from_template(StackTemplate(n=3))
+    support = next(model.supports()).graphnode
+
+    # LMGC90 style results: all force at one corner of the bed joint of the support
+    for edge in model.graph.edges():
+        if support in edge:
+            model.graph.edge_attribute(edge, "contact_point", [[1.0, 1.0, 0.5], [0.0, 0.0, 0.5]])
+            model.graph.edge_attribute(edge, "force_vector", [[0.0, 0.0, -8.0], [0.0, 0.0, 0.0]])
+        else:
+            model.graph.edge_attribute(edge, "contact_point", [[0.5, 0.5, 1.0]])
+            model.graph.edge_attribute(edge, "force_vector", [[0.0, 0.0, 4.0]])
+
+    nodes, forces, moments, points = model.support_reactions()
+
+    assert nodes == [support]
+    assert np.allclose(forces, [[0.0, 0.0, 8.0]])
+    assert np.allclose(moments, [[4.0, -4.0, 0.0]])
+    assert np.allclose(points, [[1.0, 1.0, 0.25]])
+
+
+def test_pattern_interfaces():
+    rng = np.random.default_rng(1)
+    for thickness in [lambda x, y: 0.2 + 0.05 * x, lambda x, y: 0.2 + 0.3 * rng.random()]:
+        pattern = Mesh.from_meshgrid(dx=3.0, nx=3)
+        for vertex in pattern.vertices():
+            x, y, _ = pattern.vertex_coordinates(vertex)
+            pattern.vertex_attribute(vertex, "thickness", thickness(x, y))
+        idos = pattern_idos(pattern)
+
+        model = BlockModel()
+        face_node = {face: model.add_block_from_mesh(block) for face, block in pattern_blocks(pattern, idos).items()}
+        model.compute_contacts(minimum_area=1e-6)
+
+        pairs, polygons = pattern_interfaces_numpy(pattern, idos)
+        assert len(pairs) == model.graph.number_of_edges() == 12
+        for (face, nbr), polygon in zip(pairs.tolist(), polygons):
+            u, v = face_node[face], face_node[nbr]
+            (contact,) = model.graph.edge_attribute((u, v) if model.graph.has_edge((u, v)) else (v, u), "contacts")
+            assert len(polygon) == len(contact.points)
+            assert area_polygon(polygon.tolist()) == pytest.approx(area_polygon(contact.points))
+            assert np.allclose(centroid_polygon(polygon.tolist()), centroid_polygon(contact.points))
+
+
+def test_project_mesh_to_target():
+    square = [[0, 0], [1, 0], [1, 1], [0, 1]]
+    target = Mesh.from_vertices_and_faces([[x, y, z] for z in (0.0, 2.0) for x, y in square], [[0, 1, 2, 3], [4, 5, 6, 7]])
+
+    # the first face is inside the layers, the second one outside of them
+    inside = [[0.4, 0.4], [0.6, 0.4], [0.6, 0.6], [0.4, 0.6]]
+    outside = [[x + 5.0, y] for x, y in inside]
+    for z, flip, expected in [(3.0, True, 2.0), (1.0, False, 2.0), (3.0, False, 2.0), (-1.0, False, 0.0)]:
+        faces = [[0, 1, 2, 3], [4, 5, 6, 7]]
+        if flip:
+            faces = [face[::-1] for face in faces]
+        mesh = Mesh.from_vertices_and_faces([[x, y, z] for x, y in inside + outside], faces)
+
+        distances = project_mesh_to_target(mesh, target)
+
+        normal = -1.0 if flip else 1.0
+        assert np.allclose(distances[:4], (expected - z) * normal)
+        assert np.isnan(distances[4:]).all()
+        assert np.allclose(mesh.vertices_attribute("z", keys=list(mesh.vertices())[:4]), expected)
+        assert np.allclose(mesh.vertices_attribute("z", keys=list(mesh.vertices())[4:]), z)
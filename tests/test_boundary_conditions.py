@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+import compas
+from compas.geometry import Polygon
+from compas_dem.problem import BoundaryConditions
+from compas_dem.problem import SampledField
+
+
+def test_dof_table():
+    bc = BoundaryConditions()
+    bc.add_support(3)
+    bc.add_displacement(5, dz=-0.01)
+    bc.add_rotation(5, [0.0, 0.1, None])
+
+    nodes, mask, values = bc.dof_table()
+    assert nodes.tolist() == [3, 5]
+    assert mask.tolist() == [[True] * 6, [False, False, True, True, True, False]]
+    assert np.allclose(values, [[0.0] * 6, [0.0, 0.0, -0.01, 0.0, 0.1, 0.0]])
+    assert bc.fixed_blocks().tolist() == [3]
+    assert bc.dof_table() is bc.dof_table()
+
+    bc.add_displacement(3, dx=0.02)
+    nodes, mask, values = bc.dof_table()
+    assert values[0, 0] == 0.02
+    assert bc.fixed_blocks().tolist() == []
+
+    other = BoundaryConditions.__from_data__(bc.__data__)
+    assert all(np.array_equal(a, b) for a, b in zip(other.dof_table(), bc.dof_table()))
+
+    bc.displacements.clear()
+    bc.displacements[0]["translation"][0] = 1.0
+    assert bc.dof_table()[0].tolist() == [3, 5]
+    assert bc.dof_table()[2][0, 0] == 0.02
+
+
+def test_resolve_loads_numpy():
+    bc = BoundaryConditions(gravity=True)
+    bc.add_global_body_force(1.0, 0.0, 0.0)
+    bc.add_point_load(0, [0, 0, -10], point=[1, 0, 0])
+    bc.add_point_loads([1, 1], [[5, 0, 0], [0, 5, 0]], moments=[[0, 0, 1], [0, 0, 2]], loading_type="instantaneous")
+
+    polygons = [
+        Polygon([[0, 0, 1], [2, 0, 1], [2, 1, 1], [0, 1, 1]]),
+        Polygon([[0, 0, 0], [3, 0, 0], [0, 2, 0], [1, 1, 0], [0, 1, 0]]),
+    ]
+    bc.add_surface_load(0, polygons[0], 100.0)
+    bc.add_surface_loads([1], [polygons[1].points], [50.0], directions=[[0, 0, -1]])
+
+    centroids = np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+    forces, moments, ramp = bc.resolve_loads_numpy([0, 1], centroids, [2.0, 3.0])
+
+    expected_forces = np.array([[2.0, 0.0, -19.62 - 10.0], [3.0 + 5.0, 5.0, -29.43]])
+    expected_moments = np.array([np.cross([1, 0, 0], [0, 0, -10]), [0.0, 0.0, 3.0]])
+    for row, (polygon, magnitude, direction) in enumerate(zip(polygons, [100.0, 50.0], [None, [0, 0, -1]])):
+        force = np.array(direction if direction else polygon.normal) * magnitude * polygon.area
+        expected_forces[row] += force
+        expected_moments[row] += np.cross(np.array(polygon.centroid) - centroids[row], force)
+
+    assert np.allclose(forces, expected_forces)
+    assert np.allclose(moments, expected_moments)
+    assert ramp.tolist() == [True, False]
+
+    other = BoundaryConditions.__from_data__(bc.__data__)
+    assert other.point_loads[0]["moment"] is None
+    assert all(np.allclose(a, b, equal_nan=True) for a, b in zip(other.surface_load_table(), bc.surface_load_table()))
+
+
+def test_body_force_fields():
+    profile = SampledField([[0, 0, 0], [2, 0, 0]], z=[0, 10])
+    assert np.allclose(profile([[0, 0, -1], [5, 5, 5], [0, 0, 20]]), [[0, 0, 0], [1, 0, 0], [2, 0, 0]])
+
+    grid = SampledField([[[0, 0, 0], [0, 1, 0]], [[0, 2, 0], [0, 3, 0]]], x=[0, 1], y=[0, 2])
+    assert np.allclose(grid([[0.5, 1, 7]]), [[0, 1.5, 0]])
+
+    bc = BoundaryConditions(gravity=True)
+    bc.add_body_force_field(profile)
+    bc.add_body_force_field(lambda points: np.array([0.0, 1.0, 0.0]))
+
+    centroids = np.array([[0.0, 0.0, 2.5], [0.0, 0.0, 7.5]])
+    forces, moments, _ = bc.resolve_loads_numpy([0, 1], centroids, [2.0, 4.0])
+    assert np.allclose(forces, [[1.0, 2.0, -19.62], [6.0, 4.0, -39.24]])
+    assert np.allclose(moments, 0.0)
+
+    with pytest.raises(TypeError, match="body force field"):
+        compas.json_dumps(bc)
+
+    bc.body_force_fields.pop()
+    other = compas.json_loads(compas.json_dumps(bc))
+    assert np.allclose(other.resolve_loads_numpy([0, 1], centroids, [2.0, 4.0])[0][:, 0], [1.0, 6.0])
@@ -0,0 +1,83 @@
+import asyncio
+import importlib
+
+import pytest
+
+from compas_dem.analysis.executor import LMGC90Executor
+from compas_dem.material import Stone
+from compas_dem.models import BlockModel
+from compas_dem.problem import Problem
+from compas_dem.problem import Solver
+from compas_dem.templates import StackTemplate
+
+
+@pytest.fixture
+def dummy_solvers(monkeypatch, request):
+    # the spawned workers import the solve function by name, from the same sys.path
+    monkeypatch.syspath_prepend(str(request.path.parent))
+    return importlib.import_module("dummy_solvers")
+
+
+def stack_problem():
+    model = BlockModel.from_template(StackTemplate(n=3))
+    stone = Stone(fc=30e6, density=2400)
+    model.add_material(stone)
+    model.assign_material(stone, elements=list(model.elements()))
+    problem = Problem(model)
+    problem.add_supports([block.graphnode for block in model.elements()][:1])
+    return problem
+
+
+def test_executor(dummy_solvers):
+    problems = [stack_problem() for _ in range(5)]
+    problems[4].add_body_force_field(lambda points: [[1.0, 0.0, 0.0]] * len(points))
+    modes = ["done", "sleep", "error", "memory", "done"]
+
+    executor = LMGC90Executor(max_workers=2, timeout=3.0, memory_limit=2**31, solve=dummy_solvers.solve)
+    jobs = executor.run(problems, parameters=[{"mode": mode} for mode in modes])
+
+    assert [job["status"] for job in jobs] == ["done", "timeout", "error", "memory", "error"]
+    assert jobs[0]["error"] is None
+    assert "The dummy solve failed." in jobs[2]["error"]
+
+    model = problems[0].model
+    for node in model.graph.nodes():
+        assert model.graph.node_attribute(node, "transformation").translation_vector[2] == pytest.approx(0.1 * node)
+    for edge in model.graph.edges():
+        assert model.graph.edge_attribute(edge, "force") == [0.0, 0.0, 1.0]
+    assert problems[0]._blocks[0].is_support
+    assert problems[2].model.graph.node_attribute(0, "transformation") is None
+
+
+def test_solve_async(dummy_solvers):
+    problem = stack_problem()
+    problem.add_contact_model("MohrCoulomb", mu=0.6, c=0)
+    solver = Solver()
+    solver.name = "Dummy"
+    solver.parameters = {"n_steps": 3}
+
+    async def follow(future):
+        records = [record async for record in future.updates()]
+        return records, await asyncio.wrap_future(future)
+
+    future = problem.solve_async(solver)
+    records, result = asyncio.run(follow(future))
+    steps = [record for record in records if record["name"] == "dummy.step"]
+    assert [record["step"] for record in steps] == [0, 1, 2]
+    assert steps[-1]["urf"] == pytest.approx(1 / 3) and steps[-1]["interactions"] == 2
+    assert all(record["elapsed"] >= 0 for record in steps)
+    assert result is problem
+    assert problem.model.graph.node_attribute(1, "transformation").translation_vector[2] == pytest.approx(0.1)
+
+    solver.parameters = {"n_steps": 1000, "delay": 0.1}
+    future = problem.solve_async(solver)
+    assert future.cancel() and future.cancelled()
+    future._process.join(5)
+    future._thread.join(5)
+    assert future._process.exitcode is not None and future._process.exitcode < 0
+
+    solver.name = "Unknown"
+    future = problem.solve_async(solver)
+    with pytest.raises(RuntimeError, match="not recognised"):
+        future.result(timeout=30)
+    future._thread.join(5)
@@ -0,0 +1,66 @@
+import json
+
+from compas_dem.instrumentation import MemoryProfiler
+from compas_dem.instrumentation import NullTracer
+from compas_dem.instrumentation import Tracer
+from compas_dem.instrumentation import current_tracer
+from compas_dem.models import BlockModel
+from compas_dem.templates import ArchTemplate
+
+
+def test_tracer_activation():
+    assert isinstance(current_tracer(), NullTracer)
+
+    tracer = Tracer()
+    with tracer:
+        assert current_tracer() is tracer
+        with Tracer() as inner:
+            assert current_tracer() is inner
+        assert current_tracer() is tracer
+
+    assert isinstance(current_tracer(), NullTracer)
+
+
+def test_tracer_records(tmp_path):
+    records = []
+    tracer = Tracer(callbacks=[records.append])
+
+    with tracer:
+        model = BlockModel.from_template(ArchTemplate(rise=3, span=10, thickness=0.5, depth=0.5, n=20))
+        with tracer.span("outer"):
+            model.compute_contacts()
+
+    assert tracer.counters["blocks"] == 20
+    assert tracer.counters["contacts"] == 2 * 19
+    assert [span["name"] for span in tracer.spans] == ["model.from_template", "model.compute_contacts", "outer"]
+    assert tracer.spans[1]["parent"] == "outer"
+    assert records == tracer.events
+
+    filepath = tmp_path / "trace.json"
+    tracer.dump(str(filepath))
+    trace = json.loads(filepath.read_text())
+    assert [event["name"] for event in trace["traceEvents"] if event["ph"] == "X"] == ["model.from_template", "model.compute_contacts", "outer"]
+
+
+def test_memory_profiler(tmp_path):
+    tracer = Tracer()
+
+    with tracer, MemoryProfiler(tracer) as profiler:
+        with tracer.span("outer"):
+            model = BlockModel.from_template(ArchTemplate(rise=3, span=10, thickness=0.5, depth=0.5, n=20))
+
+    assert [stage["name"] for stage in profiler.stages] == ["model.from_template", "outer"]
+    assert profiler not in tracer.callbacks
+
+    inner, outer = profiler.stages
+    assert inner["objects"]["FrictionContact"]["end"] - inner["objects"]["FrictionContact"]["start"] == 19
+    assert inner["objects"]["Mesh"]["end"] - inner["objects"]["Mesh"]["start"] >= 20
+    assert outer["traced"]["peak"] >= inner["traced"]["peak"] > inner["traced"]["start"]
+    assert inner["allocations"]
+
+    filepath = tmp_path / "memory.json"
+    profiler.dump(str(filepath))
+    report = json.loads(filepath.read_text())
+    assert report["counters"]["blocks"] == 20
+    assert len(report["stages"]) == 2
+    assert model.graph.number_of_edges() == 19
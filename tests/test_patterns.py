@@ -0,0 +1,23 @@
+import pathlib
+
+import compas
+import pytest
+
+from compas.geometry import Vector
+from compas_dem.models import BlockModel
+
+
+@pytest.fixture(scope="module")
+def dualmodel():
+    mesh = compas.json_load(pathlib.Path(__file__).parent.parent / "data" / "ThrustDiagram.json")
+    return BlockModel.from_triangulation_dual(mesh, lengthfactor=1.0)
+
+
+def test_pattern_contacts_orientation(dualmodel):
+    assert dualmodel.graph.number_of_edges() > 0
+
+    for u, v in dualmodel.graph.edges():
+        contact = dualmodel.graph.edge_attribute((u, v), "contacts")[0]
+        direction = Vector.from_start_end(dualmodel.graph.node_element(u).point, dualmodel.graph.node_element(v).point)
+        assert contact.frame.zaxis.dot(direction) > 0
+        assert contact.size > 0
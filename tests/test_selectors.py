@@ -0,0 +1,55 @@
+import pytest
+
+from compas_dem.material import Stone
+from compas_dem.models import BlockModel
+from compas_dem.problem import BlockQuery
+from compas_dem.problem import Course
+from compas_dem.problem import Degree
+from compas_dem.problem import HalfSpace
+from compas_dem.problem import InBox
+from compas_dem.problem import NearPlane
+from compas_dem.problem import Problem
+from compas_dem.templates import StackTemplate
+
+
+def test_selectors():
+    model = BlockModel.from_template(StackTemplate(n=5, width=1.0, depth=1.0, height=1.0, shift=0.2))
+    query = BlockQuery.from_model(model)
+    nodes = query.nodes.tolist()
+
+    assert query.select(Degree(maximum=1)).tolist() == [nodes[0], nodes[-1]]
+    assert query.select(Course(-1)).tolist() == [nodes[-1]]
+    assert query.select(Course([0, 1])).tolist() == nodes[:2]
+    assert query.select(HalfSpace([0, 0, 3], [0, 0, 1])).tolist() == nodes[3:]
+    assert query.select(NearPlane([0, 0, 2], [0, 0, 1], 0.5, mode="overlap")).tolist() == nodes[1:3]
+    assert query.select(InBox([-1, -1, -1], [2, 2, 2.5])).tolist() == nodes[:3]
+    assert query.select(InBox([-1, -1, -1], [2, 2, 2.5], mode="inside")).tolist() == nodes[:2]
+    assert query.select(InBox([0.5, -1, -1], [2, 2, 10], mode="overlap") & ~Course(0)).tolist() == nodes[1:]
+    assert query.select(Course(0) | Course(4)).tolist() == [nodes[0], nodes[-1]]
+
+
+def test_course_out_of_range():
+    model = BlockModel.from_template(StackTemplate(n=3))
+    query = BlockQuery.from_model(model)
+    nodes = query.nodes.tolist()
+
+    assert query.select(Course(-3)).tolist() == [nodes[0]]
+    with pytest.raises(IndexError):
+        query.select(Course(3))
+    with pytest.raises(IndexError):
+        query.select(Course([0, 5]))
+    with pytest.raises(IndexError):
+        query.select(Course(-4))
+
+
+def test_problem_select_after_changes():
+    model = BlockModel.from_template(StackTemplate(n=3))
+    stone = Stone(fc=30e6, density=2400)
+    model.add_material(stone)
+    model.assign_material(stone, elements=list(model.elements()))
+    problem = Problem(model)
+    nodes = [block.graphnode for block in model.elements()]
+
+    assert problem.select(Degree(maximum=1)).tolist() == [nodes[0], nodes[2]]
+    model.graph.delete_edge((nodes[1], nodes[2]) if model.graph.has_edge((nodes[1], nodes[2])) else (nodes[2], nodes[1]))
+    assert problem.select(Degree(maximum=0)).tolist() == [nodes[2]]
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from compas.geometry import Vector
+from compas.geometry import centroid_polyhedron
+from compas_dem.elements import Block
+from compas_dem.models import BlockModel
+from compas_dem.templates import ArchTemplate
+from compas_dem.templates import BarrelVaultTemplate
+from compas_dem.templates import DomeTemplate
+from compas_dem.templates import StackTemplate
+from compas_dem.templates import WallTemplate
+from compas_dem.templates import arch_sweep
+from compas_dem.templates import synthetic_template
+
+
+def computed_contacts(template):
+    model = BlockModel()
+    for mesh in template.blocks():
+        model.add_element(Block.from_mesh(mesh))
+    model.compute_contacts(tolerance=1e-6, minimum_area=1e-6)
+    return model
+
+
+def edge_contact(model, u, v):
+    if model.graph.has_edge((u, v)):
+        return model.graph.edge_attribute((u, v), "contacts")[0], 1
+    return model.graph.edge_attribute((v, u), "contacts")[0], -1
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        ArchTemplate(rise=3, span=10, thickness=0.5, depth=0.5, n=20),
+        BarrelVaultTemplate(),
+        BarrelVaultTemplate(vou_span=6, vou_length=3),
+        DomeTemplate(meridians=12, hoops=6),
+        StackTemplate(n=5, shift=0.2),
+        WallTemplate(courses=6, bricks=5, openings=[[0.3, 0.8, 0.1, 0.3]]),
+        WallTemplate(courses=6, bricks=5, bond="english", openings=[[0.3, 0.8, 0.1, 0.3]]),
+    ],
+)
+def test_template_interfaces_match_computed_contacts(template):
+    model = BlockModel.from_template(template)
+    reference = computed_contacts(template)
+
+    # the generic search does not find the non-coplanar bed joints of the dome
+    if isinstance(template, DomeTemplate):
+        assert model.graph.number_of_edges() == reference.graph.number_of_edges() + template.meridians * (template.hoops - 1) * 2
+    else:
+        assert model.graph.number_of_edges() == reference.graph.number_of_edges()
+
+    for u, v in reference.graph.edges():
+        expected = reference.graph.edge_attribute((u, v), "contacts")[0]
+        contact, sign = edge_contact(model, u, v)
+
+        assert contact.size == pytest.approx(expected.size)
+        assert list(contact.frame.point) == pytest.approx(list(expected.frame.point))
+        assert list(contact.frame.zaxis.scaled(sign)) == pytest.approx(list(expected.frame.zaxis))
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        ArchTemplate(rise=3, span=10, thickness=0.5, depth=0.5, n=20),
+        BarrelVaultTemplate(),
+        DomeTemplate(meridians=12, hoops=6),
+        WallTemplate(courses=4, bricks=4, bond="english"),
+    ],
+)
+def test_template_interfaces_orientation(template):
+    model = BlockModel.from_template(template)
+
+    for u, v in model.graph.edges():
+        contact = model.graph.edge_attribute((u, v), "contacts")[0]
+        direction = Vector.from_start_end(model.graph.node_element(u).point, model.graph.node_element(v).point)
+        assert contact.frame.zaxis.dot(direction) > 0
+
+
+@pytest.mark.parametrize("kind", ["stack", "wall", "arch", "vault"])
+@pytest.mark.parametrize("n", [1, 2, 7, 100])
+def test_synthetic_template_counts(kind, n):
+    template, blocks, interfaces = synthetic_template(kind, n)
+    vertices, _, _ = template.blocks_numpy()
+    pairs, _ = template.interfaces_numpy()
+
+    assert len(vertices) == blocks
+    assert len(pairs) == interfaces
+
+
+def test_arch_sweep():
+    sweeps = arch_sweep(rise=[2, 3], span=10, thickness=[0.3, 0.5], depth=0.5, n=[6, 9])
+    assert sorted(sweeps) == [6, 9]
+
+    for n, sweep in sweeps.items():
+        assert sweep.vertices.shape == (4, n, 8, 3)
+        assert sweep.supports.tolist() == [True] + [False] * (n - 2) + [True]
+        volumes, centroids = sweep.mass_properties()
+
+        for k, template in enumerate(sweep.templates):
+            for i, block in enumerate(template.blocks()):
+                assert np.allclose(sweep.vertices[k, i], block.vertices_attributes("xyz"))
+                assert sweep.faces.tolist() == [block.face_vertices(face) for face in block.faces()]
+                # the volume centroid, which is not the surface centroid of Mesh.centroid
+                assert volumes[k, i] == pytest.approx(block.volume())
+                assert np.allclose(centroids[k, i], centroid_polyhedron(block.to_vertices_and_faces()))